@@ -0,0 +1,40 @@
+"""
+Benchmark del índice de búsqueda de reclamos (utils/claim_search.py)
+Uso: python -m benchmarks.claim_search [cantidad]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from utils.claim_search import ClaimSearchIndex
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = np.random.default_rng(0)
+    frases = ["fibra cortada en poste", "sin señal desde ayer", "cable caído sobre la vereda",
+              "conector dañado", "cliente solicita cambio de domicilio", "baja señal en televisor",
+              "router sin luz", "poste caído por tormenta", "fibra dañada por obra municipal"]
+    calles = ["San Martín", "Belgrano", "Rivadavia", "Mitre", "Sarmiento", "Güemes"]
+    df = pd.DataFrame({
+        "Detalles": [f"{rng.choice(frases)} {rng.choice(frases)}" for _ in range(cantidad)],
+        "Tipo de reclamo": rng.choice(["Reclamo", "Sintonia", "Traslado", "Conexion"], cantidad),
+        "Dirección": [f"{rng.choice(calles)} {rng.integers(1, 3000)}" for _ in range(cantidad)],
+    })
+
+    indice = ClaimSearchIndex()
+    inicio = time.perf_counter()
+    indice.sincronizar(df, "v1")
+    print(f"índice de {cantidad} reclamos en {time.perf_counter() - inicio:.2f} s")
+
+    df.loc[len(df)] = ["fibra cortada por camión", "Reclamo", "Mitre 10"]
+    df.loc[5, "Detalles"] = "router quemado"
+    inicio = time.perf_counter()
+    reindexadas = indice.sincronizar(df, "v2")
+    print(f"sincronización incremental: {reindexadas} filas en {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    for consulta in ["fibra cortada", "router", "poste caido", "senal telev", "sarmiento fibra"]:
+        inicio = time.perf_counter()
+        for _ in range(20):
+            resultados = indice.buscar(consulta, limite=50)
+        duracion = (time.perf_counter() - inicio) / 20 * 1000
+        print(f"{consulta!r}: {len(resultados)} resultados en {duracion:.2f} ms")
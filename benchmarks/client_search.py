@@ -0,0 +1,33 @@
+"""
+Benchmark del índice de búsqueda de clientes (utils/client_search.py)
+Uso: python -m benchmarks.client_search [cantidad]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from utils.client_search import ClientSearchIndex
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = np.random.default_rng(0)
+    apellidos = ["González", "Rodríguez", "Fernández", "López", "Martínez", "Pérez", "Gómez", "Díaz",
+                 "Sánchez", "Romero", "Sosa", "Álvarez", "Torres", "Ruiz", "Ramírez", "Benítez"]
+    nombres = ["Juan", "María", "José", "Ana", "Luis", "Carla", "Néstor", "Lucía", "Raúl", "Sofía"]
+    calles = ["San Martín", "Belgrano", "Rivadavia", "Mitre", "Sarmiento", "Güemes", "Córdoba", "Junín"]
+    df = pd.DataFrame({
+        "Nº Cliente": [str(1000 + i) for i in range(cantidad)],
+        "Nombre": [f"{rng.choice(apellidos)} {rng.choice(nombres)} {i}" for i in range(cantidad)],
+        "Dirección": [f"{rng.choice(calles)} {rng.integers(1, 3000)}" for _ in range(cantidad)],
+    })
+
+    inicio = time.perf_counter()
+    indice = ClientSearchIndex(df)
+    print(f"índice de {cantidad} clientes en {time.perf_counter() - inicio:.2f} s")
+
+    for consulta in ["1234", "gonzalez", "gonzales juan", "sarmiento 12", "guemes", "rodriges", "maría pérez"]:
+        inicio = time.perf_counter()
+        for _ in range(20):
+            filas = indice.buscar(consulta)
+        duracion = (time.perf_counter() - inicio) / 20 * 1000
+        print(f"{consulta!r}: {len(filas)} resultados en {duracion:.2f} ms")
@@ -0,0 +1,36 @@
+"""
+Benchmark del detector de clientes duplicados (utils/duplicate_clients.py)
+Uso: python -m benchmarks.duplicate_clients [cantidad]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from utils.duplicate_clients import DuplicateClientDetector
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = np.random.default_rng(0)
+    apellidos = ["González", "Rodríguez", "Fernández", "López", "Martínez", "Pérez", "Gómez", "Díaz"]
+    nombres = ["Juan", "María", "José", "Ana", "Luis", "Carla", "Néstor", "Lucía"]
+    calles = ["AV. SAN MARTÍN", "BELGRANO", "CALLE RIVADAVIA", "MITRE", "BV. SARMIENTO", "GÜEMES"]
+    df = pd.DataFrame({
+        "Nº Cliente": [str(1000 + i) for i in range(cantidad)],
+        "Nombre": [f"{rng.choice(apellidos)} {rng.choice(nombres)}" for _ in range(cantidad)],
+        "Dirección": [f"{rng.choice(calles)} {rng.integers(1, 20000)}" for _ in range(cantidad)],
+        "Teléfono": [f"351{rng.integers(1000000, 9999999)}" for _ in range(cantidad)],
+    })
+
+    inicio = time.perf_counter()
+    detector = DuplicateClientDetector(df)
+    print(f"índice de bloqueo de {cantidad} clientes en {time.perf_counter() - inicio:.2f} s")
+
+    inicio = time.perf_counter()
+    reporte = detector.reporte()
+    print(f"reporte: {len(reporte)} pares en {time.perf_counter() - inicio:.2f} s")
+
+    cliente = df.iloc[10]
+    inicio = time.perf_counter()
+    parecidos = detector.candidatos(cliente["Nombre"], cliente["Dirección"].replace("AV. ", ""),
+                                    "15" + cliente["Teléfono"][3:])
+    print(f"alta interactiva: {len(parecidos)} candidatos en {(time.perf_counter() - inicio) * 1000:.2f} ms")
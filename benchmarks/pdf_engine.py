@@ -0,0 +1,33 @@
+"""
+Benchmark del motor de PDFs (utils/pdf_engine.py)
+Uso: python -m benchmarks.pdf_engine [cantidad]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from utils.pdf_engine import LAYOUTS_PDF, escribir_pdf, generar_pdf
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    filas = [
+        (str(1000 + i), f"Cliente de prueba {i}", "01/06/2024 10:30:00", f"Calle {i} 123",
+         "3794000000", str(i % 10 + 1), f"P-{i}", "Sin Señal Internet",
+         "Detalle largo del reclamo " * (i % 8 + 1), "JUAN, MAXI")
+        for i in range(cantidad)
+    ]
+
+    for layout in LAYOUTS_PDF:
+        inicio = time.perf_counter()
+        contenido = generar_pdf(filas, "BENCHMARK", layout)
+        duracion = time.perf_counter() - inicio
+
+        # Segunda pasada solo para medir memoria (tracemalloc distorsiona el tiempo), escribiendo
+        # a un archivo: el pico es la memoria de trabajo del motor, sin el documento
+        tracemalloc.start()
+        with open(os.devnull, "wb") as destino:
+            escribir_pdf(filas, destino, "BENCHMARK", layout)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{layout}: {cantidad} reclamos en {duracion:.2f} s, "
+              f"{len(contenido) / 1024:.0f} KB, memoria de trabajo {pico / 1024:.0f} KB")
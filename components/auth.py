@@ -1,16 +1,28 @@
 """
-Componente de autenticación simplificado
-Versión sin hashing para proyectos pequeños
+Componente de autenticación
+Contraseñas con hash (ver utils/passwords.py); las que siguen en texto plano se
+migran al hash en el primer login exitoso
 """
+import logging
+import secrets
+import threading
 import streamlit as st
-from utils.data_manager import safe_get_sheet_data
-from config.settings import (
-    WORKSHEET_USUARIOS,
-    COLUMNAS_USUARIOS,
-    PERMISOS_POR_ROL
+from utils.api_manager import api_manager
+from utils.data_manager import batch_update_sheet, letra_columna
+from utils.passwords import verificar_password, hashear_password
+from utils.sheets import init_google_sheets
+from utils.session_tracker import sesion_vencida, cerrar_sesion_inactiva
+from utils.user_directory import (
+    buscar_usuario, invalidar_directorio, huella_password, obtener_cache_sesiones, normalizar_usuario
 )
+from config.settings import COLUMNAS_USUARIOS
 import time
 
+logger = logging.getLogger(__name__)
+
+# Una ráfaga de logins no calcula más de dos hashes a la vez (scrypt usa ~16 MB cada uno)
+_hashes_simultaneos = threading.BoundedSemaphore(2)
+
 def init_auth_session():
     """Inicializa las variables de sesión"""
     if 'auth' not in st.session_state:
@@ -21,33 +33,52 @@ def init_auth_session():
 
 def logout():
     """Cierra la sesión del usuario"""
+    auth = st.session_state.get('auth') or {}
+    if auth.get('user_info') and auth.get('token'):
+        obtener_cache_sesiones().quitar(auth['user_info']['username'], auth['token'])
     st.session_state.auth = {'logged_in': False, 'user_info': None}
     st.cache_data.clear()  # Limpiar caché de datos
 
+def _migrar_password(sheet_usuarios, usuario, password):
+    """Reemplaza la contraseña guardada por su hash; devuelve el valor nuevo o None"""
+    # La fila viene del directorio en caché: se confirma que siga siendo la del usuario
+    actual, error = api_manager.safe_sheet_operation(sheet_usuarios.row_values, usuario['fila'])
+    actual = dict(zip(COLUMNAS_USUARIOS, (actual or []) + [""] * len(COLUMNAS_USUARIOS)))
+    if error or normalizar_usuario(actual["username"]) != usuario["username"] \
+            or actual["password"].strip() != usuario["password"]:
+        logger.warning("Migración de %s omitida: la hoja cambió desde la última lectura", usuario['username'])
+        invalidar_directorio()
+        return None
+
+    nuevo = hashear_password(password)
+    rango = f"{letra_columna(COLUMNAS_USUARIOS, 'password')}{usuario['fila']}"
+    success, error = batch_update_sheet(sheet_usuarios, [{"range": rango, "values": [[nuevo]]}])
+    if not success:
+        logger.warning("No se pudo migrar la contraseña de %s: %s", usuario['username'], error)
+        return None
+    invalidar_directorio()
+    return nuevo
+
 def verify_credentials(username, password, sheet_usuarios):
     try:
-        df_usuarios = safe_get_sheet_data(sheet_usuarios, COLUMNAS_USUARIOS)
-        
-        # Normalización de datos
-        df_usuarios["username"] = df_usuarios["username"].str.strip().str.lower()
-        df_usuarios["password"] = df_usuarios["password"].astype(str).str.strip()
-        
-        # Manejo flexible de campo 'activo'
-        df_usuarios["activo"] = df_usuarios["activo"].astype(str).str.upper().isin(["SI", "TRUE", "1", "SÍ", "VERDADERO"])
-        
-        usuario = df_usuarios[
-            (df_usuarios["username"] == username.strip().lower()) & 
-            (df_usuarios["password"] == password.strip()) &
-            (df_usuarios["activo"])
-        ]
-        
-        if not usuario.empty:
-            return {
-                "username": usuario.iloc[0]["username"],
-                "nombre": usuario.iloc[0]["nombre"],
-                "rol": usuario.iloc[0]["rol"].lower(),
-                "permisos": PERMISOS_POR_ROL.get(usuario.iloc[0]["rol"].lower(), {}).get('permisos', [])
-            }
+        usuario = buscar_usuario(sheet_usuarios, username)
+
+        if usuario and usuario["activo"]:
+            # Verificación sincrónica: el script espera el hash (lento a propósito) en su propio hilo
+            with _hashes_simultaneos:
+                valida, requiere_rehash = verificar_password(password.strip(), usuario["password"])
+
+            if valida:
+                almacenado = usuario["password"]
+                if requiere_rehash:
+                    almacenado = _migrar_password(sheet_usuarios, usuario, password.strip()) or almacenado
+                return {
+                    "username": usuario["username"],
+                    "nombre": usuario["nombre"],
+                    "rol": usuario["rol"],
+                    "permisos": usuario["permisos"],
+                    "huella": huella_password(almacenado)
+                }
     except Exception as e:
         st.error(f"Error en autenticación: {str(e)}")
     return None
@@ -70,21 +101,68 @@ def render_login(sheet_usuarios):
             else:
                 user_info = verify_credentials(username, password, sheet_usuarios)
                 if user_info:
+                    token = secrets.token_urlsafe(16)
                     st.session_state.auth = {
                         'logged_in': True,
-                        'user_info': user_info
+                        'user_info': user_info,
+                        'token': token
                     }
+                    obtener_cache_sesiones().registrar(user_info['username'], token)
                     st.success(f"✅ Bienvenido, {user_info['nombre']}!")
                     time.sleep(1)
                     st.rerun()
                 else:
                     st.error("Credenciales incorrectas o usuario inactivo")
 
+def _sesion_vigente(auth):
+    """
+    Confirma que el usuario siga activo y con la misma contraseña
+
+    Usa la caché de sesiones verificadas; al vencer se revalida contra el
+    directorio (búsqueda en memoria, sin recalcular el hash)
+    """
+    user_info, token = auth.get('user_info') or {}, auth.get('token')
+    username = user_info.get('username')
+    if not username or not token:
+        return False
+
+    cache = obtener_cache_sesiones()
+    if cache.vigente(username, token):
+        return True
+
+    _, _, sheet_usuarios = init_google_sheets()
+    try:
+        usuario = buscar_usuario(sheet_usuarios, username)
+    except Exception:
+        # No se pudo leer la hoja: se mantiene la sesión y se revalida en el próximo control
+        return True
+    if usuario and usuario["activo"] and huella_password(usuario["password"]) == user_info.get('huella'):
+        cache.registrar(username, token)
+        return True
+    return False
+
 def check_authentication():
     """Verifica si el usuario está autenticado"""
     init_auth_session()
+    auth = st.session_state.auth
+    if auth['logged_in'] and not _sesion_vigente(auth):
+        # Usuario dado de baja o contraseña cambiada desde el login
+        st.session_state.auth = {'logged_in': False, 'user_info': None}
     return st.session_state.auth['logged_in']
 
+def exigir_sesion():
+    """
+    Corta un fragmento si la sesión venció o ya no está autenticada
+
+    Un rerun de fragmento no pasa por los controles de app.py: se fuerza un
+    rerun completo, que muestra el login
+    """
+    if sesion_vencida():
+        cerrar_sesion_inactiva()
+        st.rerun(scope="app")
+    if not check_authentication():
+        st.rerun(scope="app")
+
 def has_permission(required_permission):
     """Verifica permisos del usuario"""
     if not check_authentication():
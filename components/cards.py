@@ -0,0 +1,47 @@
+"""
+Grillas de tarjetas HTML
+Cada panel se arma como un único bloque HTML (un solo mensaje al navegador);
+el aspecto vive en las clases CSS de utils/styles.py
+"""
+from html import escape
+import streamlit as st
+
+UMBRAL_TIPO_ALTO = 10  # más reclamos que esto se resaltan en rojo
+
+
+def grilla_metricas(metricas):
+    """
+    HTML de una fila de tarjetas de métricas
+
+    Args:
+        metricas: lista de (título, valor, color del título)
+    """
+    tarjetas = "".join(
+        f'<div class="metric-container hover-card"><h3 style="color:{color}">{escape(titulo)}</h3>'
+        f'<h1>{escape(str(valor))}</h1></div>'
+        for titulo, valor, color in metricas
+    )
+    return f'<div class="grilla-metricas">{tarjetas}</div>'
+
+
+def grilla_tipos(conteos):
+    """HTML de la grilla de cantidad de reclamos por tipo ({tipo: cantidad})"""
+    tarjetas = "".join(
+        f'<div class="tarjeta-tipo{" alta" if cantidad > UMBRAL_TIPO_ALTO else ""}">'
+        f'<h5>{escape(str(tipo))}</h5><h4>{int(cantidad)}</h4></div>'
+        for tipo, cantidad in conteos.items()
+    )
+    return f'<div class="grilla-tipos">{tarjetas}</div>'
+
+
+def tarjeta_usuario(nombre, rol, icono, fondo, texto):
+    """HTML de la tarjeta del usuario logueado"""
+    return (
+        f'<div class="tarjeta-usuario" style="background:{fondo};color:{texto}">'
+        f'<span>{icono}</span><div><h3>{escape(nombre)}</h3><p>{escape(rol.upper())}</p></div></div>'
+    )
+
+
+def render_html(html):
+    """Emite un bloque HTML ya armado"""
+    st.markdown(html, unsafe_allow_html=True)
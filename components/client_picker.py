@@ -0,0 +1,65 @@
+"""
+Selector de cliente con autocompletado
+Acepta el N° exacto como antes o parte del número, nombre o dirección;
+las sugerencias salen del índice de utils/client_search.py.
+El Nº Cliente solo es único dentro de una sucursal, así que el cliente
+elegido se devuelve como (sucursal, número)
+"""
+import streamlit as st
+from utils.client_search import obtener_indice_clientes
+from config.settings import SUCURSALES, SUCURSAL_PRINCIPAL
+
+SIN_ELEGIR = "— Elegí un cliente de la lista —"
+MAX_SUGERENCIAS = 10
+
+
+def _sucursal_de(cliente):
+    return cliente.get("Sucursal", SUCURSAL_PRINCIPAL)
+
+
+def selector_cliente(snapshot, key, etiqueta, placeholder="Número, nombre o dirección"):
+    """
+    Campo de búsqueda de cliente
+
+    Returns:
+        tuple: (sucursal, N° de cliente) del cliente elegido; ("", número tipeado) si el
+        número no existe en ninguna sucursal; ("", "") si no hay selección
+    """
+    consulta = st.text_input(etiqueta, placeholder=placeholder, key=key).strip()
+    if not consulta:
+        return "", ""
+
+    df_clientes = snapshot.df_clientes
+    if "Nº Cliente" not in df_clientes.columns:
+        return "", consulta
+
+    indice = obtener_indice_clientes(df_clientes, snapshot.version)
+    exactas = indice.posiciones(consulta)
+    if len(exactas) == 1:
+        return _sucursal_de(df_clientes.iloc[exactas[0]]), consulta
+
+    # Número repetido en varias sucursales: hay que elegir de cuál es
+    filas = exactas or indice.buscar(consulta, MAX_SUGERENCIAS)
+    if not filas:
+        if not consulta.isdigit():
+            st.info("🔎 No hay clientes que coincidan con la búsqueda.")
+        return ("", consulta) if consulta.isdigit() else ("", "")
+
+    sugerencias = df_clientes.iloc[filas]
+    opciones = {SIN_ELEGIR: ("", "")}
+    for _, cliente in sugerencias.iterrows():
+        etiqueta_cliente = f"{cliente['Nº Cliente']} · {cliente['Nombre']} · {cliente['Dirección']}"
+        if len(SUCURSALES) > 1:
+            etiqueta_cliente += f" · {_sucursal_de(cliente)}"
+        opciones[etiqueta_cliente] = (_sucursal_de(cliente), cliente["Nº Cliente"])
+
+    elegido = st.selectbox(
+        f"🏢 El N° {consulta} existe en {len(filas)} sucursales" if exactas else f"💡 {len(filas)} coincidencias",
+        list(opciones),
+        key=f"{key}_sugerencia"
+    )
+    if opciones[elegido][1]:
+        return opciones[elegido]
+    if exactas:
+        return "", ""
+    return ("", consulta) if consulta.isdigit() else ("", "")
@@ -0,0 +1,47 @@
+"""
+Componente de diagnóstico para administradores
+"""
+import streamlit as st
+from utils.startup_timing import reporte_arranque
+from utils.sheets import metadatos_hojas
+from utils.pdf_cache import obtener_cache_pdf
+from utils.user_directory import invalidar_directorio
+from utils.session_tracker import resumen_sesiones
+from config.settings import SESSION_TIMEOUT
+
+def render_tiempos_arranque():
+    """Muestra los tiempos de arranque del proceso y los metadatos de las hojas"""
+    with st.expander("⏱️ Tiempos de arranque"):
+        tiempos = reporte_arranque()
+        if not tiempos:
+            st.caption("Sin mediciones todavía.")
+        for etapa, segundos in tiempos.items():
+            st.markdown(f"- **{etapa}:** {segundos * 1000:.0f} ms")
+
+        st.caption("Hojas de la planilla")
+        for titulo, meta in metadatos_hojas().items():
+            st.markdown(f"- {titulo}: {meta['filas']} × {meta['columnas']} (id {meta['id']})")
+
+        pdfs = obtener_cache_pdf().estadisticas()
+        st.caption("Caché de PDFs")
+        st.markdown(
+            f"- {pdfs['documentos']} documentos, {pdfs['bytes'] / 1024:.0f} KB "
+            f"({pdfs['aciertos']} aciertos / {pdfs['fallos']} fallos)"
+        )
+
+        if st.button("🔄 Releer hoja de usuarios", key="releer_usuarios",
+                     help="Aplica altas, bajas o cambios de contraseña sin esperar al vencimiento de la caché"):
+            invalidar_directorio()
+            st.success("Directorio de usuarios invalidado.")
+
+
+def render_sesiones():
+    """Sesiones vivas en el servidor con su inactividad y memoria referenciada"""
+    with st.expander("🧠 Sesiones"):
+        sesiones = resumen_sesiones()
+        if sesiones.empty:
+            st.caption("Sin información de sesiones (solo disponible con streamlit run).")
+            return
+        st.metric("Sesiones", len(sesiones), help=f"Se cierran al volver a ejecutarse tras {SESSION_TIMEOUT // 60} min sin actividad")
+        st.caption(f"Memoria referenciada total: {sesiones['Memoria (KB)'].sum() / 1024:.1f} MB")
+        st.dataframe(sesiones, hide_index=True, use_container_width=True)
@@ -0,0 +1,72 @@
+"""
+Panel de trabajos en segundo plano (barra lateral)
+"""
+import streamlit as st
+from components.auth import exigir_sesion
+from utils.session_tracker import rerun_automatico
+from utils.jobs import obtener_gestor_trabajos, usuario_actual, TERMINADO, FALLIDO
+
+INTERVALO_SONDEO_SEG = 2
+
+
+def _trabajos_visibles():
+    """Trabajos del usuario más los lanzados desde esta sesión"""
+    gestor = obtener_gestor_trabajos()
+    trabajos = {t.id: t for t in gestor.de_usuario(usuario_actual())}
+    for trabajo_id in st.session_state.get("trabajos", []):
+        trabajo = gestor.obtener(trabajo_id)
+        if trabajo is not None:
+            trabajos[trabajo.id] = trabajo
+    return sorted(trabajos.values(), key=lambda t: t.creado, reverse=True)
+
+
+def _render_trabajo(trabajo):
+    st.markdown(f"**{trabajo.descripcion}** · {trabajo.estado}")
+
+    if trabajo.activo:
+        st.progress(trabajo.progreso, text=trabajo.mensaje or None)
+        return
+
+    if trabajo.estado == FALLIDO:
+        st.error(f"❌ {trabajo.error}")
+    elif trabajo.estado == TERMINADO and trabajo.resultado:
+        resultado = trabajo.resultado
+        if "archivo" in resultado:
+            st.download_button(
+                label=f"📥 {resultado['nombre']}",
+                data=resultado["archivo"],
+                file_name=resultado["nombre"],
+                mime=resultado.get("mime", "application/octet-stream"),
+                key=f"descargar_{trabajo.id}",
+                use_container_width=True
+            )
+        if "mensaje" in resultado:
+            st.success(resultado["mensaje"])
+
+    if st.button("🗑️ Quitar", key=f"quitar_{trabajo.id}"):
+        obtener_gestor_trabajos().descartar(trabajo.id)
+        st.rerun(scope="fragment")
+
+
+def render_trabajos():
+    """Muestra los trabajos en curso y los resultados listos para descargar"""
+    trabajos = _trabajos_visibles()
+    if not trabajos:
+        return
+
+    # Solo se sondea mientras haya trabajos activos
+    habia_activos = any(t.activo for t in trabajos)
+
+    @st.fragment(run_every=INTERVALO_SONDEO_SEG if habia_activos else None)
+    def panel():
+        exigir_sesion()
+        actuales = _trabajos_visibles()
+        if habia_activos and not any(t.activo for t in actuales):
+            # Terminó todo: rerun completo para dejar de sondear y mostrar los datos nuevos
+            rerun_automatico()
+
+        with st.expander("⏳ Trabajos en segundo plano", expanded=habia_activos):
+            for trabajo in actuales:
+                _render_trabajo(trabajo)
+
+    panel()
@@ -2,62 +2,51 @@
 Componente del dashboard de métricas
 """
 import streamlit as st
-import pandas as pd
+from datetime import datetime
+import pytz
+from components.cards import grilla_metricas, render_html
 
-def render_metrics_dashboard(df_reclamos):
-    """Renderiza el dashboard de métricas con animaciones"""
+def render_metrics_dashboard(stats):
+    """Renderiza el dashboard de métricas con animaciones (a partir de ClaimStats)"""
     try:
-        df_metricas = df_reclamos.copy()
-        
         # Solo reclamos activos (Pendientes o En curso)
-        df_activos = df_metricas[df_metricas["Estado"].isin(["Pendiente", "En curso"])]
-        
-        total = len(df_activos)
-        pendientes = len(df_activos[df_activos["Estado"] == "Pendiente"])
-        en_curso = len(df_activos[df_activos["Estado"] == "En curso"])
-        resueltos = len(df_metricas[df_metricas["Estado"] == "Resuelto"])
-        
-        # Métricas principales con efectos hover
-        st.markdown("""
-        <div style="display: flex; gap: 15px; margin-bottom: 20px; flex-wrap: wrap;">
-        """, unsafe_allow_html=True)
-        
-        colm1, colm2, colm3, colm4 = st.columns(4)
-        
-        with colm1:
-            st.markdown(f"""
-            <div class="metric-container hover-card">
-                <h3 style="margin: 0; color: #0d6efd;">📄 Total activos</h3>
-                <h1 style="margin: 10px 0 0 0; font-size: 2.5rem;">{total}</h1>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with colm2:
-            st.markdown(f"""
-            <div class="metric-container hover-card">
-                <h3 style="margin: 0; color: #fd7e14;">🕒 Pendientes</h3>
-                <h1 style="margin: 10px 0 0 0; font-size: 2.5rem;">{pendientes}</h1>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with colm3:
-            st.markdown(f"""
-            <div class="metric-container hover-card">
-                <h3 style="margin: 0; color: #0dcaf0;">🔧 En curso</h3>
-                <h1 style="margin: 10px 0 0 0; font-size: 2.5rem;">{en_curso}</h1>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with colm4:
-            st.markdown(f"""
-            <div class="metric-container hover-card">
-                <h3 style="margin: 0; color: #198754;">✅ Resueltos</h3>
-                <h1 style="margin: 10px 0 0 0; font-size: 2.5rem;">{resueltos}</h1>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-        
+        total = stats.total_activos
+        pendientes = stats.pendientes
+        en_curso = stats.en_curso
+        resueltos = stats.resueltos
+        
+        # Métricas principales: una sola grilla HTML
+        render_html(grilla_metricas([
+            ("📄 Total activos", total, "#0d6efd"),
+            ("🕒 Pendientes", pendientes, "#fd7e14"),
+            ("🔧 En curso", en_curso, "#0dcaf0"),
+            ("✅ Resueltos", resueltos, "#198754"),
+        ]))
+
     except Exception as e:
         st.info("No hay datos disponibles para mostrar métricas aún.")
-        st.error(f"Error en métricas: {e}")
\ No newline at end of file
+        st.error(f"Error en métricas: {e}")
+
+def render_resumen_jornada(stats):
+    """Renderiza el resumen de la jornada (footer) a partir de ClaimStats"""
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.markdown("### 📋 Resumen de la jornada")
+
+    hoy = datetime.now(pytz.timezone("America/Argentina/Buenos_Aires")).date()
+
+    col1, col2 = st.columns(2)
+    col1.metric("📌 Reclamos cargados hoy", stats.cargados_el(hoy))
+    col2.metric("⚙️ Reclamos en curso", stats.en_curso)
+
+    # Técnicos por reclamo
+    st.markdown("### 👷 Reclamos en curso por técnicos")
+
+    if stats.equipos_en_curso:
+        st.markdown("\n".join(
+            f"- 👥 **{', '.join(equipo)}** → {cantidad} reclamos"
+            for equipo, cantidad in sorted(stats.equipos_en_curso.items())
+        ))
+    else:
+        st.info("No hay técnicos asignados actualmente a reclamos en curso.")
+
+    st.markdown('</div>', unsafe_allow_html=True)
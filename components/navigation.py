@@ -1,22 +1,39 @@
 """
 Componente de navegación
+Cada sección vive en su propio módulo de sections/ y se importa recién al abrirla
 """
+import importlib
 import streamlit as st
+from components.auth import has_permission
+from config.settings import OPCIONES_PERMISOS
+
+# Opción de navegación -> (ícono, módulo de la sección)
+SECCIONES = {
+    "Inicio": ("🏠", "sections.inicio"),
+    "Reclamos cargados": ("📊", "sections.reclamos_cargados"),
+    "Historial por cliente": ("📜", "sections.historial"),
+    "Editar cliente": ("✏️", "sections.editar_cliente"),
+    "Imprimir reclamos": ("🖨️", "sections.imprimir"),
+    "Seguimiento técnico": ("👷", "sections.seguimiento"),
+    "Cierre de Reclamos": ("✅", "sections.cierre"),
+    "Analítica": ("📈", "sections.analitica"),
+}
 
 def render_navigation():
-    """Renderiza el menú de navegación mejorado"""
+    """Renderiza el menú de navegación y la sección elegida"""
     st.markdown("### 🧭 Navegación")
     
+    # Solo las secciones habilitadas para el rol del usuario
     opciones = [
-        "🏠 Inicio", 
-        "📊 Reclamos cargados", 
-        "📜 Historial por cliente", 
-        "✏️ Editar cliente", 
-        "🖨️ Imprimir reclamos", 
-        "👷 Seguimiento técnico", 
-        "✅ Cierre de Reclamos"
+        f"{icono} {nombre}"
+        for nombre, (icono, _) in SECCIONES.items()
+        if has_permission(OPCIONES_PERMISOS[nombre])
     ]
     
+    if not opciones:
+        st.warning("⚠️ Tu usuario no tiene secciones habilitadas.")
+        return None
+    
     # Crear navegación con iconos
     opcion = st.radio(
         "Selecciona una sección:",
@@ -27,6 +44,10 @@ def render_navigation():
     
     # Extraer solo el nombre sin emoji para compatibilidad
     opcion_clean = opcion.split(" ", 1)[1] if " " in opcion else opcion
+
+    # Importar el módulo de la sección a demanda (queda en caché de Python)
+    modulo = importlib.import_module(SECCIONES[opcion_clean][1])
+    modulo.render()
     
     return opcion_clean
 
@@ -0,0 +1,81 @@
+"""
+Tabla paginada y ordenada del lado del servidor
+Al navegador solo viaja la página visible; el orden por columna se calcula
+una vez por snapshot y se reutiliza con cualquier combinación de filtros
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+FILAS_POR_PAGINA = [25, 50, 100]
+DESCENDENTE, ASCENDENTE = "⬇️ Descendente", "⬆️ Ascendente"
+
+
+def _clave_orden(serie):
+    """Columna numérica si todos sus valores lo son (ej. Nº Cliente), si no la original"""
+    if serie.dtype == object or pd.api.types.is_string_dtype(serie):
+        numeros = pd.to_numeric(serie, errors="coerce")
+        if numeros.notna().sum() == serie.replace("", np.nan).notna().sum():
+            return numeros
+    return serie
+
+
+def _ordenar(df, columna, descendente):
+    """Posiciones de df ordenadas por la columna (vacíos al final)"""
+    clave = _clave_orden(df[columna]).reset_index(drop=True)
+    return clave.sort_values(ascending=not descendente, kind="stable", na_position="last").index.to_numpy()
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _orden_cacheado(_df, tabla, version, columna, descendente):
+    """Orden de una tabla por snapshot; la clave de la tabla distingue vistas de la misma versión"""
+    return _ordenar(_df, columna, descendente)
+
+
+def tabla_paginada(df, key, columnas, version=None, posiciones=None, orden_inicial=None, descendente=True):
+    """
+    Muestra una página de df con controles de orden, tamaño de página y página
+
+    Args:
+        df: vista completa (compartida por snapshot si se pasa version)
+        key: prefijo de las claves de los widgets
+        columnas: columnas visibles (y ordenables)
+        version: versión del snapshot; habilita el orden cacheado sobre df (por tabla)
+        posiciones: posiciones de df que pasan los filtros (None = todas)
+
+    Returns:
+        DataFrame: filas de la página visible
+    """
+    col_orden, col_sentido, col_tamano, col_pagina = st.columns([2, 1, 1, 1])
+    with col_orden:
+        columna = st.selectbox("Ordenar por", columnas, key=f"{key}_orden",
+                               index=columnas.index(orden_inicial) if orden_inicial in columnas else 0)
+    with col_sentido:
+        sentido = st.selectbox("Sentido", [DESCENDENTE, ASCENDENTE], key=f"{key}_sentido",
+                               index=0 if descendente else 1)
+    with col_tamano:
+        por_pagina = st.selectbox("Filas por página", FILAS_POR_PAGINA, key=f"{key}_por_pagina")
+
+    if version is not None:
+        orden = _orden_cacheado(df, key, version, columna, sentido == DESCENDENTE)
+    else:
+        orden = _ordenar(df, columna, sentido == DESCENDENTE)
+    if posiciones is not None:
+        incluidas = np.zeros(len(df), dtype=bool)
+        incluidas[posiciones] = True
+        orden = orden[incluidas[orden]]
+
+    total = len(orden)
+    total_paginas = max(1, -(-total // por_pagina))
+    if st.session_state.get(f"{key}_pagina", 1) > total_paginas:
+        st.session_state[f"{key}_pagina"] = total_paginas
+    with col_pagina:
+        pagina = st.number_input(f"Página (de {total_paginas})", min_value=1, max_value=total_paginas,
+                                 step=1, key=f"{key}_pagina")
+
+    inicio = (int(pagina) - 1) * por_pagina
+    visible = df.iloc[orden[inicio:inicio + por_pagina]]
+    st.dataframe(visible[columnas], use_container_width=True, hide_index=True)
+    if total:
+        st.caption(f"Mostrando {inicio + 1}–{min(inicio + por_pagina, total)} de {total}")
+    return visible
@@ -1,5 +1,6 @@
 import streamlit as st
 from components.auth import logout, check_authentication
+from components.cards import tarjeta_usuario, render_html
 
 def show_user_widget():
     """Widget de usuario simplificado sin botón HTML"""
@@ -19,37 +20,9 @@ def show_user_widget():
     
     # Widget simplificado sin botón HTML/JavaScript
     with st.sidebar:
-        st.markdown(f"""
-        <div style='
-            background: {role_config['bg']};
-            color: {role_config['text']};
-            padding: 1rem;
-            border-radius: 10px;
-            margin: 0 0 1rem 0;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        '>
-            <div style='
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                margin-bottom: 10px;
-            '>
-                <span style='font-size: 1.8rem;'>{role_config['icon']}</span>
-                <div>
-                    <h3 style='
-                        margin: 0;
-                        font-weight: 600;
-                        font-size: 1.1rem;
-                    '>{user['nombre']}</h3>
-                    <p style='
-                        margin: 0;
-                        opacity: 0.9;
-                        font-size: 0.85rem;
-                    '>{user['rol'].upper()}</p>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        render_html(tarjeta_usuario(
+            user['nombre'], user['rol'], role_config['icon'], role_config['bg'], role_config['text']
+        ))
 
         # Botón nativo de Streamlit para cerrar sesión
         if st.button(
@@ -10,6 +10,14 @@ SHEET_ID = "13R_3Mdr25Jd-nGhK7CxdcbKkFWLc0LPdYrOLOY8sZJo"
 WORKSHEET_RECLAMOS = "Reclamos"
 WORKSHEET_CLIENTES = "Clientes"
 WORKSHEET_USUARIOS = "usuarios"  # Nueva hoja para usuarios
+WORKSHEET_ARCHIVO = "Reclamos archivados"  # Se crea al archivar por primera vez
+
+# Una planilla por sucursal (con sus hojas de reclamos y clientes); se consultan
+# como un solo conjunto de datos con la columna "Sucursal"
+SUCURSALES = {
+    "Principal": SHEET_ID,
+}
+SUCURSAL_PRINCIPAL = "Principal"  # su planilla guarda también la hoja de usuarios
 
 # --------------------------
 # ESTRUCTURAS DE DATOS
@@ -17,14 +25,21 @@ WORKSHEET_USUARIOS = "usuarios"  # Nueva hoja para usuarios
 COLUMNAS_RECLAMOS = [
     "Fecha y hora", "Nº Cliente", "Sector", "Nombre", 
     "Dirección", "Teléfono", "Tipo de reclamo", 
-    "Detalles", "Estado", "Técnico", "N° de Precinto", "Atendido por"
+    "Detalles", "Estado", "Técnico", "N° de Precinto", "Atendido por",
+    "Fecha de resolución", "Fecha de asignación"  # M y N: marcas de tiempo para SLA
 ]
 
+# Archivo: ID estable + columnas del reclamo + cuándo se archivó
+COLUMNAS_ARCHIVO = ["ID"] + COLUMNAS_RECLAMOS + ["Fecha de archivo"]
+
 COLUMNAS_CLIENTES = [
     "Nº Cliente", "Sector", "Nombre", "Dirección", 
     "Teléfono", "N° de Precinto"
 ]
 
+# Columnas con filtro (facetas) en "Reclamos cargados"
+COLUMNAS_FILTRO_RECLAMOS = ["Estado", "Sector", "Tipo de reclamo"] + (["Sucursal"] if len(SUCURSALES) > 1 else [])
+
 COLUMNAS_USUARIOS = [  # Nueva estructura para usuarios
     "username", "password", "nombre", "rol", "activo"
 ]
@@ -57,7 +72,8 @@ OPCIONES_PERMISOS = {
     "Editar cliente": "editar_cliente",
     "Imprimir reclamos": "imprimir_reclamos",
     "Seguimiento técnico": "seguimiento_tecnico",
-    "Cierre de Reclamos": "cierre_reclamos"
+    "Cierre de Reclamos": "cierre_reclamos",
+    "Analítica": "analitica"
 }
 
 # --------------------------
@@ -68,6 +84,15 @@ TECNICOS_DISPONIBLES = [
     "Ramon", "Roque", "Viki", "Oficina", "Base"
 ]
 
+# Ventana por defecto (en días) de los gráficos de Analítica
+DIAS_ANALITICA = 90
+
+# Objetivo de resolución de reclamos (en horas) para los indicadores de SLA
+SLA_HORAS_OBJETIVO = 48
+
+# Los reclamos resueltos hace más de estos días se pueden pasar al archivo
+ARCHIVO_DIAS_RESUELTOS = 180
+
 TIPOS_RECLAMO = [
     "Conexion C+I", "Conexion Cable", "Conexion Internet", "Suma Internet",
     "Suma Cable", "Reconexion", "Sin Señal Ambos", "Sin Señal Cable",
@@ -82,6 +107,9 @@ TIPOS_RECLAMO = [
 API_DELAY = 1.5  # Segundos entre llamadas a la API
 BATCH_DELAY = 2.0  # Segundos entre operaciones batch
 SESSION_TIMEOUT = 1800  # 30 minutos de inactividad para cerrar sesión
+ACTUALIZACION_METRICAS_SEG = 60  # Refresco automático del dashboard y del resumen
+DIRECTORIO_USUARIOS_TTL = 300  # Segundos que se reutiliza la hoja de usuarios para el login
+CACHE_PDF_MAX_MB = 64  # Memoria máxima para PDFs generados compartidos entre sesiones
 
 # --------------------------
 # FUNCIONES DE UTILIDAD
@@ -0,0 +1 @@
+# Secciones de la aplicación (se importan a demanda desde la navegación)
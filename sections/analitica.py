@@ -0,0 +1,104 @@
+"""
+Sección: Analítica histórica y salud del SLA
+"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import pytz
+from utils.sla_analytics import resumen_sla
+from utils.session_tracker import registrar_actividad
+from components.auth import exigir_sesion
+from utils.snapshot import cargar_datos
+from config.settings import DIAS_ANALITICA, SLA_HORAS_OBJETIVO
+
+@st.fragment
+def render():
+    """Sección 8: analítica histórica y SLA"""
+    exigir_sesion()
+    registrar_actividad()
+    snapshot = cargar_datos()
+
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.subheader("📈 Analítica histórica de reclamos")
+
+    cubo = snapshot.cubo
+    hoy = datetime.now(pytz.timezone("America/Argentina/Buenos_Aires")).date()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        rango = st.date_input(
+            "📅 Período",
+            value=(hoy - pd.Timedelta(days=DIAS_ANALITICA), hoy),
+            key="analitica_periodo"
+        )
+    with col2:
+        abrir_por = st.selectbox(
+            "📊 Abrir por",
+            ["Sin apertura", "Tipo de reclamo", "Sector"],
+            key="analitica_apertura"
+        )
+
+    col3, col4 = st.columns(2)
+    with col3:
+        filtro_tipos = st.multiselect("Tipo de reclamo", cubo.valores("Tipo de reclamo"), key="analitica_tipos")
+    with col4:
+        filtro_sectores = st.multiselect("Sector", cubo.valores("Sector"), key="analitica_sectores")
+
+    if len(rango) == 2:
+        desde, hasta = rango
+        filtros = {"Tipo de reclamo": filtro_tipos, "Sector": filtro_sectores}
+
+        st.markdown("#### 📈 Reclamos por día")
+        serie = cubo.serie_diaria(
+            por=None if abrir_por == "Sin apertura" else abrir_por,
+            desde=desde, hasta=hasta, filtros=filtros
+        )
+        if serie.empty:
+            st.info("No hay reclamos en el período seleccionado.")
+        else:
+            st.line_chart(serie)
+
+        st.markdown("#### 👷 Reclamos por técnico")
+        por_tecnico = cubo.por_tecnico(desde=desde, hasta=hasta, filtros=filtros)
+        if por_tecnico.empty:
+            st.info("No hay reclamos con técnicos asignados en el período.")
+        else:
+            st.bar_chart(por_tecnico)
+    else:
+        st.info("Seleccioná fecha de inicio y de fin.")
+
+    # ==============================
+    # SALUD DEL SLA
+    # ==============================
+    st.markdown("---")
+    st.markdown(f"#### ⏱️ Tiempos de resolución (objetivo: {SLA_HORAS_OBJETIVO} h)")
+
+    ahora_sla = datetime.now(pytz.timezone("America/Argentina/Buenos_Aires")).replace(
+        tzinfo=None, minute=0, second=0, microsecond=0
+    )
+    sla = resumen_sla(snapshot, snapshot.version, ahora_sla)
+
+    if sla["por_tipo"].empty:
+        st.info("Todavía no hay reclamos con fecha de resolución registrada.")
+    else:
+        if pd.notna(sla["horas_asignacion_p50"]):
+            st.metric("🕒 Mediana hasta la asignación", f"{sla['horas_asignacion_p50']:.1f} h")
+
+        st.markdown("##### 📈 Horas hasta la resolución (media móvil)")
+        st.line_chart(sla["tendencia"])
+
+        tab_tipo, tab_sector, tab_tecnico = st.tabs(["Por tipo", "Por sector", "Por técnico"])
+        with tab_tipo:
+            st.dataframe(sla["por_tipo"], use_container_width=True)
+        with tab_sector:
+            st.dataframe(sla["por_sector"], use_container_width=True)
+        with tab_tecnico:
+            st.dataframe(sla["por_tecnico"], use_container_width=True)
+
+    st.markdown("##### 📦 Antigüedad de los reclamos activos")
+    if sla["backlog"].empty:
+        st.info("No hay reclamos activos.")
+    else:
+        st.bar_chart(sla["backlog"])
+
+    st.markdown('</div>', unsafe_allow_html=True)
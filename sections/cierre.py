@@ -0,0 +1,213 @@
+"""
+Sección: Cierre de reclamos en curso
+"""
+import streamlit as st
+from datetime import datetime
+import pytz
+import time
+from utils.session_tracker import registrar_actividad
+from utils.snapshot import cargar_datos, actualizar_reclamos, actualizar_clientes, filas_de_cliente
+from utils.tecnico_index import obtener_indice_tecnicos
+from utils.claim_archive import archivar_reclamos, para_archivar
+from utils.jobs import enviar_trabajo
+from components.auth import has_permission, exigir_sesion
+from config.settings import COLUMNAS_RECLAMOS, ARCHIVO_DIAS_RESUELTOS, WORKSHEET_ARCHIVO
+
+RECLAMOS_POR_PAGINA = [10, 25, 50]
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _cantidad_para_archivar(_df_reclamos, version, dias, hoy):
+    """Cuántos reclamos archivaría el trabajo (una vez por snapshot y día)"""
+    return len(para_archivar(_df_reclamos, dias, hoy))
+
+@st.fragment
+def render():
+    """Sección 7: cierre de reclamos en curso"""
+    exigir_sesion()
+    registrar_actividad()
+    snapshot = cargar_datos()
+    df_reclamos, df_clientes = snapshot.df_reclamos, snapshot.df_clientes
+    version_datos = snapshot.version
+
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.subheader("✅ Cierre de reclamos en curso")
+
+    en_curso = df_reclamos[df_reclamos["Estado"] == "En curso"].copy()
+    en_curso["Técnico"] = en_curso["Técnico"].fillna("").astype(str)
+
+    if en_curso.empty:
+        st.info("📭 No hay reclamos en curso en este momento.")
+    else:
+        # Filtro por técnico (coincidencia exacta sobre el índice técnico → reclamos)
+        indice_tecnicos = obtener_indice_tecnicos(df_reclamos, version_datos)
+        carga_tecnicos = indice_tecnicos.carga(estado="En curso")
+        tecnicos_seleccionados = st.multiselect(
+            "👷 Filtrar por técnico asignado",
+            indice_tecnicos.tecnicos(estado="En curso"),
+            format_func=lambda t: f"{t} ({carga_tecnicos.get(t, 0)})",
+            key="filtro_tecnicos"
+        )
+
+        if tecnicos_seleccionados:
+            mascara = indice_tecnicos.mascara(tecnicos_seleccionados, estado="En curso")
+            en_curso = en_curso.loc[df_reclamos.index[mascara]]
+
+        st.write("### 📋 Reclamos en curso:")
+        st.caption("Marcá los reclamos a cerrar y aplicá la acción a todos juntos.")
+
+        # Selección múltiple sobre una sola grilla (un widget en vez de uno por fila)
+        tabla = en_curso[["Fecha y hora", "Nº Cliente", "Nombre", "Tipo de reclamo", "Técnico"]].copy()
+        tabla.insert(0, "Seleccionar", False)
+        editada = st.data_editor(
+            tabla,
+            column_config={"Seleccionar": st.column_config.CheckboxColumn("✔", default=False)},
+            disabled=[c for c in tabla.columns if c != "Seleccionar"],
+            use_container_width=True,
+            height=400,
+            key=f"seleccion_cierre_{version_datos}"
+        )
+        seleccionados = editada.index[editada["Seleccionar"]].tolist()
+
+        col_bulk1, col_bulk2, col_bulk3 = st.columns([2, 1, 1])
+        with col_bulk1:
+            st.markdown(f"**{len(seleccionados)}** reclamo(s) seleccionado(s)")
+        with col_bulk2:
+            resolver_todos = st.button("✅ Resolver seleccionados", disabled=not seleccionados,
+                                       use_container_width=True)
+        with col_bulk3:
+            volver_todos = st.button("↩️ Pendiente seleccionados", disabled=not seleccionados,
+                                     use_container_width=True)
+
+        if resolver_todos or volver_todos:
+            if resolver_todos:
+                argentina = pytz.timezone("America/Argentina/Buenos_Aires")
+                ahora = datetime.now(argentina).strftime("%d/%m/%Y %H:%M:%S")
+                fila = {"Estado": "Resuelto", "Fecha de resolución": ahora}
+            else:
+                fila = {"Estado": "Pendiente", "Técnico": "", "Fecha de asignación": ""}
+            cambios = {i: dict(fila) for i in seleccionados}
+
+            with st.spinner(f"Actualizando {len(cambios)} reclamo(s)..."):
+                # Un único batch_update y un único parche del snapshot
+                success, error = actualizar_reclamos(snapshot, cambios)
+
+            if success:
+                accion = "cerrados" if resolver_todos else "vueltos a PENDIENTE"
+                st.success(f"🟢 {len(cambios)} reclamo(s) {accion} correctamente.")
+                time.sleep(1)
+                st.rerun()
+            else:
+                st.error(f"❌ Error al actualizar: {error}")
+
+        st.markdown("### ✏️ Acciones por reclamo:")
+
+        # Paginación: solo se construyen los widgets de la página visible
+        col_pag1, col_pag2 = st.columns(2)
+        with col_pag1:
+            por_pagina = st.selectbox("Reclamos por página", RECLAMOS_POR_PAGINA, key="cierre_por_pagina")
+        total_paginas = max(1, -(-len(en_curso) // por_pagina))
+        if st.session_state.get("cierre_pagina", 1) > total_paginas:
+            st.session_state["cierre_pagina"] = total_paginas
+        with col_pag2:
+            pagina = st.number_input(f"Página (de {total_paginas})", min_value=1, max_value=total_paginas,
+                                     step=1, key="cierre_pagina")
+        inicio = (int(pagina) - 1) * por_pagina
+        st.caption(f"Mostrando {inicio + 1}–{min(inicio + por_pagina, len(en_curso))} de {len(en_curso)}")
+
+        for i, row in en_curso.iloc[inicio:inicio + por_pagina].iterrows():
+            with st.container():
+                col1, col2, col3 = st.columns([3, 1, 1])
+                
+                with col1:
+                    st.markdown(f"**#{row['Nº Cliente']} - {row['Nombre']}**")
+                    st.markdown(f"📅 {row['Fecha y hora']}")
+                    st.markdown(f"📌 {row['Tipo de reclamo']}")
+                    st.markdown(f"👷 {row['Técnico']}")
+
+                    # Campo de precinto editable
+                    cliente_id = str(row["Nº Cliente"]).strip()
+                    cliente_info = df_clientes[filas_de_cliente(df_clientes, row["Sucursal"], cliente_id)]
+                    precinto_actual = cliente_info["N° de Precinto"].values[0] if not cliente_info.empty else ""
+                    nuevo_precinto = st.text_input("🔒 Precinto", 
+                                                  value=precinto_actual, 
+                                                  key=f"precinto_{i}",
+                                                  help="Actualizar número de precinto si es necesario")
+
+                with col2:
+                    if st.button("✅ Resuelto", key=f"resolver_{i}", use_container_width=True):
+                        with st.spinner("Cerrando reclamo..."):
+                            try:
+                                cambios = {"Estado": "Resuelto"}
+
+                                # Agregar fecha de resolución si corresponde
+                                if "Fecha de resolución" in COLUMNAS_RECLAMOS:
+                                    argentina = pytz.timezone("America/Argentina/Buenos_Aires")
+                                    cambios["Fecha de resolución"] = datetime.now(argentina).strftime("%d/%m/%Y %H:%M:%S")
+
+                                # Actualizar precinto en hoja de reclamos (visual)
+                                if nuevo_precinto.strip() and nuevo_precinto != precinto_actual:
+                                    cambios["N° de Precinto"] = nuevo_precinto.strip()
+
+                                # Ejecutar actualizaciones en hoja de reclamos
+                                success, error = actualizar_reclamos(snapshot, {i: cambios})
+
+                                if success:
+                                    # También actualizar en hoja de CLIENTES si el cliente existe
+                                    if nuevo_precinto.strip() and nuevo_precinto != precinto_actual and not cliente_info.empty:
+                                        success_precinto, error_precinto = actualizar_clientes(
+                                            snapshot,
+                                            {cliente_info.index[0]: {"N° de Precinto": nuevo_precinto.strip()}}
+                                        )
+                                        if not success_precinto:
+                                            st.warning(f"⚠️ Precinto guardado en reclamo pero no en hoja de clientes: {error_precinto}")
+
+                                    st.success(f"🟢 Reclamo de {row['Nombre']} cerrado correctamente.")
+                                    time.sleep(1)
+                                    st.rerun()
+                                else:
+                                    st.error(f"❌ Error al actualizar: {error}")
+
+                            except Exception as e:
+                                st.error(f"❌ Error inesperado: {str(e)}")
+
+                with col3:
+                    if st.button("↩️ Pendiente", key=f"volver_{i}", use_container_width=True):
+                        with st.spinner("Cambiando estado..."):
+                            try:
+                                cambios = {
+                                    i: {"Estado": "Pendiente", "Técnico": "", "Fecha de asignación": ""}  # Limpiar técnico
+                                }
+
+                                success, error = actualizar_reclamos(snapshot, cambios)
+
+                                if success:
+                                    st.success(f"🔄 Reclamo de {row['Nombre']} vuelto a PENDIENTE.")
+                                    time.sleep(1)
+                                    st.rerun()
+                                else:
+                                    st.error(f"❌ Error al actualizar: {error}")
+
+                            except Exception as e:
+                                st.error(f"❌ Error inesperado: {str(e)}")
+
+                st.divider()
+
+    # Mantenimiento (solo admin): sacar de la hoja los resueltos antiguos
+    if has_permission("admin"):
+        st.markdown("---")
+        with st.expander("📦 Archivar reclamos resueltos antiguos"):
+            dias = st.number_input("Resueltos hace más de (días)", min_value=30, value=ARCHIVO_DIAS_RESUELTOS,
+                                   step=30, key="archivo_dias")
+            hoy = datetime.now(pytz.timezone("America/Argentina/Buenos_Aires")).replace(
+                tzinfo=None, hour=0, minute=0, second=0, microsecond=0
+            )
+            cantidad = _cantidad_para_archivar(df_reclamos, version_datos, int(dias), hoy)
+            st.caption(
+                f"{cantidad} reclamo(s) pasarían a la hoja '{WORKSHEET_ARCHIVO}'. "
+                "El historial por cliente los sigue mostrando."
+            )
+            if st.button("📦 Archivar", disabled=not cantidad, key="archivar_reclamos", use_container_width=True):
+                enviar_trabajo(f"Archivar {cantidad} reclamos", archivar_reclamos, int(dias))
+                st.rerun()
+
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,169 @@
+"""
+Sección: Editar cliente - edición y alta de clientes
+"""
+import streamlit as st
+import time
+from utils.session_tracker import registrar_actividad
+from components.auth import exigir_sesion
+from utils.snapshot import cargar_datos, actualizar_clientes, agregar_cliente, filas_de_cliente
+from utils.duplicate_clients import obtener_detector_duplicados
+from components.client_picker import selector_cliente
+from config.settings import SUCURSALES, SUCURSAL_PRINCIPAL
+
+def _guardar_cliente_nuevo(sucursal, nueva_fila):
+    """Agrega un cliente a la planilla de su sucursal y fuerza la recarga"""
+    with st.spinner("Guardando nuevo cliente..."):
+        try:
+            success, error = agregar_cliente(sucursal, nueva_fila)
+
+            if success:
+                st.success("✅ Nuevo cliente agregado correctamente.")
+                cargar_datos.clear()
+                time.sleep(1)
+                st.rerun()
+            else:
+                st.error(f"❌ Error al guardar: {error}")
+
+        except Exception as e:
+            st.error(f"❌ Error inesperado: {str(e)}")
+
+@st.fragment
+def render():
+    """Sección 4: edición y alta de clientes"""
+    exigir_sesion()
+    registrar_actividad()
+    snapshot = cargar_datos()
+    df_clientes = snapshot.df_clientes
+
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.subheader("🛠️ Editar datos de un cliente")
+    
+    sucursal_editar, cliente_editar = selector_cliente(snapshot, "input_editar_cliente",
+                                      "🔎 Buscá el cliente a editar")
+
+    if cliente_editar:
+        cliente_row = df_clientes[filas_de_cliente(df_clientes, sucursal_editar, cliente_editar)]
+
+        if not cliente_row.empty:
+            cliente_actual = cliente_row.iloc[0]
+            
+            with st.form("editar_cliente_form"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    nuevo_sector = st.text_input("🏙️ Sector", value=cliente_actual.get("Sector", ""))
+                    nuevo_nombre = st.text_input("👤 Nombre", value=cliente_actual.get("Nombre", ""))
+                with col2:
+                    nueva_direccion = st.text_input("📍 Dirección", value=cliente_actual.get("Dirección", ""))
+                    nuevo_telefono = st.text_input("📞 Teléfono", value=cliente_actual.get("Teléfono", ""))
+                
+                nuevo_precinto = st.text_input("🔒 N° de Precinto", 
+                                             value=cliente_actual.get("N° de Precinto", ""),
+                                             help="Número de precinto del medidor")
+
+                actualizar = st.form_submit_button("💾 Actualizar datos del cliente", use_container_width=True)
+
+            if actualizar:
+                with st.spinner("Actualizando cliente..."):
+                    try:
+                        cambios = {
+                            cliente_row.index[0]: {
+                                "Sector": nuevo_sector.upper(),
+                                "Nombre": nuevo_nombre.upper(),
+                                "Dirección": nueva_direccion.upper(),
+                                "Teléfono": nuevo_telefono,
+                                "N° de Precinto": nuevo_precinto
+                            }
+                        }
+                        
+                        success, error = actualizar_clientes(snapshot, cambios)
+                        
+                        if success:
+                            st.success("✅ Cliente actualizado correctamente.")
+                            time.sleep(1)
+                            st.rerun()
+                        else:
+                            st.error(f"❌ Error al actualizar: {error}")
+                            
+                    except Exception as e:
+                        st.error(f"❌ Error inesperado: {str(e)}")
+        else:
+            st.warning("⚠️ Cliente no encontrado.")
+
+    # Formulario para nuevo cliente
+    st.markdown("---")
+    st.subheader("🆕 Cargar nuevo cliente")
+
+    with st.form("form_nuevo_cliente", clear_on_submit=True):
+        col1, col2 = st.columns(2)
+        with col1:
+            nuevo_nro = st.text_input("🔢 N° de Cliente (nuevo)", placeholder="Número único").strip()
+            nuevo_sector = st.text_input("🏙️ Sector", placeholder="Zona o sector")
+        with col2:
+            nuevo_nombre = st.text_input("👤 Nombre", placeholder="Nombre completo")
+            nueva_direccion = st.text_input("📍 Dirección", placeholder="Dirección completa")
+        
+        nuevo_telefono = st.text_input("📞 Teléfono", placeholder="Número de contacto")
+        nuevo_precinto = st.text_input("🔒 N° de Precinto (opcional)", placeholder="Número de precinto")
+        sucursal = st.selectbox("🏢 Sucursal", list(SUCURSALES)) if len(SUCURSALES) > 1 else SUCURSAL_PRINCIPAL
+
+        guardar_cliente = st.form_submit_button("💾 Guardar nuevo cliente", use_container_width=True)
+
+        if guardar_cliente:
+            if not nuevo_nro or not nuevo_nombre:
+                st.error("⚠️ Debés ingresar al menos el N° de cliente y el nombre.")
+            elif filas_de_cliente(df_clientes, sucursal, nuevo_nro).any():
+                st.warning("⚠️ Este cliente ya existe.")
+            else:
+                nueva_fila = [
+                    nuevo_nro, nuevo_sector.upper(), nuevo_nombre.upper(),
+                    nueva_direccion.upper(), nuevo_telefono, nuevo_precinto
+                ]
+                detector = obtener_detector_duplicados(df_clientes, snapshot.version)
+                parecidos = detector.candidatos(nuevo_nombre, nueva_direccion, nuevo_telefono)
+                if not parecidos.empty:
+                    # Parecido a un cliente existente: pedir confirmación antes de guardar
+                    st.session_state["cliente_en_espera"] = {
+                        "sucursal": sucursal, "fila": nueva_fila, "parecidos": parecidos
+                    }
+                else:
+                    _guardar_cliente_nuevo(sucursal, nueva_fila)
+
+    en_espera = st.session_state.get("cliente_en_espera")
+    if en_espera:
+        fila = en_espera["fila"]
+        st.warning(f"🧬 El cliente N° {fila[0]} ({fila[2]}) se parece a clientes ya cargados. ¿Es la misma persona o domicilio?")
+        st.dataframe(en_espera["parecidos"], use_container_width=True, hide_index=True)
+        col_guardar, col_cancelar = st.columns(2)
+        with col_guardar:
+            if st.button("💾 Guardar igual", key="confirmar_nuevo_cliente", use_container_width=True):
+                del st.session_state["cliente_en_espera"]
+                _guardar_cliente_nuevo(en_espera["sucursal"], fila)
+        with col_cancelar:
+            if st.button("✖️ Cancelar", key="cancelar_nuevo_cliente", use_container_width=True):
+                del st.session_state["cliente_en_espera"]
+                st.rerun()
+
+    # Reporte de posibles duplicados en toda la hoja
+    st.markdown("---")
+    st.subheader("🧬 Posibles clientes duplicados")
+
+    if st.button("🔍 Buscar duplicados en la hoja de clientes", key="buscar_duplicados", use_container_width=True):
+        st.session_state["mostrar_duplicados"] = True
+
+    if st.session_state.get("mostrar_duplicados"):
+        with st.spinner("Comparando clientes..."):
+            reporte = obtener_detector_duplicados(df_clientes, snapshot.version).reporte()
+
+        if reporte.empty:
+            st.success("✅ No se encontraron clientes duplicados.")
+        else:
+            st.markdown(f"**{len(reporte)} pares de clientes posiblemente duplicados**")
+            st.dataframe(reporte, use_container_width=True, hide_index=True)
+            st.download_button(
+                label="📥 Exportar reporte a CSV",
+                data=reporte.to_csv(index=False).encode("utf-8"),
+                file_name="clientes_duplicados.csv",
+                mime="text/csv"
+            )
+
+    st.markdown('</div>', unsafe_allow_html=True)
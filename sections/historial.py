@@ -0,0 +1,86 @@
+"""
+Sección: Historial de reclamos por cliente
+"""
+import streamlit as st
+import pandas as pd
+from utils.session_tracker import registrar_actividad
+from components.auth import exigir_sesion
+from utils.snapshot import cargar_datos, filas_de_cliente
+from utils.claim_archive import cargar_archivo, ArchivoReclamos
+from utils.data_manager import parsear_fechas
+from components.client_picker import selector_cliente
+from components.paged_table import tabla_paginada
+from config.settings import COLUMNAS_ARCHIVO, COLUMNAS_RECLAMOS, SUCURSALES
+
+@st.fragment
+def render():
+    """Sección 3: historial de reclamos por cliente"""
+    exigir_sesion()
+    registrar_actividad()
+    snapshot = cargar_datos()
+    df_reclamos, df_clientes = snapshot.df_reclamos, snapshot.df_clientes
+
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.subheader("📜 Historial de reclamos por cliente")
+    
+    sucursal_cliente, historial_cliente = selector_cliente(snapshot, "input_historial",
+                                         "🔍 Buscá el cliente para ver su historial")
+
+    if historial_cliente:
+        # Reclamos de la hoja más los archivados (la hoja de archivo se lee recién acá)
+        # Un número sin cliente en ninguna sucursal muestra sus reclamos de todas (con su Sucursal)
+        sucursales = [sucursal_cliente] if sucursal_cliente else list(SUCURSALES)
+        vigentes = df_reclamos[
+            (df_reclamos["Nº Cliente"] == historial_cliente) & df_reclamos["Sucursal"].isin(sucursales)
+        ].assign(Origen="Hoja")
+        try:
+            archivo = cargar_archivo()
+        except Exception as e:
+            st.warning(f"⚠️ No se pudieron leer los reclamos archivados: {e}")
+            archivo = ArchivoReclamos(pd.DataFrame(columns=COLUMNAS_ARCHIVO + ["Sucursal"]))
+        archivados = pd.concat(
+            [archivo.de_cliente(sucursal, historial_cliente) for sucursal in sucursales], ignore_index=True
+        )[COLUMNAS_RECLAMOS + ["Sucursal"]].assign(Origen="📦 Archivo")
+        historial = pd.concat([vigentes, archivados], ignore_index=True)
+
+        if not historial.empty:
+            historial["Fecha y hora"] = parsear_fechas(historial["Fecha y hora"])
+            historial = historial.sort_values("Fecha y hora", ascending=False)
+
+            detalle_archivo = f" ({len(archivados)} archivados)" if len(archivados) else ""
+            st.success(f"🔎 Se encontraron {len(historial)} reclamos{detalle_archivo} para el cliente {historial_cliente}.")
+            
+            # Mostrar información del cliente
+            cliente_info = df_clientes[filas_de_cliente(df_clientes, sucursal_cliente, historial_cliente)]
+            if not cliente_info.empty:
+                cliente = cliente_info.iloc[0]
+                with st.expander("📋 Información del Cliente", expanded=True):
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.markdown(f"**👤 Nombre:** {cliente['Nombre']}")
+                    with col2:
+                        st.markdown(f"**📍 Dirección:** {cliente['Dirección']}")
+                    with col3:
+                        st.markdown(f"**📞 Teléfono:** {cliente['Teléfono']}")
+            
+            # Mostrar historial en tabla paginada
+            columnas = ["Fecha y hora", "Tipo de reclamo", "Estado", "Técnico", "N° de Precinto", "Detalles", "Origen"]
+            if len(SUCURSALES) > 1:
+                columnas.append("Sucursal")
+            tabla_paginada(
+                historial, "tabla_historial", columnas,
+                orden_inicial="Fecha y hora"
+            )
+            
+            # Opción para exportar a CSV
+            csv = historial.to_csv(index=False).encode('utf-8')
+            st.download_button(
+                label="📥 Exportar historial a CSV",
+                data=csv,
+                file_name=f"historial_cliente_{historial_cliente}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("❕ Este cliente no tiene reclamos registrados.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
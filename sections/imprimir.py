@@ -0,0 +1,145 @@
+"""
+Sección: Imprimir reclamos - PDFs para técnicos
+"""
+import streamlit as st
+import pandas as pd
+from utils.session_tracker import registrar_actividad
+from components.auth import exigir_sesion
+from utils.snapshot import cargar_datos
+from utils.pdf_cache import trabajo_pdf
+from utils.pdf_bundles import AGRUPACIONES_PAQUETE, grupos_por, generar_paquete
+from utils.pdf_engine import LAYOUTS_PDF
+from utils.jobs import enviar_trabajo
+
+def _trabajo_paquete(version, grupos, layout, agrupar_por, al_avanzar):
+    """Trabajo en segundo plano: ZIP con un PDF por grupo"""
+    return {
+        "archivo": generar_paquete(version, grupos, layout, al_avanzar),
+        "nombre": f"ordenes_por_{agrupar_por.lower()}.zip",
+        "mime": "application/zip",
+    }
+
+
+@st.fragment
+def render():
+    """Sección 5: impresión de reclamos en PDF"""
+    exigir_sesion()
+    registrar_actividad()
+    snapshot = cargar_datos()
+    df_reclamos, df_clientes = snapshot.df_reclamos, snapshot.df_clientes
+    version_datos = snapshot.version
+
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.subheader("🖨️ Seleccionar reclamos para imprimir (formato técnico compacto)")
+    st.caption("Los PDF se generan en segundo plano y quedan para descargar en la barra lateral.")
+
+    try:
+        # Preparar datos
+        df_pdf = df_reclamos.copy()
+        df_merged = pd.merge(df_pdf, df_clientes[["Sucursal", "Nº Cliente", "N° de Precinto"]], 
+                            on=["Sucursal", "Nº Cliente"], how="left", suffixes=("", "_cliente"))
+
+        # Mostrar reclamos pendientes
+        with st.expander("🕒 Reclamos pendientes de resolución", expanded=True):
+            df_pendientes = df_merged[df_merged["Estado"] == "Pendiente"]
+            if not df_pendientes.empty:
+                st.dataframe(df_pendientes[["Fecha y hora", "Nº Cliente", "Nombre", "Dirección", "Sector", "Tipo de reclamo"]], 
+                            use_container_width=True)
+            else:
+                st.success("✅ No hay reclamos pendientes actualmente.")
+
+        solo_pendientes = st.checkbox("🧾 Mostrar solo reclamos pendientes para imprimir", value=True)
+
+        # --- IMPRIMIR POR TIPO DE RECLAMO ---
+        st.markdown("### 🧾 Imprimir reclamos por tipo")
+        
+        tipos_disponibles = sorted(df_merged["Tipo de reclamo"].unique())
+        tipos_seleccionados = st.multiselect(
+            "Seleccioná tipos de reclamo a imprimir", 
+            tipos_disponibles,
+            default=tipos_disponibles[0] if tipos_disponibles else None
+        )
+
+        if tipos_seleccionados:
+            reclamos_filtrados = df_merged[
+                (df_merged["Estado"] == "Pendiente") & 
+                (df_merged["Tipo de reclamo"].isin(tipos_seleccionados))
+            ]
+
+            if not reclamos_filtrados.empty:
+                st.success(f"Se encontraron {len(reclamos_filtrados)} reclamos pendientes de los tipos seleccionados.")
+
+                if st.button("📄 Generar PDF de reclamos por tipo", key="pdf_tipo"):
+                    enviar_trabajo(
+                        "PDF de reclamos por tipo", trabajo_pdf, version_datos, reclamos_filtrados,
+                        "RECLAMOS PENDIENTES", f"reclamos_{'_'.join(tipos_seleccionados)}.pdf"
+                    )
+                    st.rerun()
+            else:
+                st.info("No hay reclamos pendientes para los tipos seleccionados.")
+
+        # --- PAQUETES POR TÉCNICO / SECTOR ---
+        st.markdown("### 🗂️ Paquete de órdenes por técnico o sector")
+
+        activos = df_merged[df_merged["Estado"].isin(["Pendiente", "En curso"])]
+        if activos.empty:
+            st.info("No hay reclamos activos para armar paquetes.")
+        else:
+            col_p1, col_p2 = st.columns(2)
+            with col_p1:
+                agrupar_por = st.radio("Agrupar por", AGRUPACIONES_PAQUETE, horizontal=True, key="paquete_por")
+            with col_p2:
+                layout_paquete = st.selectbox("Formato", LAYOUTS_PDF, key="paquete_layout")
+
+            grupos = grupos_por(activos, agrupar_por)
+            st.caption(f"{len(grupos)} PDF(s): " + ", ".join(f"{n} ({len(g)})" for n, g in grupos.items()))
+
+            if st.button("📦 Generar paquete ZIP", key="pdf_paquete"):
+                enviar_trabajo(
+                    f"Paquete por {agrupar_por.lower()}",
+                    _trabajo_paquete, version_datos, grupos, layout_paquete, agrupar_por
+                )
+                st.rerun()
+
+        # --- SELECCIÓN MANUAL ---
+        st.markdown("### 📋 Selección manual de reclamos")
+        
+        if solo_pendientes:
+            df_merged = df_merged[df_merged["Estado"] == "Pendiente"]
+
+        selected = st.multiselect(
+            "Seleccioná los reclamos a imprimir:", 
+            df_merged.index,
+            format_func=lambda x: f"{df_merged.at[x, 'Nº Cliente']} - {df_merged.at[x, 'Nombre']}",
+            key="multiselect_reclamos"
+        )
+
+        if st.button("📄 Generar PDF con seleccionados", key="pdf_manual") and selected:
+            enviar_trabajo(
+                "PDF de reclamos seleccionados", trabajo_pdf, version_datos, df_merged.loc[selected],
+                "RECLAMOS SELECCIONADOS", "reclamos_seleccionados.pdf"
+            )
+            st.rerun()
+
+        elif not selected:
+            st.info("Seleccioná al menos un reclamo para generar el PDF.")
+
+        # --- NUEVO BLOQUE: EXPORTAR TODOS LOS ACTIVOS ---
+        st.markdown("### 📦 Exportar todos los reclamos 'Pendiente' y 'En curso'")
+
+        todos_filtrados = df_merged[df_merged["Estado"].isin(["Pendiente", "En curso"])].copy()
+
+        if not todos_filtrados.empty:
+            if st.button("📄 Generar PDF de todos los reclamos activos", key="pdf_todos"):
+                enviar_trabajo(
+                    "PDF de reclamos activos", trabajo_pdf, version_datos, todos_filtrados,
+                    "TODOS LOS RECLAMOS ACTIVOS", "reclamos_activos_completo.pdf"
+                )
+                st.rerun()
+        else:
+            st.info("🎉 No hay reclamos activos actualmente.")
+
+    except Exception as e:
+        st.error(f"❌ Error al generar PDF: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,188 @@
+"""
+Sección: Inicio - carga de nuevos reclamos
+"""
+import streamlit as st
+from datetime import datetime
+import pytz
+import time
+from utils.session_tracker import registrar_actividad
+from components.auth import exigir_sesion
+from utils.snapshot import cargar_datos, agregar_reclamo, agregar_cliente, filas_de_cliente
+from utils.duplicate_clients import obtener_detector_duplicados
+from components.client_picker import selector_cliente
+from config.settings import TIPOS_RECLAMO, SUCURSALES, SUCURSAL_PRINCIPAL
+
+def _reclamos_activos(df_reclamos, sucursal, nro_cliente):
+    """Reclamos sin resolver o desconexiones del cliente en su sucursal"""
+    return df_reclamos[
+        filas_de_cliente(df_reclamos, sucursal, nro_cliente) &
+        (
+            df_reclamos["Estado"].isin(["Pendiente", "En curso"]) |
+            (
+                df_reclamos["Tipo de reclamo"].str.strip().str.lower() == "desconexion a pedido"
+            )
+        )
+    ]
+
+def _guardar_reclamo(df_clientes, datos):
+    """Agrega el reclamo (y el cliente si es nuevo) a la planilla de su sucursal"""
+    nro_cliente, tipo_reclamo = datos["nro_cliente"], datos["tipo_reclamo"]
+    with st.spinner("Guardando reclamo..."):
+        try:
+            argentina = pytz.timezone("America/Argentina/Buenos_Aires")
+            fecha_hora = datetime.now(argentina).strftime("%d/%m/%Y %H:%M:%S")
+
+            estado_reclamo = "" if tipo_reclamo.strip().lower() == "desconexion a pedido" else "Pendiente"
+
+            fila_reclamo = [
+                fecha_hora, nro_cliente, datos["sector"], datos["nombre"].upper(),
+                datos["direccion"].upper(), datos["telefono"], tipo_reclamo,
+                datos["detalles"].upper(), estado_reclamo, "", datos["precinto"], datos["atendido_por"].upper(),
+                "", ""  # Fecha de resolución / asignación
+            ]
+
+            success, error = agregar_reclamo(datos["sucursal"], fila_reclamo)
+
+            if success:
+                st.success(f"✅ Reclamo cargado para el cliente {nro_cliente} - {tipo_reclamo.upper()}")
+
+                if tipo_reclamo.strip().lower() == "desconexion a pedido":
+                    st.warning("📄 Este reclamo es una Desconexión a Pedido. **Y NO CUENTA como reclamo activo.**")
+
+                if not filas_de_cliente(df_clientes, datos["sucursal"], nro_cliente).any():
+                    fila_cliente = [nro_cliente, datos["sector"], datos["nombre"].upper(),
+                                    datos["direccion"].upper(), datos["telefono"], datos["precinto"]]
+                    agregar_cliente(datos["sucursal"], fila_cliente)
+
+                cargar_datos.clear()
+                time.sleep(5)
+                st.rerun()
+            else:
+                st.error(f"❌ Error al guardar: {error}")
+        except Exception as e:
+            st.error(f"❌ Error inesperado: {str(e)}")
+
+@st.fragment
+def render():
+    """Sección 1: carga de un nuevo reclamo"""
+    exigir_sesion()
+    registrar_actividad()
+    snapshot = cargar_datos()
+    df_reclamos, df_clientes = snapshot.df_reclamos, snapshot.df_clientes
+
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.subheader("📝 Cargar nuevo reclamo")
+
+    sucursal_cliente, nro_cliente = selector_cliente(snapshot, "input_inicio", "🔢 N° de Cliente",
+                                   placeholder="Número de cliente, nombre o dirección")
+    cliente_existente = None
+    formulario_bloqueado = False
+
+    if "Nº Cliente" in df_clientes.columns and nro_cliente:
+        if sucursal_cliente:
+            match = df_clientes[filas_de_cliente(df_clientes, sucursal_cliente, nro_cliente)]
+            cliente_existente = match.iloc[0].to_dict()
+            st.success("✅ Cliente reconocido, datos auto-cargados.")
+            reclamos_activos = _reclamos_activos(df_reclamos, sucursal_cliente, nro_cliente)
+        else:
+            st.info("ℹ️ Cliente no encontrado. Se cargará como Cliente Nuevo.")
+            # Cliente nuevo: sus reclamos se revisan al guardar, con la sucursal elegida
+            reclamos_activos = df_reclamos.iloc[0:0]
+
+        if not reclamos_activos.empty:
+            st.error("⚠️ Este cliente ya tiene un reclamo sin resolver o una desconexión activa. No se puede cargar uno nuevo.")
+            formulario_bloqueado = True
+
+            reclamo_vigente = reclamos_activos.sort_values("Fecha y hora", ascending=False).iloc[0]
+
+            with st.expander("🔍 Ver detalles del reclamo activo"):
+                st.markdown(f"**📅 Fecha del reclamo:** {reclamo_vigente['Fecha y hora']}")
+                st.markdown(f"**👤 Cliente:** {reclamo_vigente['Nombre']}")
+                st.markdown(f"**📌 Tipo de reclamo:** {reclamo_vigente['Tipo de reclamo']}")
+                st.markdown(f"**📝 Detalles:** {reclamo_vigente['Detalles'][:250]}{'...' if len(reclamo_vigente['Detalles']) > 250 else ''}")
+                st.markdown(f"**⚙️ Estado:** {reclamo_vigente['Estado'] or 'Sin estado'}")
+                st.markdown(f"**👷 Técnico asignado:** {reclamo_vigente.get('Técnico', 'No asignado') or 'No asignado'}")
+                st.markdown(f"**🙍‍♂️ Atendido por:** {reclamo_vigente.get('Atendido por', 'N/A')}")
+
+    if not formulario_bloqueado:
+        with st.form("reclamo_formulario", clear_on_submit=True):
+            col1, col2 = st.columns(2)
+
+            if cliente_existente:
+                with col1:
+                    nombre = st.text_input("👤 Nombre del Cliente", value=cliente_existente.get("Nombre", ""))
+                    direccion = st.text_input("📍 Dirección", value=cliente_existente.get("Dirección", ""))
+                with col2:
+                    telefono = st.text_input("📞 Teléfono", value=cliente_existente.get("Teléfono", ""))
+                    sector = st.text_input("🏩 Sector / Zona", value=cliente_existente.get("Sector", ""))
+            else:
+                with col1:
+                    nombre = st.text_input("👤 Nombre del Cliente", placeholder="Nombre completo")
+                    direccion = st.text_input("📍 Dirección", placeholder="Dirección completa")
+                with col2:
+                    telefono = st.text_input("📞 Teléfono", placeholder="Número de contacto")
+                    sector = st.text_input("🏩 Sector / Zona", placeholder="Coloque número de sector")
+                if len(SUCURSALES) > 1:
+                    sucursal = st.selectbox("🏢 Sucursal", list(SUCURSALES))
+
+            tipo_reclamo = st.selectbox("📌 Tipo de Reclamo", TIPOS_RECLAMO)
+            detalles = st.text_area("📝 Detalles del Reclamo", placeholder="Describe el problema o solicitud...", height=100)
+
+            col3, col4 = st.columns(2)
+            with col3:
+                precinto = st.text_input("🔒 N° de Precinto (opcional)",
+                                         value=cliente_existente.get("N° de Precinto", "").strip() if cliente_existente else "",
+                                         placeholder="Número de precinto")
+            with col4:
+                atendido_por = st.text_input("👤 Atendido por", placeholder="Nombre de quien atiende", value=st.session_state.get("current_user", ""))
+
+            enviado = st.form_submit_button("✅ Guardar Reclamo", use_container_width=True)
+
+        if enviado:
+            if not nro_cliente:
+                st.error("⚠️ Debes ingresar un número de cliente.")
+            elif not all([nombre.strip(), direccion.strip(), sector.strip(), tipo_reclamo.strip(), atendido_por.strip()]):
+                st.error("⚠️ Todos los campos obligatorios deben estar completos.")
+            else:
+                if cliente_existente:
+                    sucursal = sucursal_cliente
+                elif len(SUCURSALES) == 1:
+                    sucursal = SUCURSAL_PRINCIPAL
+                datos = {
+                    "sucursal": sucursal,
+                    "nro_cliente": nro_cliente, "sector": sector, "nombre": nombre, "direccion": direccion,
+                    "telefono": telefono, "tipo_reclamo": tipo_reclamo, "detalles": detalles,
+                    "precinto": precinto, "atendido_por": atendido_por,
+                }
+                parecidos = None
+                if cliente_existente is None:
+                    detector = obtener_detector_duplicados(df_clientes, snapshot.version)
+                    parecidos = detector.candidatos(nombre, direccion, telefono, excluir=(sucursal, nro_cliente))
+
+                if cliente_existente is None and not _reclamos_activos(df_reclamos, sucursal, nro_cliente).empty:
+                    st.error("⚠️ Este cliente ya tiene un reclamo sin resolver o una desconexión activa. No se puede cargar uno nuevo.")
+                elif parecidos is not None and not parecidos.empty:
+                    # Cliente nuevo parecido a uno existente: pedir confirmación antes de guardar
+                    st.session_state["reclamo_en_espera"] = {"datos": datos, "parecidos": parecidos}
+                else:
+                    _guardar_reclamo(df_clientes, datos)
+
+    en_espera = st.session_state.get("reclamo_en_espera")
+    if en_espera:
+        datos = en_espera["datos"]
+        st.warning(
+            f"🧬 El cliente nuevo N° {datos['nro_cliente']} ({datos['nombre'].upper()}) se parece a "
+            "clientes ya cargados. ¿Es la misma persona o domicilio?"
+        )
+        st.dataframe(en_espera["parecidos"], use_container_width=True, hide_index=True)
+        col_guardar, col_cancelar = st.columns(2)
+        with col_guardar:
+            if st.button("💾 Guardar igual como cliente nuevo", key="confirmar_cliente_nuevo", use_container_width=True):
+                del st.session_state["reclamo_en_espera"]
+                _guardar_reclamo(df_clientes, datos)
+        with col_cancelar:
+            if st.button("↩️ Cancelar y buscar el cliente existente", key="cancelar_cliente_nuevo", use_container_width=True):
+                del st.session_state["reclamo_en_espera"]
+                st.rerun()
+
+    st.markdown('</div>', unsafe_allow_html=True)
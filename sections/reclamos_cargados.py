@@ -0,0 +1,226 @@
+"""
+Sección: Reclamos cargados - listado, filtros y edición puntual
+"""
+import time
+import numpy as np
+import streamlit as st
+import pandas as pd
+from utils.facet_index import obtener_indice_facetas
+from utils.claim_search import buscar_reclamos
+from utils.client_search import plegar
+from components.cards import grilla_tipos, render_html
+from components.paged_table import tabla_paginada
+from utils.session_tracker import registrar_actividad
+from components.auth import exigir_sesion
+from utils.snapshot import cargar_datos, actualizar_reclamos
+from config.settings import COLUMNAS_FILTRO_RECLAMOS
+
+MAX_OPCIONES_RECLAMO = 20
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def preparar_reclamos_cargados(_df_reclamos, _df_clientes, version):
+    """Une reclamos con clientes y ordena por fecha una sola vez por snapshot"""
+    df = _df_reclamos.copy()
+    clientes = _df_clientes[["Sucursal", "Nº Cliente", "N° de Precinto", "Teléfono"]].copy()
+
+    # Normalización de columnas clave
+    clientes["Nº Cliente"] = clientes["Nº Cliente"].astype(str).str.strip()
+    df["Nº Cliente"] = df["Nº Cliente"].astype(str).str.strip()
+
+    # Merge con datos del cliente (conserva el índice original para escribir en la hoja)
+    clientes = clientes.drop_duplicates(["Sucursal", "Nº Cliente"])
+    df = pd.merge(df.reset_index(), clientes, on=["Sucursal", "Nº Cliente"], how="left", suffixes=("", "_cliente"))
+    df = df.set_index("index").rename_axis(None)
+
+    # Procesamiento de fechas
+    df["Fecha y hora"] = pd.to_datetime(df["Fecha y hora"], errors="coerce")
+    df = df.sort_values("Fecha y hora", ascending=False)
+
+    indice = obtener_indice_facetas(df, version, tuple(COLUMNAS_FILTRO_RECLAMOS))
+    return df, indice
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _nombres_plegados(_df, version):
+    """Nombres sin acentos de la vista, para buscar reclamos por nombre"""
+    return _df["Nombre"].fillna("").astype(str).map(plegar)
+
+def _etiqueta_reclamo(fila):
+    """Texto de un reclamo en el selector de edición"""
+    fecha = f" ({fila['Fecha y hora']:%d/%m/%Y})" if pd.notna(fila["Fecha y hora"]) else ""
+    return f"{fila['Nº Cliente']} - {fila['Nombre']} - {fila['Tipo de reclamo']}{fecha}"
+
+@st.fragment
+def render():
+    """Sección 2: gestión de reclamos cargados"""
+    exigir_sesion()
+    registrar_actividad()
+    snapshot = cargar_datos()
+    df_reclamos, df_clientes = snapshot.df_reclamos, snapshot.df_clientes
+    version_datos = snapshot.version
+
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.subheader("📊 Gestión de reclamos cargados")
+
+    try:
+        # Vista unida y ordenada, compartida por todos los reruns del snapshot
+        df, indice_facetas = preparar_reclamos_cargados(df_reclamos, df_clientes, version_datos)
+
+        # ==============================
+        # MINI PANEL: Reclamos por tipo
+        # ==============================
+        mascara_activos = (
+            indice_facetas.mascara({"Estado": "Pendiente"}) |
+            indice_facetas.mascara({"Estado": "En curso"})
+        )
+
+        if mascara_activos.any():
+            conteo_por_tipo = pd.Series(
+                indice_facetas.conteos_en("Tipo de reclamo", mascara_activos)
+            )
+            conteo_por_tipo = conteo_por_tipo[conteo_por_tipo > 0]
+
+            st.markdown("#### 📊 Distribución de reclamos activos por tipo")
+            render_html(grilla_tipos(conteo_por_tipo))
+
+        # ==============================
+        # BÚSQUEDA EN TEXTO LIBRE
+        # ==============================
+        st.markdown("#### 📝 Buscar en detalles, tipo y dirección")
+        col_texto, col_sectores, col_fechas = st.columns([2, 1, 1])
+        with col_texto:
+            consulta = st.text_input("Texto a buscar", placeholder='Ej: "fibra cortada"',
+                                     key="busqueda_texto").strip()
+        with col_sectores:
+            sectores = st.multiselect("Sector", indice_facetas.valores("Sector"), key="busqueda_sectores")
+        with col_fechas:
+            rango = st.date_input("Fecha", value=(), format="DD/MM/YYYY", key="busqueda_fechas")
+
+        if consulta:
+            desde = rango[0] if len(rango) > 0 else None
+            hasta = rango[1] if len(rango) > 1 else desde
+            encontrados = buscar_reclamos(snapshot, consulta, sectores, desde, hasta)
+            if encontrados.empty:
+                st.info("🔎 No hay reclamos que coincidan con la búsqueda.")
+            else:
+                st.markdown(f"**{len(encontrados)} reclamos más relevantes**")
+                st.dataframe(
+                    encontrados[["Puntaje", "Fecha y hora", "Nº Cliente", "Nombre", "Sector",
+                                 "Tipo de reclamo", "Estado", "Detalles"]],
+                    use_container_width=True, hide_index=True
+                )
+
+        # ==============================
+        # FILTROS
+        # ==============================
+        st.markdown("#### 🔍 Filtros de búsqueda")
+        # Filtros vigentes (del rerun anterior) para mostrar conteos en vivo
+        for col in COLUMNAS_FILTRO_RECLAMOS:
+            # Primer render, o el valor ya no existe en el snapshot
+            if st.session_state.get(f"filtro_{col}") not in ["Todos"] + indice_facetas.valores(col):
+                st.session_state[f"filtro_{col}"] = "Todos"
+        filtros = {
+            col: st.session_state[f"filtro_{col}"]
+            for col in COLUMNAS_FILTRO_RECLAMOS
+            if st.session_state[f"filtro_{col}"] != "Todos"
+        }
+
+        for col, columna_ui in zip(COLUMNAS_FILTRO_RECLAMOS, st.columns(len(COLUMNAS_FILTRO_RECLAMOS))):
+            conteos = indice_facetas.conteos(col, filtros)
+            total_col = sum(conteos.values())
+            with columna_ui:
+                st.selectbox(
+                    col,
+                    ["Todos"] + indice_facetas.valores(col),
+                    format_func=lambda v, c=conteos, t=total_col: f"{v} ({t if v == 'Todos' else c.get(v, 0)})",
+                    key=f"filtro_{col}"
+                )
+
+        # Aplicar filtros como intersección de máscaras precalculadas
+        filtros = {
+            col: st.session_state[f"filtro_{col}"]
+            for col in COLUMNAS_FILTRO_RECLAMOS
+            if st.session_state[f"filtro_{col}"] != "Todos"
+        }
+        posiciones = indice_facetas.posiciones(filtros)
+
+        st.markdown(f"**Mostrando {len(posiciones)} reclamos**")
+
+        # ==============================
+        # TABLA PAGINADA
+        # ==============================
+        columnas_visibles = ["Fecha y hora", "Nº Cliente", "Nombre", "Sector", "Tipo de reclamo", "Teléfono"]
+        tabla_paginada(df, "tabla_reclamos", columnas_visibles, version_datos, posiciones,
+                       orden_inicial="Fecha y hora")
+
+        # ==============================
+        # FORMULARIO DE EDICIÓN MANUAL
+        # ==============================
+        st.markdown("---")
+        st.markdown("### ✏️ Editar un reclamo puntual")
+
+        # Selector con búsqueda: solo viajan las coincidencias, no todos los reclamos filtrados
+        busqueda = st.text_input("🔎 Buscá el reclamo por N° de cliente o nombre",
+                                 placeholder="Número de cliente o parte del nombre",
+                                 key="buscar_reclamo_editar").strip()
+        seleccionado = None
+        if busqueda:
+            incluidas = np.zeros(len(df), dtype=bool)
+            incluidas[posiciones] = True
+            coinciden = (
+                df["Nº Cliente"].str.startswith(busqueda).to_numpy() |
+                _nombres_plegados(df, version_datos).str.contains(plegar(busqueda), regex=False).to_numpy()
+            )
+            encontrados = df.iloc[np.flatnonzero(coinciden & incluidas)[:MAX_OPCIONES_RECLAMO]]
+
+            if encontrados.empty:
+                st.info("🔎 No hay reclamos filtrados que coincidan con la búsqueda.")
+            else:
+                etiquetas = {idx: _etiqueta_reclamo(fila) for idx, fila in encontrados.iterrows()}
+                seleccionado = st.selectbox(
+                    f"Seleccioná un reclamo ({len(encontrados)} coincidencias, los más recientes primero)",
+                    [None] + list(etiquetas),
+                    format_func=lambda idx: "—" if idx is None else etiquetas[idx],
+                    key="selector_reclamo_editar"
+                )
+
+        if seleccionado is not None:
+            reclamo_actual = df.loc[seleccionado]
+
+            nueva_direccion = st.text_input("Dirección", value=reclamo_actual.get("Dirección", ""))
+            nuevo_telefono = st.text_input("Teléfono", value=reclamo_actual.get("Teléfono", ""))
+            tipos_existentes = indice_facetas.valores("Tipo de reclamo")
+            nuevo_tipo = st.selectbox("Tipo de reclamo", tipos_existentes, 
+                                      index=tipos_existentes.index(reclamo_actual["Tipo de reclamo"]))
+            nuevos_detalles = st.text_area("Detalles del reclamo", value=reclamo_actual.get("Detalles", ""), height=100)
+            nuevo_precinto = st.text_input("N° de Precinto", value=reclamo_actual.get("N° de Precinto", ""))
+
+            if st.button("💾 Guardar cambios", key="guardar_reclamo_individual", use_container_width=True):
+                try:
+                    nuevos = {
+                        "Dirección": nueva_direccion,
+                        "Teléfono": nuevo_telefono,
+                        "Tipo de reclamo": nuevo_tipo,
+                        "Detalles": nuevos_detalles,
+                        "N° de Precinto": nuevo_precinto,
+                    }
+                    # Solo las celdas modificadas de esta fila, no la hoja entera
+                    actual = df_reclamos.loc[seleccionado]
+                    cambios = {col: valor for col, valor in nuevos.items() if str(actual.get(col, "")) != valor}
+
+                    if not cambios:
+                        st.info("ℹ️ No hay cambios para guardar.")
+                    else:
+                        success, error = actualizar_reclamos(snapshot, {seleccionado: cambios})
+                        if success:
+                            st.success("✅ Reclamo actualizado correctamente.")
+                            time.sleep(1)
+                            st.rerun()
+                        else:
+                            st.error(f"❌ Error al guardar: {error}")
+                except Exception as e:
+                    st.error(f"❌ Error al procesar: {str(e)}")
+
+    except Exception as e:
+        st.error(f"⚠️ Error en la gestión de reclamos: {str(e)}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,280 @@
+"""
+Sección: Seguimiento técnico - estado y asignación de técnicos
+"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import pytz
+import time
+from utils.session_tracker import registrar_actividad
+from components.auth import exigir_sesion
+from utils.snapshot import cargar_datos, actualizar_reclamos
+from components.client_picker import selector_cliente
+from utils.pdf_cache import trabajo_pdf
+from utils.jobs import enviar_trabajo
+from config.settings import TECNICOS_DISPONIBLES, SUCURSALES
+
+ESTADOS_RECLAMO = ["Pendiente", "En curso", "Resuelto"]
+
+
+def _cambios_asignacion(original, editada, tecnicos_lote, estado_lote, ahora):
+    """
+    Compara la grilla editada contra los reclamos originales
+
+    Returns:
+        tuple: (cambios {índice: {columna: valor}}, lista de errores)
+    """
+    validos = {t.casefold(): t.upper() for t in TECNICOS_DISPONIBLES}
+    cambios, errores = {}, []
+
+    for idx, fila in editada.iterrows():
+        estado = fila["Estado"]
+        tecnicos = [t.strip() for t in str(fila["Técnico"] or "").split(",") if t.strip()]
+        if fila["Seleccionar"]:
+            estado = estado_lote
+            if tecnicos_lote:
+                tecnicos = list(tecnicos_lote)
+
+        desconocidos = [t for t in tecnicos if t.casefold() not in validos]
+        if desconocidos:
+            errores.append(f"#{fila['Nº Cliente']}: técnico desconocido {', '.join(desconocidos)}")
+            continue
+        if estado == "En curso" and not tecnicos:
+            errores.append(f"#{fila['Nº Cliente']}: falta asignar técnico para 'En curso'")
+            continue
+
+        tecnicos_str = ", ".join(validos[t.casefold()] for t in tecnicos)
+        estado_anterior = original.at[idx, "Estado"]
+        tecnico_anterior = str(original.at[idx, "Técnico"] or "")
+        if estado == estado_anterior and tecnicos_str == tecnico_anterior:
+            continue
+
+        cambio = {"Estado": estado, "Técnico": tecnicos_str}
+        # Marcas de tiempo para SLA
+        if tecnicos and tecnicos_str != tecnico_anterior.upper():
+            cambio["Fecha de asignación"] = ahora
+        if estado == "Resuelto":
+            cambio["Fecha de resolución"] = ahora
+        cambios[idx] = cambio
+
+    return cambios, errores
+
+
+@st.fragment
+def render():
+    """Sección 6: seguimiento técnico del reclamo"""
+    exigir_sesion()
+    registrar_actividad()
+    snapshot = cargar_datos()
+    df_reclamos = snapshot.df_reclamos
+
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.subheader("👷 Seguimiento técnico del reclamo")
+    
+    sucursal_cliente, cliente_input = selector_cliente(snapshot, "input_seguimiento",
+                                     "🔍 Buscá el cliente para actualizar su reclamo")
+
+    if cliente_input:
+        # Un número sin cliente en ninguna sucursal busca sus reclamos en todas
+        sucursales = [sucursal_cliente] if sucursal_cliente else list(SUCURSALES)
+        df_filtrado = df_reclamos[
+            (df_reclamos["Nº Cliente"] == cliente_input) & df_reclamos["Sucursal"].isin(sucursales) &
+            (df_reclamos["Estado"].isin(["Pendiente", "En curso"]))
+        ]
+
+        if df_filtrado.empty:
+            st.warning("❕ Este cliente no tiene reclamos pendientes o en curso.")
+        else:
+            df_filtrado["Fecha y hora"] = pd.to_datetime(df_filtrado["Fecha y hora"], errors="coerce")
+            df_filtrado = df_filtrado.dropna(subset=["Fecha y hora"])
+
+            if df_filtrado.empty:
+                st.warning("❕ Este cliente tiene reclamos sin fecha válida. No se puede determinar el más reciente.")
+            else:
+                df_ordenado = df_filtrado.sort_values("Fecha y hora", ascending=False)
+                reclamo_actual = df_ordenado.iloc[0]
+                index_reclamo = df_ordenado.index[0]
+
+                # Mostrar información del reclamo
+                with st.expander("📋 Información del Reclamo", expanded=True):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown(f"**📅 Fecha:** {reclamo_actual['Fecha y hora']}")
+                        st.markdown(f"**📌 Tipo:** {reclamo_actual['Tipo de reclamo']}")
+                        st.markdown(f"**📍 Dirección:** {reclamo_actual['Dirección']}")
+                    with col2:
+                        st.markdown(f"**🔒 Precinto:** {reclamo_actual.get('N° de Precinto', 'No asignado')}")
+                        st.markdown(f"**📞 Teléfono:** {reclamo_actual['Teléfono']}")
+                        st.markdown(f"**👤 Atendido por:** {reclamo_actual['Atendido por']}")
+                    
+                    st.markdown(f"**📄 Detalles:** {reclamo_actual['Detalles']}")
+
+                # Formulario de actualización
+                with st.form("actualizar_reclamo"):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        nuevo_estado = st.selectbox(
+                            "⚙️ Cambiar estado",
+                            ESTADOS_RECLAMO,
+                            index=ESTADOS_RECLAMO.index(reclamo_actual["Estado"]),
+                            key="select_estado"
+                        )
+                    
+                    with col2:
+                        tecnicos_actuales = [t.strip() for t in str(reclamo_actual.get("Técnico", "")).split(",") if t.strip()]
+                        tecnicos_actuales_filtrados = [
+                            t for t in TECNICOS_DISPONIBLES if t.lower() in [x.lower() for x in tecnicos_actuales]
+                        ]
+
+                        nuevos_tecnicos = st.multiselect(
+                            "👷 Técnicos asignados",
+                            TECNICOS_DISPONIBLES,
+                            default=tecnicos_actuales_filtrados,
+                            key="multiselect_tecnicos"
+                        )
+
+                    actualizar = st.form_submit_button("💾 Actualizar reclamo", use_container_width=True)
+
+                if actualizar:
+                    if not nuevos_tecnicos and nuevo_estado == "En curso":
+                        st.warning("⚠️ Debes asignar al menos un técnico para marcar como 'En curso'.")
+                    else:
+                        with st.spinner("Actualizando reclamo..."):
+                            try:
+                                argentina = pytz.timezone("America/Argentina/Buenos_Aires")
+                                ahora = datetime.now(argentina).strftime("%d/%m/%Y %H:%M:%S")
+                                tecnicos_str = ", ".join(nuevos_tecnicos).upper()
+
+                                cambios = {
+                                    index_reclamo: {
+                                        "Estado": nuevo_estado,
+                                        "Técnico": tecnicos_str
+                                    }
+                                }
+
+                                # Marcas de tiempo para SLA
+                                if nuevos_tecnicos and (
+                                    reclamo_actual["Estado"] != "En curso" or
+                                    tecnicos_str != str(reclamo_actual.get("Técnico", "")).upper()
+                                ):
+                                    cambios[index_reclamo]["Fecha de asignación"] = ahora
+                                if nuevo_estado == "Resuelto":
+                                    cambios[index_reclamo]["Fecha de resolución"] = ahora
+                                
+                                success, error = actualizar_reclamos(snapshot, cambios)
+                                
+                                if success:
+                                    st.success("✅ Reclamo actualizado correctamente.")
+                                    time.sleep(1)
+                                    st.rerun()
+                                else:
+                                    st.error(f"❌ Error al actualizar: {error}")
+                                    
+                            except Exception as e:
+                                st.error(f"❌ Error inesperado: {str(e)}")
+
+    # --- ASIGNACIÓN MASIVA ---
+    st.markdown("---")
+    st.markdown("### 📋 Asignación masiva de reclamos pendientes")
+
+    pendientes = df_reclamos[df_reclamos["Estado"] == "Pendiente"]
+
+    if pendientes.empty:
+        st.info("No hay reclamos pendientes para asignar.")
+    else:
+        col_f1, col_f2 = st.columns(2)
+        with col_f1:
+            sectores = st.multiselect("📍 Sector", sorted(pendientes["Sector"].dropna().astype(str).unique()),
+                                      key="masiva_sector")
+        with col_f2:
+            tipos = st.multiselect("📌 Tipo de reclamo", sorted(pendientes["Tipo de reclamo"].dropna().astype(str).unique()),
+                                   key="masiva_tipo")
+
+        if sectores:
+            pendientes = pendientes[pendientes["Sector"].astype(str).isin(sectores)]
+        if tipos:
+            pendientes = pendientes[pendientes["Tipo de reclamo"].astype(str).isin(tipos)]
+
+        grilla = pendientes[["Fecha y hora", "Nº Cliente", "Nombre", "Sector", "Tipo de reclamo", "Estado", "Técnico"]].copy()
+        grilla["Técnico"] = grilla["Técnico"].fillna("").astype(str)
+        grilla.insert(0, "Seleccionar", False)
+
+        # Dentro de un form la grilla no dispara un rerun por cada celda editada
+        with st.form("asignacion_masiva"):
+            editada = st.data_editor(
+                grilla,
+                column_config={
+                    "Seleccionar": st.column_config.CheckboxColumn("✔", default=False),
+                    "Estado": st.column_config.SelectboxColumn("Estado", options=ESTADOS_RECLAMO, required=True),
+                    "Técnico": st.column_config.TextColumn(
+                        "Técnico", help=f"Separar con comas. Disponibles: {', '.join(TECNICOS_DISPONIBLES)}"
+                    ),
+                },
+                disabled=["Fecha y hora", "Nº Cliente", "Nombre", "Sector", "Tipo de reclamo"],
+                use_container_width=True,
+                height=400,
+                key=f"grilla_asignacion_{snapshot.version}"
+            )
+
+            st.caption("Para los reclamos marcados con ✔ se aplican estos valores:")
+            col_l1, col_l2 = st.columns(2)
+            with col_l1:
+                tecnicos_lote = st.multiselect("👷 Técnicos", TECNICOS_DISPONIBLES, key="masiva_tecnicos")
+            with col_l2:
+                estado_lote = st.selectbox("⚙️ Estado", ESTADOS_RECLAMO, index=1, key="masiva_estado")
+
+            guardar = st.form_submit_button("💾 Guardar asignaciones", use_container_width=True)
+
+        if guardar:
+            argentina = pytz.timezone("America/Argentina/Buenos_Aires")
+            ahora = datetime.now(argentina).strftime("%d/%m/%Y %H:%M:%S")
+            cambios, errores = _cambios_asignacion(pendientes, editada, tecnicos_lote, estado_lote, ahora)
+
+            if errores:
+                st.error("❌ Revisá las asignaciones:\n\n" + "\n".join(f"- {e}" for e in errores[:10]))
+            elif not cambios:
+                st.info("ℹ️ No hay cambios para guardar.")
+            else:
+                with st.spinner(f"Actualizando {len(cambios)} reclamo(s)..."):
+                    # Un único batch_update y un único parche del snapshot
+                    success, error = actualizar_reclamos(snapshot, cambios)
+
+                if success:
+                    st.success(f"✅ {len(cambios)} reclamo(s) actualizados correctamente.")
+                    time.sleep(1)
+                    st.rerun()
+                else:
+                    st.error(f"❌ Error al actualizar: {error}")
+
+    # --- IMPRIMIR RECLAMOS EN CURSO ---
+    st.markdown("---")
+    st.markdown("### 🖨️ Imprimir reclamos 'En curso' (vista compacta optimizada)")
+
+    reclamos_en_curso = df_reclamos[df_reclamos["Estado"] == "En curso"].copy()
+
+    if reclamos_en_curso.empty:
+        st.info("No hay reclamos en curso para imprimir.")
+    else:
+        reclamos_en_curso["Fecha y hora"] = pd.to_datetime(reclamos_en_curso["Fecha y hora"], errors="coerce")
+        reclamos_en_curso = reclamos_en_curso.dropna(subset=["Fecha y hora"])
+        reclamos_en_curso = reclamos_en_curso.sort_values("Fecha y hora", ascending=False)
+
+        st.dataframe(
+            reclamos_en_curso[["Nº Cliente", "Nombre", "Tipo de reclamo", "Técnico", "Fecha y hora"]],
+            use_container_width=True,
+            height=400
+        )
+
+        st.caption("El PDF se genera en segundo plano y queda para descargar en la barra lateral.")
+        if st.button("📄 Generar PDF de reclamos en curso", key="pdf_en_curso"):
+            filas = reclamos_en_curso.assign(
+                **{"Fecha y hora": reclamos_en_curso["Fecha y hora"].dt.strftime("%d/%m %H:%M")}
+            )
+            enviar_trabajo(
+                "PDF de reclamos en curso", trabajo_pdf, snapshot.version, filas,
+                "RECLAMOS EN CURSO", "reclamos_en_curso.pdf", layout="compacto"
+            )
+            st.rerun()
+    
+    st.markdown('</div>', unsafe_allow_html=True)
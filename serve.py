@@ -0,0 +1,14 @@
+"""
+Arranque del servidor con precalentamiento de cachés
+Uso: python serve.py [opciones de streamlit, ej. --server.port=8501]
+"""
+import os
+import sys
+from streamlit.web import cli
+from utils.warmup import iniciar_precalentamiento
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    iniciar_precalentamiento()
+    sys.argv = ["streamlit", "run", "app.py", *sys.argv[1:]]
+    sys.exit(cli.main())
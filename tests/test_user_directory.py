@@ -0,0 +1,36 @@
+"""
+Directorio de usuarios: un error de lectura no queda en caché
+"""
+import pytest
+from utils.user_directory import buscar_usuario, invalidar_directorio
+from config.settings import COLUMNAS_USUARIOS
+
+
+class HojaUsuarios:
+    """Hoja de usuarios en memoria que puede fallar a pedido"""
+
+    title = "usuarios"
+
+    def __init__(self):
+        self.falla = False
+        self.lecturas = 0
+
+    def get_all_values(self):
+        self.lecturas += 1
+        if self.falla:
+            raise RuntimeError("429 Quota exceeded")
+        return [COLUMNAS_USUARIOS, ["admin", "clave", "Admin", "admin", "SI"]]
+
+
+def test_error_de_lectura_no_se_cachea():
+    invalidar_directorio()
+    hoja = HojaUsuarios()
+    hoja.falla = True
+    with pytest.raises(RuntimeError):
+        buscar_usuario(hoja, "admin")
+
+    # La siguiente llamada vuelve a leer la hoja en lugar de usar un directorio vacío
+    hoja.falla = False
+    usuario = buscar_usuario(hoja, "admin")
+    assert usuario["username"] == "admin"
+    assert hoja.lecturas == 2
@@ -0,0 +1,209 @@
+"""
+Archivo de reclamos resueltos
+Los reclamos resueltos hace tiempo pasan de la hoja de reclamos a una hoja de
+archivo (con un ID derivado de su contenido), así la carga de cada snapshot se mantiene chica;
+el historial por cliente los consulta a demanda. Cada sucursal archiva en su
+propia planilla
+"""
+import hashlib
+from datetime import datetime, timedelta
+import pandas as pd
+import pytz
+import streamlit as st
+from utils.api_manager import api_manager
+from utils.data_manager import parsear_fechas, safe_normalize
+from utils.sheets import conectar_sucursales, hojas_sucursal
+from utils.snapshot import cargar_datos
+from config.settings import (
+    COLUMNAS_ARCHIVO, COLUMNAS_RECLAMOS, SUCURSALES, WORKSHEET_ARCHIVO, WORKSHEET_RECLAMOS
+)
+
+def ids_reclamos(df):
+    """
+    ID de cada reclamo (no depende de la fila que ocupa en la hoja)
+
+    Huella de la fila completa más su orden entre filas idénticas, así dos
+    reclamos repetidos no comparten ID. La hoja de reclamos no tiene columna
+    de ID: se calcula al archivar y solo queda guardado en el archivo. Si un
+    reclamo copiado al archivo pero no borrado se edita antes del reintento,
+    cambia su ID y el archivo termina con las dos versiones
+    """
+    textos = df[COLUMNAS_RECLAMOS].fillna("").astype(str).apply(lambda c: c.str.strip())
+    huellas = ["|".join(fila) for fila in textos.values.tolist()]
+    ordinales = pd.Series(huellas).groupby(huellas).cumcount()
+    return [
+        f"{hashlib.sha1(huella.encode()).hexdigest()[:12]}-{ordinal}"
+        for huella, ordinal in zip(huellas, ordinales)
+    ]
+
+
+def para_archivar(df_reclamos, dias, ahora):
+    """
+    Reclamos resueltos hace más de `dias` días
+
+    Se toma la fecha de resolución y, si falta, la fecha del reclamo
+    """
+    resueltos = df_reclamos[df_reclamos["Estado"] == "Resuelto"]
+    referencia = parsear_fechas(resueltos["Fecha de resolución"].fillna(""))
+    referencia = referencia.fillna(parsear_fechas(resueltos["Fecha y hora"].fillna("")))
+    return resueltos[referencia < ahora - timedelta(days=dias)]
+
+
+def _rangos_descendentes(filas):
+    """Agrupa filas (base 0 de la hoja) en rangos contiguos, del último al primero"""
+    rangos = []
+    for fila in sorted(filas, reverse=True):
+        if rangos and rangos[-1][0] == fila + 1:
+            rangos[-1][0] = fila
+        else:
+            rangos.append([fila, fila + 1])
+    return rangos
+
+
+def obtener_hoja_archivo(sucursal):
+    """Hoja de archivo de una sucursal (se crea con su encabezado la primera vez)"""
+    hojas = conectar_sucursales()[sucursal]
+    if WORKSHEET_ARCHIVO not in hojas:
+        planilla = hojas[WORKSHEET_RECLAMOS].spreadsheet
+        hoja, error = api_manager.safe_sheet_operation(
+            planilla.add_worksheet, WORKSHEET_ARCHIVO, rows=1, cols=len(COLUMNAS_ARCHIVO)
+        )
+        if error:
+            raise RuntimeError(f"No se pudo crear la hoja de archivo: {error}")
+        api_manager.safe_sheet_operation(hoja.append_row, COLUMNAS_ARCHIVO)
+        hojas[WORKSHEET_ARCHIVO] = hoja
+    return hojas[WORKSHEET_ARCHIVO]
+
+
+def _archivar_sucursal(sucursal, dias, ahora):
+    """
+    Mueve al archivo de la sucursal sus reclamos resueltos hace más de `dias` días
+
+    Primero se agregan al archivo y recién después se borran de la hoja de
+    reclamos; si algo falla a mitad de camino, los IDs ya archivados evitan
+    duplicarlos en el próximo intento. Antes de borrar se relee la hoja y se
+    confirma que cada posición siga teniendo el mismo reclamo (la API no tiene
+    borrado condicional: solo queda la ventana entre esa lectura y el borrado)
+
+    Returns:
+        int: cantidad de reclamos archivados
+    """
+    sheet_reclamos, _ = hojas_sucursal(sucursal)
+    # Lectura fresca: las filas a borrar tienen que coincidir con la hoja actual
+    valores, error = api_manager.safe_sheet_operation(sheet_reclamos.get_all_values)
+    if error:
+        raise RuntimeError(f"Error al leer reclamos ({sucursal}): {error}")
+    if len(valores) <= 1:
+        return 0
+    df = pd.DataFrame(valores[1:], columns=valores[0]).reindex(columns=COLUMNAS_RECLAMOS)
+
+    viejos = para_archivar(df, dias, ahora.replace(tzinfo=None))
+    if viejos.empty:
+        return 0
+
+    hoja_archivo = obtener_hoja_archivo(sucursal)
+    ya_archivados, error = api_manager.safe_sheet_operation(hoja_archivo.col_values, 1)
+    if error:
+        raise RuntimeError(f"Error al leer el archivo ({sucursal}): {error}")
+    ya_archivados = set(ya_archivados)
+
+    fecha_archivo = ahora.strftime("%d/%m/%Y %H:%M:%S")
+    ids = ids_reclamos(viejos)
+    filas_archivo = [
+        [id_reclamo] + fila + [fecha_archivo]
+        for id_reclamo, fila in zip(ids, viejos.fillna("").astype(str).values.tolist())
+        if id_reclamo not in ya_archivados
+    ]
+    if filas_archivo:
+        _, error = api_manager.safe_sheet_operation(
+            hoja_archivo.append_rows, filas_archivo, value_input_option="RAW", is_batch=True
+        )
+        if error:
+            raise RuntimeError(f"Error al escribir el archivo ({sucursal}): {error}")
+
+    # Solo se borran las filas que quedaron en el archivo (recién copiadas o de un intento previo)
+    en_archivo = ya_archivados | {fila[0] for fila in filas_archivo}
+    archivadas = viejos.index[[id_reclamo in en_archivo for id_reclamo in ids]]
+
+    # Otra escritura pudo correr filas desde la primera lectura: se borra solo si no cambió nada
+    actuales, error = api_manager.safe_sheet_operation(sheet_reclamos.get_all_values)
+    if error:
+        raise RuntimeError(f"Error al releer reclamos ({sucursal}): {error}")
+    df_actual = pd.DataFrame(actuales[1:], columns=actuales[0]).reindex(columns=COLUMNAS_RECLAMOS)
+    if not df_actual.reindex(archivadas).fillna("").astype(str).equals(df.loc[archivadas].fillna("").astype(str)):
+        raise RuntimeError(
+            f"La hoja de reclamos de {sucursal} cambió mientras se archivaba. Los reclamos ya están "
+            "en el archivo y se sacan de la hoja en el próximo intento."
+        )
+
+    # +1: encabezado; rangos de abajo hacia arriba para que los índices sigan valiendo
+    pedidos = [
+        {"deleteDimension": {"range": {
+            "sheetId": sheet_reclamos.id, "dimension": "ROWS", "startIndex": desde, "endIndex": hasta
+        }}}
+        for desde, hasta in _rangos_descendentes(archivadas + 1)
+    ]
+    _, error = api_manager.safe_sheet_operation(
+        sheet_reclamos.spreadsheet.batch_update, {"requests": pedidos}, is_batch=True
+    )
+    # Las filas de abajo se corrieron: ningún snapshot anterior sirve para escribir por posición
+    cargar_datos.clear()
+    if error:
+        raise RuntimeError(f"Los reclamos de {sucursal} se copiaron al archivo pero no se pudieron borrar: {error}")
+    return len(archivadas)
+
+
+def archivar_reclamos(dias, al_avanzar):
+    """Trabajo en segundo plano: archiva los resueltos hace más de `dias` días en cada sucursal"""
+    ahora = datetime.now(pytz.timezone("America/Argentina/Buenos_Aires"))
+    total = 0
+    try:
+        for paso, sucursal in enumerate(SUCURSALES):
+            al_avanzar(paso, len(SUCURSALES) + 1, f"Archivando reclamos de {sucursal}...")
+            total += _archivar_sucursal(sucursal, dias, ahora)
+    finally:
+        cargar_archivo.clear()
+
+    if not total:
+        return {"mensaje": f"📦 No hay reclamos resueltos hace más de {dias} días."}
+    return {"mensaje": f"📦 {total} reclamos archivados."}
+
+
+class ArchivoReclamos:
+    """Reclamos archivados agrupados por cliente (sucursal, Nº Cliente)"""
+
+    def __init__(self, df):
+        self.df = df
+        self._por_cliente = df.groupby(["Sucursal", "Nº Cliente"]).indices if not df.empty else {}
+
+    def __len__(self):
+        return len(self.df)
+
+    def de_cliente(self, sucursal, nro_cliente):
+        """Reclamos archivados de un cliente de una sucursal"""
+        posiciones = self._por_cliente.get((sucursal, nro_cliente))
+        return self.df.iloc[posiciones] if posiciones is not None else self.df.iloc[0:0]
+
+
+def _leer_archivo(sucursal, hojas):
+    """Reclamos archivados de una sucursal (vacío si todavía no tiene archivo)"""
+    if WORKSHEET_ARCHIVO not in hojas:
+        return pd.DataFrame(columns=COLUMNAS_ARCHIVO)
+    valores, error = api_manager.safe_sheet_operation(hojas[WORKSHEET_ARCHIVO].get_all_values)
+    if error:
+        # Se propaga: un error no queda en la caché (vaciaría el archivo por una hora)
+        raise RuntimeError(f"Error al leer el archivo ({sucursal}): {error}")
+    if len(valores) <= 1:
+        return pd.DataFrame(columns=COLUMNAS_ARCHIVO)
+    return pd.DataFrame(valores[1:], columns=valores[0]).reindex(columns=COLUMNAS_ARCHIVO)
+
+
+@st.cache_resource(ttl=3600, show_spinner="Cargando reclamos archivados...")
+def cargar_archivo():
+    """Lee las hojas de archivo una vez por hora (o tras archivar), solo cuando se consulta"""
+    df = pd.concat(
+        [_leer_archivo(sucursal, hojas).assign(Sucursal=sucursal)
+         for sucursal, hojas in conectar_sucursales().items()],
+        ignore_index=True
+    )
+    return ArchivoReclamos(safe_normalize(df, "Nº Cliente"))
@@ -0,0 +1,194 @@
+"""
+Búsqueda de texto libre en reclamos (Detalles, Tipo de reclamo y Dirección)
+Índice invertido compartido por proceso que se mantiene al día fila por fila:
+al cambiar el snapshot solo se reindexan las filas cuyo hash cambió
+"""
+import threading
+from collections import Counter
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.client_search import plegar
+
+COLUMNAS_TEXTO_RECLAMO = ["Detalles", "Tipo de reclamo", "Dirección"]
+MAX_PREFIJOS = 50  # palabras del vocabulario que puede expandir la última palabra
+BM25_K1, BM25_B = 1.2, 0.75
+
+
+class ClaimSearchIndex:
+    """Índice invertido (palabra → {fila: frecuencia}) con ranking BM25"""
+
+    def __init__(self):
+        self.version = None
+        self._lock = threading.RLock()
+        self._postings = {}
+        self._palabras_de = {}  # fila → Counter de palabras (para poder quitarla)
+        self._hashes = np.zeros(0, dtype=np.uint64)
+        self._largos = np.zeros(0)
+        self._vocabulario = None  # ordenado, se arma a demanda tras cambios
+        self._arrays = {}  # palabra → (filas, frecuencias) como arrays
+
+    def _quitar(self, fila):
+        for palabra in self._palabras_de.pop(fila, ()):
+            filas = self._postings[palabra]
+            del filas[fila]
+            if not filas:
+                del self._postings[palabra]
+                self._vocabulario = None
+            self._arrays.pop(palabra, None)
+        self._largos[fila] = 0
+
+    def _agregar(self, fila, texto):
+        palabras = Counter(plegar(texto).split())
+        self._palabras_de[fila] = palabras
+        for palabra, frecuencia in palabras.items():
+            if palabra not in self._postings:
+                self._postings[palabra] = {}
+                self._vocabulario = None
+            self._postings[palabra][fila] = frecuencia
+            self._arrays.pop(palabra, None)
+        self._largos[fila] = sum(palabras.values())
+
+    def sincronizar(self, df_reclamos, version):
+        """
+        Pone el índice al día con un snapshot reindexando solo las filas cambiadas
+
+        Returns:
+            int: cantidad de filas reindexadas
+        """
+        if version == self.version:
+            return 0
+        columnas = [c for c in COLUMNAS_TEXTO_RECLAMO if c in df_reclamos.columns]
+        textos = df_reclamos[columnas].fillna("").astype(str)
+        hashes = pd.util.hash_pandas_object(textos, index=False).to_numpy()
+
+        with self._lock:
+            if version == self.version:
+                return 0
+            anteriores, total = len(self._hashes), len(hashes)
+            comunes = min(anteriores, total)
+            cambiadas = np.flatnonzero(self._hashes[:comunes] != hashes[:comunes]).tolist()
+
+            for fila in range(total, anteriores):
+                self._quitar(fila)
+            largos = np.zeros(total)
+            largos[:comunes] = self._largos[:comunes]
+            self._largos = largos
+
+            valores = [textos[c].to_numpy() for c in columnas]
+            for fila in cambiadas:
+                self._quitar(fila)
+                self._agregar(fila, " ".join(v[fila] for v in valores))
+            for fila in range(comunes, total):
+                self._agregar(fila, " ".join(v[fila] for v in valores))
+
+            self._hashes = hashes
+            self.version = version
+            return len(cambiadas) + max(total - anteriores, 0)
+
+    def _array(self, palabra):
+        if palabra not in self._arrays:
+            filas = self._postings[palabra]
+            self._arrays[palabra] = (
+                np.fromiter(filas.keys(), dtype=np.int64, count=len(filas)),
+                np.fromiter(filas.values(), dtype=float, count=len(filas)),
+            )
+        return self._arrays[palabra]
+
+    def _palabras_para(self, palabra, es_ultima):
+        """Palabras del vocabulario que cubren una palabra de la consulta"""
+        if not es_ultima:
+            return [palabra] if palabra in self._postings else []
+        if self._vocabulario is None:
+            self._vocabulario = np.array(sorted(self._postings), dtype=object)
+        desde = np.searchsorted(self._vocabulario, palabra, side="left")
+        hasta = np.searchsorted(self._vocabulario, palabra + "\uffff", side="left")
+        return self._vocabulario[desde:min(hasta, desde + MAX_PREFIJOS)].tolist()
+
+    def buscar(self, consulta, candidatas=None, limite=50):
+        """
+        Filas que contienen todas las palabras de la consulta (la última también por prefijo)
+
+        Args:
+            consulta: texto libre ("fibra cortada")
+            candidatas: máscara booleana opcional por fila (filtros de sector/fecha)
+            limite: cantidad máxima de resultados
+
+        Returns:
+            list: [(fila, puntaje)] de mayor a menor puntaje
+        """
+        palabras = plegar(consulta).split()
+        with self._lock:
+            total = len(self._largos)
+            if not palabras or not total:
+                return []
+            promedio = max(self._largos.mean(), 1.0)
+            normalizacion = BM25_K1 * (1 - BM25_B + BM25_B * self._largos / promedio)
+
+            puntaje_total = np.zeros(total)
+            coinciden = np.ones(total, dtype=bool) if candidatas is None else candidatas.copy()
+            for i, palabra in enumerate(palabras):
+                puntaje = np.zeros(total)
+                for termino in self._palabras_para(palabra, i == len(palabras) - 1):
+                    filas, frecuencias = self._array(termino)
+                    idf = np.log(1 + (total - len(filas) + 0.5) / (len(filas) + 0.5))
+                    valor = idf * frecuencias * (BM25_K1 + 1) / (frecuencias + normalizacion[filas])
+                    puntaje[filas] = np.maximum(puntaje[filas], valor)
+                coinciden &= puntaje > 0
+                if not coinciden.any():
+                    return []
+                puntaje_total += puntaje
+
+        filas = np.flatnonzero(coinciden)
+        # Mayor puntaje primero; a igual puntaje, el reclamo más nuevo (fila más baja en la hoja)
+        orden = np.lexsort((-filas, -puntaje_total[filas]))[:limite]
+        return [(int(filas[i]), float(puntaje_total[filas[i]])) for i in orden]
+
+    def buscar_en(self, df_reclamos, version, consulta, candidatas=None, limite=50):
+        """
+        Sincroniza con un snapshot y busca sin soltar el índice en el medio
+
+        Si otra sesión sincronizara con otra versión entre los dos pasos, las
+        filas devueltas serían posiciones de otro DataFrame
+        """
+        with self._lock:
+            self.sincronizar(df_reclamos, version)
+            return self.buscar(consulta, candidatas, limite)
+
+
+@st.cache_resource
+def obtener_indice_reclamos():
+    """Instancia única por proceso"""
+    return ClaimSearchIndex()
+
+
+def buscar_reclamos(snapshot, consulta, sectores=None, desde=None, hasta=None, limite=50):
+    """
+    Busca en los reclamos del snapshot con filtros opcionales de sector y fecha
+
+    Returns:
+        DataFrame: reclamos encontrados con la columna 'Puntaje', ordenados por relevancia
+    """
+    # La versión antes que el DataFrame: si entra un parche en el medio, la
+    # próxima búsqueda vuelve a sincronizar
+    version = snapshot.version
+    df = snapshot.df_reclamos
+
+    candidatas = None
+    if sectores:
+        candidatas = df["Sector"].astype(str).isin(sectores).to_numpy()
+    if (desde or hasta) and snapshot.fechas_reclamos is not None:
+        fechas = snapshot.fechas_reclamos
+        en_rango = fechas.notna()
+        if desde:
+            en_rango = en_rango & (fechas >= pd.Timestamp(desde))
+        if hasta:
+            en_rango = en_rango & (fechas < pd.Timestamp(hasta) + pd.Timedelta(days=1))
+        en_rango = en_rango.to_numpy()
+        candidatas = en_rango if candidatas is None else candidatas & en_rango
+
+    resultados = obtener_indice_reclamos().buscar_en(df, version, consulta, candidatas, limite)
+    encontrados = df.iloc[[fila for fila, _ in resultados]].copy()
+    encontrados["Puntaje"] = [round(puntaje, 2) for _, puntaje in resultados]
+    return encontrados
+
@@ -0,0 +1,129 @@
+"""
+Cubo pre-agregado de reclamos por día × tipo × sector × técnico
+Permite consultar tendencias históricas sin recorrer las filas crudas
+"""
+from collections import Counter
+import threading
+import pandas as pd
+from utils.claims_stats import equipo_de
+
+DIMENSIONES_CUBO = ["fecha", "Tipo de reclamo", "Sector", "Técnico"]
+
+
+def _clave(fila):
+    fecha = fila.get("fecha")
+    if fecha is None or pd.isna(fecha):
+        return None
+    return (
+        fecha.normalize(),
+        fila.get("Tipo de reclamo") or "",
+        fila.get("Sector") or "",
+        ", ".join(equipo_de(fila.get("Técnico"))),
+    )
+
+
+class ClaimsCube:
+    """
+    Conteos de reclamos (total y resueltos) por celda del cubo
+
+    La dimensión 'Técnico' guarda el equipo asignado ("Juan, Maxi") para que
+    las sumas no dupliquen reclamos; las consultas por técnico lo expanden.
+    """
+
+    def __init__(self):
+        self._total = Counter()
+        self._resueltos = Counter()
+        self._df = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def desde_df(cls, df_reclamos, fechas):
+        """Construye el cubo agrupando el snapshot completo"""
+        cubo = cls()
+        if df_reclamos.empty:
+            return cubo
+
+        tecnicos = df_reclamos["Técnico"].fillna("").astype(str)
+        equipos = {t: ", ".join(equipo_de(t)) for t in tecnicos.unique()}
+        base = pd.DataFrame({
+            "fecha": fechas.dt.normalize(),
+            "Tipo de reclamo": df_reclamos["Tipo de reclamo"].fillna(""),
+            "Sector": df_reclamos["Sector"].fillna(""),
+            "Técnico": tecnicos.map(equipos),
+            "resuelto": (df_reclamos["Estado"] == "Resuelto").astype(int),
+        }).dropna(subset=["fecha"])
+
+        agregado = base.groupby(DIMENSIONES_CUBO, sort=False)["resuelto"].agg(["size", "sum"])
+        cubo._total.update(agregado["size"].to_dict())
+        cubo._resueltos.update({k: v for k, v in agregado["sum"].to_dict().items() if v})
+        return cubo
+
+    def actualizar(self, anterior, nuevo):
+        """Aplica el cambio de una fila (dicts con fecha, tipo, sector, técnico y estado)"""
+        with self._lock:
+            for fila, signo in ((anterior, -1), (nuevo, +1)):
+                clave = _clave(fila) if fila else None
+                if clave is None:
+                    continue
+                self._total[clave] += signo
+                if fila.get("Estado") == "Resuelto":
+                    self._resueltos[clave] += signo
+            self._total += Counter()
+            self._resueltos += Counter()
+            self._df = None
+
+    def a_dataframe(self):
+        """Celdas del cubo como DataFrame (se cachea hasta el próximo cambio)"""
+        with self._lock:
+            if self._df is None:
+                filas = [
+                    (*clave, total, self._resueltos.get(clave, 0))
+                    for clave, total in self._total.items()
+                ]
+                self._df = pd.DataFrame(filas, columns=DIMENSIONES_CUBO + ["total", "resueltos"])
+            return self._df
+
+    def _filtrar(self, desde=None, hasta=None, filtros=None):
+        df = self.a_dataframe()
+        mascara = pd.Series(True, index=df.index)
+        if desde is not None:
+            mascara &= df["fecha"] >= pd.Timestamp(desde)
+        if hasta is not None:
+            mascara &= df["fecha"] <= pd.Timestamp(hasta)
+        for dim, valores in (filtros or {}).items():
+            if valores:
+                mascara &= df[dim].isin(valores)
+        return df[mascara]
+
+    def valores(self, dimension):
+        """Valores distintos de una dimensión"""
+        return sorted(self.a_dataframe()[dimension].unique())
+
+    def serie_diaria(self, por=None, desde=None, hasta=None, filtros=None, medida="total"):
+        """
+        Reclamos por día, opcionalmente abiertos por una dimensión
+
+        Returns:
+            DataFrame con índice de fechas (días sin reclamos en cero)
+        """
+        df = self._filtrar(desde, hasta, filtros)
+        if df.empty:
+            return pd.DataFrame()
+
+        if por:
+            serie = df.pivot_table(index="fecha", columns=por, values=medida, aggfunc="sum", fill_value=0)
+        else:
+            serie = df.groupby("fecha")[[medida]].sum()
+
+        dias = pd.date_range(desde or serie.index.min(), hasta or serie.index.max(), freq="D")
+        return serie.reindex(dias, fill_value=0)
+
+    def por_tecnico(self, desde=None, hasta=None, filtros=None):
+        """Reclamos asignados y resueltos por técnico individual"""
+        df = self._filtrar(desde, hasta, filtros)
+        df = df[df["Técnico"] != ""]
+        if df.empty:
+            return pd.DataFrame(columns=["total", "resueltos"])
+
+        df = df.assign(Técnico=df["Técnico"].str.split(", ")).explode("Técnico")
+        return df.groupby("Técnico")[["total", "resueltos"]].sum().sort_values("resueltos", ascending=False)
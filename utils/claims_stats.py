@@ -0,0 +1,96 @@
+"""
+Agregados de reclamos mantenidos en forma incremental
+Alimentan el dashboard de métricas y el resumen de la jornada
+"""
+from collections import Counter
+import pandas as pd
+from utils.data_manager import separar_tecnicos
+
+
+def equipo_de(tecnico):
+    """Tupla ordenada de técnicos asignados (identifica al equipo)"""
+    return tuple(sorted(t.capitalize() for t in separar_tecnicos(tecnico)))
+
+
+class ClaimStats:
+    """
+    Conteos por estado, por día de carga y por equipo en curso
+
+    Otras sesiones recorren los contadores sin lock: los cambios se aplican
+    sobre una copia (ver copia) que después reemplaza a la publicada
+    """
+
+    def __init__(self):
+        self.por_estado = Counter()
+        self.por_fecha = Counter()
+        self.equipos_en_curso = Counter()
+
+    @classmethod
+    def desde_df(cls, df_reclamos, fechas):
+        """Construye los agregados a partir del snapshot completo"""
+        stats = cls()
+        if df_reclamos.empty:
+            return stats
+
+        stats.por_estado.update(df_reclamos["Estado"].fillna("").value_counts().to_dict())
+        stats.por_fecha.update(fechas.dropna().dt.date.value_counts().to_dict())
+
+        en_curso = df_reclamos.loc[df_reclamos["Estado"] == "En curso", "Técnico"]
+        equipos = (equipo_de(t) for t in en_curso)
+        stats.equipos_en_curso.update(e for e in equipos if e)
+        return stats
+
+    def copia(self):
+        """Agregados independientes de este objeto, para parchear sin afectar a los lectores"""
+        stats = ClaimStats()
+        stats.por_estado = Counter(self.por_estado)
+        stats.por_fecha = Counter(self.por_fecha)
+        stats.equipos_en_curso = Counter(self.equipos_en_curso)
+        return stats
+
+    def _aplicar(self, fila, signo):
+        estado = fila.get("Estado") or ""
+        self.por_estado[estado] += signo
+        if estado == "En curso":
+            equipo = equipo_de(fila.get("Técnico"))
+            if equipo:
+                self.equipos_en_curso[equipo] += signo
+        fecha = fila.get("fecha")
+        if fecha is not None and not pd.isna(fecha):
+            self.por_fecha[fecha.date()] += signo
+
+    def actualizar(self, anterior, nuevo):
+        """
+        Aplica el cambio de una fila a los agregados
+
+        Args:
+            anterior: dict con 'Estado', 'Técnico' y 'fecha' antes del cambio (o None)
+            nuevo: dict con los mismos campos después del cambio (o None)
+        """
+        if anterior:
+            self._aplicar(anterior, -1)
+        if nuevo:
+            self._aplicar(nuevo, +1)
+        # Evitar que queden claves en cero
+        for contador in (self.por_estado, self.por_fecha, self.equipos_en_curso):
+            contador += Counter()
+
+    @property
+    def pendientes(self):
+        return self.por_estado["Pendiente"]
+
+    @property
+    def en_curso(self):
+        return self.por_estado["En curso"]
+
+    @property
+    def resueltos(self):
+        return self.por_estado["Resuelto"]
+
+    @property
+    def total_activos(self):
+        return self.pendientes + self.en_curso
+
+    def cargados_el(self, fecha):
+        """Cantidad de reclamos cargados en una fecha"""
+        return self.por_fecha[fecha]
@@ -0,0 +1,134 @@
+"""
+Búsqueda de clientes por número, nombre o dirección
+Índice por snapshot: números ordenados (búsqueda por prefijo) más un índice
+invertido de palabras de Nombre y Dirección, sin acentos, con prefijos y
+coincidencia aproximada por trigramas
+"""
+import re
+import unicodedata
+import numpy as np
+import streamlit as st
+
+SIMILITUD_MINIMA = 0.45  # Dice de trigramas para aceptar una palabra aproximada
+MAX_PALABRAS_APROXIMADAS = 20
+PUNTAJE_EXACTO, PUNTAJE_PREFIJO, PUNTAJE_APROXIMADO = 3.0, 2.0, 1.0
+
+
+def plegar(texto):
+    """Minúsculas, sin acentos y solo letras/números separados por espacios"""
+    texto = unicodedata.normalize("NFKD", str(texto))
+    texto = "".join(c for c in texto if not unicodedata.combining(c)).casefold()
+    return re.sub(r"[^0-9a-zñ]+", " ", texto).strip()
+
+
+def _trigramas(palabra):
+    relleno = f"${palabra}$"
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+
+class ClientSearchIndex:
+    """Índice de búsqueda sobre la hoja de clientes (posiciones de fila)"""
+
+    def __init__(self, df_clientes):
+        self.total = len(df_clientes)
+        numeros = df_clientes["Nº Cliente"].fillna("").astype(str).str.strip().to_numpy()
+        orden = np.argsort(numeros, kind="stable")
+        self._numeros = numeros[orden]
+        self._pos_numeros = orden
+        # El Nº Cliente se repite entre sucursales: número → filas (una por sucursal)
+        self._posiciones_de = {}
+        for i, n in enumerate(numeros):
+            if n:
+                self._posiciones_de.setdefault(n, []).append(i)
+
+        # Palabra → filas que la contienen (Nombre y Dirección)
+        textos = (
+            df_clientes["Nombre"].fillna("").astype(str) + " " +
+            df_clientes["Dirección"].fillna("").astype(str)
+        ).map(plegar)
+        postings = {}
+        for fila, texto in enumerate(textos):
+            for palabra in set(texto.split()):
+                postings.setdefault(palabra, []).append(fila)
+
+        self._vocabulario = np.array(sorted(postings), dtype=object)
+        self._postings = [np.array(postings[p], dtype=np.int64) for p in self._vocabulario]
+
+        # Trigrama → palabras del vocabulario (para coincidencias aproximadas)
+        por_trigrama = {}
+        self._cant_trigramas = np.zeros(len(self._vocabulario), dtype=np.int32)
+        for i, palabra in enumerate(self._vocabulario):
+            trigramas = _trigramas(palabra)
+            self._cant_trigramas[i] = len(trigramas)
+            for t in trigramas:
+                por_trigrama.setdefault(t, []).append(i)
+        self._por_trigrama = {t: np.array(ids, dtype=np.int64) for t, ids in por_trigrama.items()}
+
+    def posiciones(self, numero):
+        """Filas de un Nº Cliente exacto, una por cada sucursal que lo tiene"""
+        return self._posiciones_de.get(str(numero).strip(), [])
+
+    def por_prefijo_numero(self, prefijo, limite=10):
+        """Filas cuyos Nº Cliente empiezan con el prefijo (orden por número)"""
+        desde = np.searchsorted(self._numeros, prefijo, side="left")
+        hasta = np.searchsorted(self._numeros, prefijo + "\uffff", side="left")
+        return self._pos_numeros[desde:min(hasta, desde + limite)].tolist()
+
+    def _palabras_candidatas(self, palabra):
+        """(ids del vocabulario, puntajes) que coinciden con una palabra de la consulta"""
+        desde = np.searchsorted(self._vocabulario, palabra, side="left")
+        hasta = np.searchsorted(self._vocabulario, palabra + "\uffff", side="left")
+        ids = list(range(desde, hasta))
+        puntajes = [PUNTAJE_EXACTO if self._vocabulario[i] == palabra else PUNTAJE_PREFIJO for i in ids]
+
+        if len(palabra) >= 3:
+            trigramas = [self._por_trigrama[t] for t in _trigramas(palabra) if t in self._por_trigrama]
+            if trigramas:
+                compartidos = np.bincount(np.concatenate(trigramas), minlength=len(self._vocabulario))
+                dice = 2 * compartidos / (self._cant_trigramas + len(_trigramas(palabra)))
+                aproximadas = np.flatnonzero(dice >= SIMILITUD_MINIMA)
+                aproximadas = aproximadas[np.argsort(-dice[aproximadas])][:MAX_PALABRAS_APROXIMADAS]
+                ya_incluidas = set(ids)
+                for i in aproximadas:
+                    if i not in ya_incluidas:
+                        ids.append(int(i))
+                        puntajes.append(PUNTAJE_APROXIMADO * float(dice[i]))
+        return ids, puntajes
+
+    def buscar(self, consulta, limite=10):
+        """
+        Filas que coinciden con todas las palabras de la consulta, mejor puntaje primero
+
+        Un número busca además por prefijo de Nº Cliente (esos resultados van primero)
+        """
+        consulta = plegar(consulta)
+        if not consulta or not self.total:
+            return []
+
+        resultado = []
+        if consulta.isdigit():
+            resultado = self.por_prefijo_numero(consulta, limite)
+
+        puntaje_total = np.zeros(self.total)
+        coinciden = np.ones(self.total, dtype=bool)
+        for palabra in consulta.split():
+            puntaje = np.zeros(self.total)
+            for i, valor in zip(*self._palabras_candidatas(palabra)):
+                filas = self._postings[i]
+                puntaje[filas] = np.maximum(puntaje[filas], valor)
+            coinciden &= puntaje > 0
+            puntaje_total += puntaje
+
+        filas = np.flatnonzero(coinciden)
+        if len(filas):
+            mejores = filas[np.argsort(-puntaje_total[filas], kind="stable")][:limite]
+            ya_incluidas = set(resultado)
+            resultado += [int(f) for f in mejores if int(f) not in ya_incluidas]
+        return resultado[:limite]
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def obtener_indice_clientes(_df_clientes, version):
+    """Devuelve el índice de búsqueda de clientes de un snapshot (cacheado por versión)"""
+    return ClientSearchIndex(_df_clientes)
+
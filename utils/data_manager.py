@@ -2,37 +2,40 @@
 Gestor de datos para operaciones con Google Sheets
 Versión mejorada con manejo robusto de datos
 """
+import hashlib
 import pandas as pd
 import streamlit as st
 from utils.api_manager import api_manager
 
+def leer_hoja(sheet, expected_columns):
+    """
+    Lee una hoja como DataFrame con las columnas esperadas
+
+    Lanza RuntimeError si falla la lectura (sirve desde hilos sin contexto de Streamlit)
+    """
+    # Obtener todos los valores como lista de listas
+    data, error = api_manager.safe_sheet_operation(sheet.get_all_values)
+    if error:
+        raise RuntimeError(f"Error al obtener datos de '{sheet.title}': {error}")
+
+    # Si no hay datos, devolver DataFrame vacío con columnas esperadas
+    if len(data) <= 1:  # Solo encabezado o vacío
+        return pd.DataFrame(columns=expected_columns)
+
+    # Crear DataFrame con los datos
+    df = pd.DataFrame(data[1:], columns=data[0])
+
+    # Asegurar que tenemos todas las columnas esperadas
+    for col in expected_columns:
+        if col not in df.columns:
+            df[col] = None  # Agregar columna faltante con valores nulos
+
+    return df[expected_columns]  # Devolver solo las columnas esperadas en el orden correcto
+
 def safe_get_sheet_data(sheet, expected_columns):
     """Carga datos de una hoja de forma segura"""
     try:
-        # Obtener todos los valores como lista de listas
-        data, error = api_manager.safe_sheet_operation(sheet.get_all_values)
-        if error:
-            st.error(f"Error al obtener datos: {error}")
-            return pd.DataFrame(columns=expected_columns)
-        
-        # Si no hay datos, devolver DataFrame vacío con columnas esperadas
-        if len(data) <= 1:  # Solo encabezado o vacío
-            return pd.DataFrame(columns=expected_columns)
-        
-        # Crear DataFrame con los datos
-        headers = data[0]
-        rows = data[1:]
-        
-        # Crear DataFrame
-        df = pd.DataFrame(rows, columns=headers)
-        
-        # Asegurar que tenemos todas las columnas esperadas
-        for col in expected_columns:
-            if col not in df.columns:
-                df[col] = None  # Agregar columna faltante con valores nulos
-        
-        return df[expected_columns]  # Devolver solo las columnas esperadas en el orden correcto
-        
+        return leer_hoja(sheet, expected_columns)
     except Exception as e:
         st.error(f"Error crítico al cargar datos: {str(e)}")
         return pd.DataFrame(columns=expected_columns)
@@ -45,6 +48,34 @@ def safe_normalize(df, column):
         )
     return df
 
+def parsear_fechas(serie):
+    """Convierte la columna 'Fecha y hora' (dd/mm/aaaa hh:mm:ss) a datetime"""
+    fechas = pd.to_datetime(serie, format="%d/%m/%Y %H:%M:%S", errors="coerce")
+    faltantes = fechas.isna() & serie.notna()
+    if faltantes.any():
+        # Formatos alternativos cargados a mano en la hoja
+        fechas[faltantes] = pd.to_datetime(serie[faltantes], dayfirst=True, errors="coerce")
+    return fechas
+
+def separar_tecnicos(valor):
+    """Separa el campo 'Técnico' (nombres unidos por coma) en una lista limpia"""
+    if valor is None or (isinstance(valor, float) and pd.isna(valor)):
+        return []
+    return [t.strip() for t in str(valor).split(",") if t.strip()]
+
+def letra_columna(columnas, columna):
+    """Devuelve la letra de la hoja (A, B, ...) de una columna por su nombre"""
+    return chr(ord("A") + columnas.index(columna))
+
+def calcular_version(*dfs):
+    """Calcula una huella corta de los datos para versionar el snapshot"""
+    huella = hashlib.sha1()
+    for df in dfs:
+        huella.update(str(df.shape).encode())
+        if not df.empty:
+            huella.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return huella.hexdigest()[:16]
+
 def update_sheet_data(sheet, data, is_batch=True):
     """Actualiza datos en una hoja con control de rate limiting"""
     try:
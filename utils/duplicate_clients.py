@@ -0,0 +1,154 @@
+"""
+Detección de clientes duplicados
+Solo se comparan clientes que comparten una clave de bloqueo (teléfono,
+dirección normalizada o número de puerta + calle), no todos contra todos
+"""
+import re
+from difflib import SequenceMatcher
+from itertools import combinations
+import pandas as pd
+import streamlit as st
+from utils.client_search import plegar
+
+UMBRAL_DUPLICADO = 0.75
+MAX_BLOQUE = 50  # bloques más grandes (ej. teléfonos de relleno) no discriminan
+DIGITOS_TELEFONO = 7  # se ignoran prefijos de área y el 15
+PALABRAS_IGNORADAS = {
+    "av", "avda", "avenida", "calle", "c", "bv", "bvar", "bulevar", "boulevard", "pje", "pasaje",
+    "n", "no", "nro", "numero", "de", "del", "la", "el", "los", "las", "barrio", "bo", "b", "s",
+}
+
+
+def normalizar_direccion(direccion):
+    """Dirección sin acentos, abreviaturas ni palabras de relleno ("AV. SAN MARTÍN Nº 12" → "san martin 12")"""
+    return " ".join(p for p in plegar(direccion).split() if p not in PALABRAS_IGNORADAS)
+
+
+def normalizar_telefono(telefono):
+    """Últimos dígitos del teléfono ("" si es demasiado corto para compararlo)"""
+    digitos = re.sub(r"\D", "", str(telefono))
+    return digitos[-DIGITOS_TELEFONO:] if len(digitos) >= DIGITOS_TELEFONO else ""
+
+
+def claves_bloqueo(direccion, telefono):
+    """Claves que agrupan a los clientes que vale la pena comparar (dirección y teléfono ya normalizados)"""
+    claves = []
+    if telefono:
+        claves.append(f"tel:{telefono}")
+    if direccion:
+        claves.append(f"dir:{direccion}")
+        palabras = direccion.split()
+        numero = next((p for p in palabras if p.isdigit()), None)
+        if numero:
+            claves += [f"num:{numero}:{p}" for p in palabras if len(p) >= 4 and not p.isdigit()]
+    return claves
+
+
+def _similitud(a, b):
+    if not a or not b:
+        return 0.0
+    comparador = SequenceMatcher(None, a, b)
+    return comparador.ratio() if comparador.quick_ratio() >= 0.5 else 0.0
+
+
+class DuplicateClientDetector:
+    """Índice de bloqueo sobre la hoja de clientes"""
+
+    def __init__(self, df_clientes):
+        self.df = df_clientes
+        self._nombres = [" ".join(sorted(plegar(n).split())) for n in df_clientes["Nombre"].fillna("").astype(str)]
+        self._direcciones = [normalizar_direccion(d) for d in df_clientes["Dirección"].fillna("").astype(str)]
+        self._telefonos = [normalizar_telefono(t) for t in df_clientes["Teléfono"].fillna("").astype(str)]
+        self._bloques = {}
+        for fila, (direccion, telefono) in enumerate(zip(self._direcciones, self._telefonos)):
+            for clave in claves_bloqueo(direccion, telefono):
+                self._bloques.setdefault(clave, []).append(fila)
+        self._reporte = None
+
+    def _puntaje(self, nombre, direccion, telefono, fila):
+        """(puntaje, motivos) de un cliente normalizado contra una fila del índice"""
+        motivos = []
+        mismo_telefono = bool(telefono) and telefono == self._telefonos[fila]
+        if mismo_telefono:
+            motivos.append("mismo teléfono")
+        sim_direccion = _similitud(direccion, self._direcciones[fila])
+        if sim_direccion == 1:
+            motivos.append("misma dirección")
+        elif sim_direccion >= 0.8:
+            motivos.append("dirección parecida")
+        sim_nombre = _similitud(nombre, self._nombres[fila])
+        if sim_nombre >= 0.6:
+            motivos.append("nombre parecido")
+        puntaje = max(0.9 if mismo_telefono else 0.0, 0.6 * sim_direccion + 0.4 * sim_nombre)
+        return puntaje, motivos
+
+    def candidatos(self, nombre, direccion, telefono, excluir=None, limite=5):
+        """
+        Clientes existentes que podrían ser el mismo que el ingresado
+
+        Args:
+            excluir: (sucursal, Nº Cliente) del propio cliente, que no cuenta como parecido
+
+        Returns:
+            DataFrame: clientes parecidos con 'Puntaje' y 'Motivo', de mayor a menor
+        """
+        nombre = " ".join(sorted(plegar(nombre).split()))
+        direccion, telefono = normalizar_direccion(direccion), normalizar_telefono(telefono)
+        filas = {f for clave in claves_bloqueo(direccion, telefono)
+                 for f in self._bloques.get(clave, ())[:MAX_BLOQUE]}
+
+        encontrados = []
+        for fila in filas:
+            if excluir is not None and (self.df.iloc[fila]["Sucursal"], self.df.iloc[fila]["Nº Cliente"]) == excluir:
+                continue
+            puntaje, motivos = self._puntaje(nombre, direccion, telefono, fila)
+            if puntaje >= UMBRAL_DUPLICADO:
+                encontrados.append((puntaje, fila, ", ".join(motivos)))
+        encontrados.sort(reverse=True)
+        encontrados = encontrados[:limite]
+
+        resultado = self.df.iloc[[fila for _, fila, _ in encontrados]][
+            ["Nº Cliente", "Nombre", "Dirección", "Teléfono"]
+        ].copy()
+        resultado["Puntaje"] = [round(p, 2) for p, _, _ in encontrados]
+        resultado["Motivo"] = [m for _, _, m in encontrados]
+        return resultado
+
+    def reporte(self):
+        """Pares de clientes posiblemente duplicados en toda la hoja (se calcula una vez)"""
+        if self._reporte is not None:
+            return self._reporte
+
+        pares = {}
+        for filas in self._bloques.values():
+            if len(filas) < 2 or len(filas) > MAX_BLOQUE:
+                continue
+            for a, b in combinations(filas, 2):
+                if (a, b) in pares:
+                    continue
+                puntaje, motivos = self._puntaje(self._nombres[a], self._direcciones[a], self._telefonos[a], b)
+                if puntaje >= UMBRAL_DUPLICADO:
+                    pares[(a, b)] = (puntaje, ", ".join(motivos))
+
+        filas = []
+        for (a, b), (puntaje, motivo) in sorted(pares.items(), key=lambda par: -par[1][0]):
+            cliente_a, cliente_b = self.df.iloc[a], self.df.iloc[b]
+            filas.append({
+                "Cliente A": cliente_a["Nº Cliente"], "Nombre A": cliente_a["Nombre"],
+                "Cliente B": cliente_b["Nº Cliente"], "Nombre B": cliente_b["Nombre"],
+                "Dirección A": cliente_a["Dirección"], "Dirección B": cliente_b["Dirección"],
+                "Teléfono A": cliente_a["Teléfono"], "Teléfono B": cliente_b["Teléfono"],
+                "Puntaje": round(puntaje, 2), "Motivo": motivo,
+            })
+        self._reporte = pd.DataFrame(filas, columns=[
+            "Cliente A", "Nombre A", "Cliente B", "Nombre B", "Dirección A", "Dirección B",
+            "Teléfono A", "Teléfono B", "Puntaje", "Motivo"
+        ])
+        return self._reporte
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def obtener_detector_duplicados(_df_clientes, version):
+    """Devuelve el detector de duplicados de un snapshot (cacheado por versión)"""
+    return DuplicateClientDetector(_df_clientes)
+
@@ -0,0 +1,80 @@
+"""
+Índice de facetas para filtrar reclamos sin re-escanear la tabla
+Se construye una vez por snapshot de datos y se reutiliza entre reruns
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+class FacetIndex:
+    """Valores distintos, conteos y máscara de filas por valor de cada columna"""
+
+    def __init__(self, df, columnas):
+        self.total = len(df)
+        self.columnas = list(columnas)
+        self._valores = {}
+        self._conteos = {}
+        self._mascaras = {}
+
+        for col in self.columnas:
+            serie = df[col].fillna("").astype(str) if col in df.columns else pd.Series([""] * self.total)
+            codigos, valores = pd.factorize(serie, sort=True)
+            conteos = np.bincount(codigos, minlength=len(valores))
+
+            # Agrupar posiciones por código en una sola pasada ordenada
+            orden = np.argsort(codigos, kind="stable")
+            cortes = np.cumsum(conteos)[:-1]
+            mascaras = {}
+            for valor, posiciones in zip(valores, np.split(orden, cortes)):
+                mascara = np.zeros(self.total, dtype=bool)
+                mascara[posiciones] = True
+                mascaras[valor] = mascara
+
+            self._valores[col] = list(valores)
+            self._conteos[col] = dict(zip(valores, conteos.tolist()))
+            self._mascaras[col] = mascaras
+
+    def valores(self, columna):
+        """Devuelve los valores distintos ordenados de una columna"""
+        return self._valores.get(columna, [])
+
+    def mascara(self, filtros=None):
+        """Intersecta las máscaras de los filtros activos ({columna: valor})"""
+        resultado = np.ones(self.total, dtype=bool)
+        for col, valor in (filtros or {}).items():
+            mascara = self._mascaras.get(col, {}).get(valor)
+            if mascara is None:
+                return np.zeros(self.total, dtype=bool)
+            resultado &= mascara
+        return resultado
+
+    def posiciones(self, filtros=None):
+        """Posiciones (iloc) de las filas que cumplen los filtros"""
+        return np.flatnonzero(self.mascara(filtros))
+
+    def conteos(self, columna, filtros=None):
+        """
+        Conteo por valor de una columna considerando el resto de los filtros
+
+        El filtro de la propia columna se ignora para que las opciones
+        muestren cuántas filas quedarían al elegir cada valor.
+        """
+        otros = {c: v for c, v in (filtros or {}).items() if c != columna}
+        if not otros:
+            return dict(self._conteos.get(columna, {}))
+
+        return self.conteos_en(columna, self.mascara(otros))
+
+    def conteos_en(self, columna, base):
+        """Conteo por valor de una columna dentro de una máscara de filas"""
+        return {
+            valor: int(np.count_nonzero(base & mascara))
+            for valor, mascara in self._mascaras.get(columna, {}).items()
+        }
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def obtener_indice_facetas(_df, version, columnas):
+    """Devuelve el índice de facetas de un snapshot (cacheado por versión)"""
+    return FacetIndex(_df, columnas)
@@ -0,0 +1,139 @@
+"""
+Trabajos en segundo plano (PDFs, escrituras masivas, recargas)
+Corren en un pool de hilos del proceso: la interfaz sigue respondiendo y el
+resultado se recupera en un rerun posterior, aun después de refrescar el navegador
+"""
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import threading
+import time
+import streamlit as st
+
+MAX_TRABAJOS_SIMULTANEOS = 2
+CONSERVAR_TERMINADOS_SEG = 3600  # los resultados se descartan pasada una hora
+MAX_TERMINADOS = 50  # y además, de los más viejos en adelante, por cantidad
+MAX_BYTES_RESULTADOS = 200 * 1024 * 1024  # o por tamaño total de los archivos
+
+EN_COLA = "En cola"
+EN_CURSO = "En curso"
+TERMINADO = "Terminado"
+FALLIDO = "Error"
+
+
+class Trabajo:
+    """Estado observable de una operación en segundo plano"""
+
+    def __init__(self, trabajo_id, descripcion, usuario):
+        self.id = trabajo_id
+        self.descripcion = descripcion
+        self.usuario = usuario
+        self.estado = EN_COLA
+        self.progreso = 0.0
+        self.mensaje = ""
+        self.resultado = None
+        self.error = None
+        self.creado = time.time()
+        self.terminado = None
+
+    @property
+    def activo(self):
+        return self.estado in (EN_COLA, EN_CURSO)
+
+    @property
+    def bytes_resultado(self):
+        """Tamaño del archivo generado (0 si no devolvió uno)"""
+        archivo = self.resultado.get("archivo") if isinstance(self.resultado, dict) else None
+        return len(archivo) if archivo else 0
+
+    def avanzar(self, hechos, total, mensaje=""):
+        """Callback de progreso compatible con al_avanzar(hechos, total)"""
+        self.progreso = hechos / total if total else 1.0
+        self.mensaje = mensaje or f"{hechos}/{total}"
+
+
+class GestorTrabajos:
+    """Pool de hilos más el registro de trabajos por id y por usuario"""
+
+    def __init__(self, max_workers=MAX_TRABAJOS_SIMULTANEOS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="trabajo")
+        self._trabajos = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def enviar(self, descripcion, usuario, funcion, *args, **kwargs):
+        """
+        Encola funcion(*args, al_avanzar=..., **kwargs) y devuelve el id del trabajo
+
+        La función devuelve el resultado (por ejemplo {"archivo", "nombre", "mime"}
+        o {"mensaje"}) y señala errores con excepciones
+        """
+        with self._lock:
+            self._purgar()
+            trabajo = Trabajo(f"{int(time.time())}-{next(self._ids)}", descripcion, usuario)
+            self._trabajos[trabajo.id] = trabajo
+
+        def ejecutar():
+            trabajo.estado = EN_CURSO
+            try:
+                trabajo.resultado = funcion(*args, al_avanzar=trabajo.avanzar, **kwargs)
+                trabajo.progreso = 1.0
+                trabajo.estado = TERMINADO
+            except Exception as e:
+                trabajo.error = str(e)
+                trabajo.estado = FALLIDO
+            finally:
+                trabajo.terminado = time.time()
+                with self._lock:
+                    self._purgar()
+
+        self._pool.submit(ejecutar)
+        return trabajo.id
+
+    def obtener(self, trabajo_id):
+        with self._lock:
+            return self._trabajos.get(trabajo_id)
+
+    def de_usuario(self, usuario):
+        """Trabajos de un usuario, del más reciente al más antiguo"""
+        with self._lock:
+            trabajos = [t for t in self._trabajos.values() if t.usuario == usuario]
+        return sorted(trabajos, key=lambda t: t.creado, reverse=True)
+
+    def descartar(self, trabajo_id):
+        with self._lock:
+            trabajo = self._trabajos.get(trabajo_id)
+            if trabajo is not None and not trabajo.activo:
+                del self._trabajos[trabajo_id]
+
+    def _purgar(self):
+        """Descarta terminados vencidos y, si sobran, los más viejos hasta entrar en los topes"""
+        limite = time.time() - CONSERVAR_TERMINADOS_SEG
+        terminados = sorted(
+            (t for t in self._trabajos.values() if t.terminado), key=lambda t: t.terminado, reverse=True
+        )
+        cantidad = total_bytes = 0
+        for trabajo in terminados:
+            cantidad += 1
+            total_bytes += trabajo.bytes_resultado
+            excede = cantidad > 1 and (cantidad > MAX_TERMINADOS or total_bytes > MAX_BYTES_RESULTADOS)
+            if trabajo.terminado < limite or excede:  # el más reciente se conserva aunque sea grande
+                del self._trabajos[trabajo.id]
+
+
+@st.cache_resource
+def obtener_gestor_trabajos():
+    """Instancia única por proceso"""
+    return GestorTrabajos()
+
+
+def usuario_actual():
+    """Usuario logueado en la sesión (vacío si no hay login)"""
+    auth = st.session_state.get("auth") or {}
+    return (auth.get("user_info") or {}).get("username", "")
+
+
+def enviar_trabajo(descripcion, funcion, *args, **kwargs):
+    """Encola un trabajo a nombre del usuario de la sesión y guarda su id en session_state"""
+    trabajo_id = obtener_gestor_trabajos().enviar(descripcion, usuario_actual(), funcion, *args, **kwargs)
+    st.session_state.setdefault("trabajos", []).append(trabajo_id)
+    return trabajo_id
@@ -0,0 +1,79 @@
+"""
+Hash de contraseñas con sal (hashlib.scrypt, con PBKDF2 como alternativa)
+Formato guardado en la hoja: "scrypt$n$r$p$sal$hash" o "pbkdf2_sha256$iteraciones$sal$hash"
+Las contraseñas en texto plano siguen validando y se migran en el primer login
+"""
+import base64
+import hashlib
+import hmac
+import os
+
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERACIONES = 600_000
+_LARGO_HASH = 32
+
+
+def _b64(datos):
+    return base64.b64encode(datos).decode("ascii")
+
+
+def _scrypt(password, sal, n, r, p):
+    return hashlib.scrypt(password.encode("utf-8"), salt=sal, n=n, r=r, p=p,
+                          maxmem=64 * 1024 * 1024, dklen=_LARGO_HASH)
+
+
+def hashear_password(password):
+    """Devuelve el hash con sal de una contraseña, listo para guardar en la hoja"""
+    sal = os.urandom(16)
+    if hasattr(hashlib, "scrypt"):
+        clave = _scrypt(password, sal, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64(sal)}${_b64(clave)}"
+    clave = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), sal, PBKDF2_ITERACIONES, _LARGO_HASH)
+    return f"pbkdf2_sha256${PBKDF2_ITERACIONES}${_b64(sal)}${_b64(clave)}"
+
+
+def es_hash(valor):
+    return str(valor).startswith(("scrypt$", "pbkdf2_sha256$"))
+
+
+def verificar_password(password, almacenado):
+    """
+    Compara una contraseña contra el valor guardado (hash o texto plano)
+
+    Returns:
+        tuple: (válida, requiere_rehash) — requiere_rehash indica texto plano o
+        parámetros más débiles que los actuales
+    """
+    almacenado = str(almacenado)
+    try:
+        if almacenado.startswith("scrypt$"):
+            _, n, r, p, sal, clave = almacenado.split("$")
+            n, r, p = int(n), int(r), int(p)
+            calculada = _scrypt(password, base64.b64decode(sal), n, r, p)
+            valida = hmac.compare_digest(calculada, base64.b64decode(clave))
+            return valida, valida and (n, r, p) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+        if almacenado.startswith("pbkdf2_sha256$"):
+            _, iteraciones, sal, clave = almacenado.split("$")
+            calculada = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"),
+                                            base64.b64decode(sal), int(iteraciones), _LARGO_HASH)
+            valida = hmac.compare_digest(calculada, base64.b64decode(clave))
+            return valida, valida and (hasattr(hashlib, "scrypt") or int(iteraciones) < PBKDF2_ITERACIONES)
+    except (ValueError, TypeError):
+        return False, False
+
+    # Texto plano (hoja todavía sin migrar)
+    valida = bool(almacenado) and hmac.compare_digest(password.encode("utf-8"), almacenado.encode("utf-8"))
+    return valida, valida
+
+
+if __name__ == "__main__":
+    # Genera un hash para cargar a mano en la hoja: python -m utils.passwords "contraseña"
+    import sys
+
+    if len(sys.argv) != 2:
+        print('Uso: python -m utils.passwords "contraseña"')
+        sys.exit(1)
+    print(hashear_password(sys.argv[1]))
@@ -0,0 +1,116 @@
+"""
+Paquetes de órdenes de trabajo: un PDF por técnico o por sector en un solo ZIP
+Los PDFs que no están en caché se generan en paralelo en un pool de procesos
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import io
+import multiprocessing
+import os
+import re
+import zipfile
+import streamlit as st
+from utils.claims_stats import equipo_de
+from utils.pdf_engine import generar_pdf_grupo, generar_pdf, filas_pdf
+from utils.pdf_cache import obtener_cache_pdf, clave_pdf
+
+AGRUPACIONES_PAQUETE = ("Técnico", "Sector")
+SIN_TECNICO = "Sin asignar"
+
+
+def _contexto_procesos():
+    """
+    forkserver donde exista, si no spawn (Windows, macOS)
+
+    No se usa fork: el servidor tiene hilos (Streamlit, gspread, trabajos) y
+    un hijo podría heredar un lock tomado y quedar bloqueado
+    """
+    metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    contexto = multiprocessing.get_context(metodo)
+    if metodo == "forkserver":
+        contexto.set_forkserver_preload(["utils.pdf_engine"])
+    return contexto
+
+
+@st.cache_resource
+def obtener_pool_pdf():
+    """Pool de procesos compartido por todas las sesiones"""
+    return ProcessPoolExecutor(
+        max_workers=max(1, min(4, os.cpu_count() or 1)),
+        mp_context=_contexto_procesos()
+    )
+
+
+def grupos_por(df, por):
+    """
+    Reparte los reclamos en grupos {nombre: DataFrame}
+
+    Por técnico, un reclamo asignado a un equipo aparece en la hoja de cada integrante
+    """
+    if por == "Técnico":
+        equipos = df["Técnico"].fillna("").astype(str).map(lambda t: list(equipo_de(t)) or [SIN_TECNICO])
+        explotado = equipos.explode()
+        return {nombre: df.loc[idx.index] for nombre, idx in explotado.groupby(explotado, sort=True)}
+    if por == "Sector":
+        return {f"Sector {sector}": grupo for sector, grupo in df.groupby(df["Sector"].fillna("").astype(str), sort=True)}
+    raise ValueError(f"Agrupación desconocida: {por}")
+
+
+def _nombre_archivo(nombre):
+    return re.sub(r"[^\w-]+", "_", nombre).strip("_") or "reclamos"
+
+
+def generar_paquete(version, grupos, layout="detallado", al_avanzar=None):
+    """
+    Genera un ZIP con un PDF por grupo
+
+    Args:
+        version: versión del snapshot (clave de la caché de PDFs)
+        grupos: {nombre: DataFrame de reclamos} (ver grupos_por)
+        layout: ver utils.pdf_engine.LAYOUTS_PDF
+        al_avanzar: callback opcional (hechos, total) para informar el progreso
+
+    Returns:
+        bytes: contenido del ZIP
+    """
+    cache = obtener_cache_pdf()
+    total = len(grupos)
+    listos, pendientes = {}, {}
+
+    for nombre, df in grupos.items():
+        titulo = f"ORDEN DE TRABAJO - {nombre.upper()}"
+        clave = clave_pdf(version, df.index, titulo, layout)
+        pdf = cache.obtener(clave)
+        if pdf is None:
+            pendientes[nombre] = (clave, (nombre, list(filas_pdf(df)), titulo, layout))
+        else:
+            listos[nombre] = pdf
+
+    if al_avanzar:
+        al_avanzar(len(listos), total)
+
+    def terminar(nombre, pdf):
+        cache.guardar(pendientes[nombre][0], pdf)
+        listos[nombre] = pdf
+        if al_avanzar:
+            al_avanzar(len(listos), total)
+
+    if pendientes:
+        try:
+            pool = obtener_pool_pdf()
+            futuros = [pool.submit(generar_pdf_grupo, trabajo) for _, trabajo in pendientes.values()]
+            for futuro in as_completed(futuros):
+                terminar(*futuro.result())
+        except Exception as e:
+            # Pool roto o imposible de crear: se descarta y lo que falte se genera en este hilo
+            print(f"[pdf] Pool de procesos no disponible ({e}); generación en línea", flush=True)
+            obtener_pool_pdf.clear()
+            for nombre, (_, (_, filas, titulo, layout)) in pendientes.items():
+                if nombre not in listos:
+                    terminar(nombre, generar_pdf(filas, titulo, layout))
+
+    buffer = io.BytesIO()
+    # Los PDF ya vienen comprimidos: se guardan sin volver a comprimir
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as paquete:
+        for nombre in grupos:
+            paquete.writestr(f"{_nombre_archivo(nombre)}.pdf", listos[nombre])
+    return buffer.getvalue()
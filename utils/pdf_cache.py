@@ -0,0 +1,98 @@
+"""
+Caché de PDFs generados, compartida entre sesiones
+La clave es un hash de (versión del snapshot, selección, layout, título, fecha);
+se desalojan los menos usados cuando se supera el presupuesto de bytes
+"""
+from collections import OrderedDict
+from datetime import datetime
+import hashlib
+import threading
+import streamlit as st
+from utils.pdf_engine import generar_pdf, filas_pdf
+from config.settings import CACHE_PDF_MAX_MB
+
+
+class PdfCache:
+    """LRU de documentos PDF acotada por tamaño total en bytes"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._docs = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave):
+        with self._lock:
+            pdf = self._docs.get(clave)
+            if pdf is None:
+                self.fallos += 1
+                return None
+            self._docs.move_to_end(clave)
+            self.aciertos += 1
+            return pdf
+
+    def guardar(self, clave, pdf):
+        if len(pdf) > self.max_bytes:
+            return
+        with self._lock:
+            anterior = self._docs.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= len(anterior)
+            self._docs[clave] = pdf
+            self._bytes += len(pdf)
+            while self._bytes > self.max_bytes:
+                _, desalojado = self._docs.popitem(last=False)
+                self._bytes -= len(desalojado)
+
+    def estadisticas(self):
+        """Documentos, bytes ocupados y aciertos/fallos desde el arranque"""
+        with self._lock:
+            return {
+                "documentos": len(self._docs),
+                "bytes": self._bytes,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+            }
+
+
+@st.cache_resource
+def obtener_cache_pdf():
+    """Instancia única por proceso"""
+    return PdfCache(CACHE_PDF_MAX_MB * 1024 * 1024)
+
+
+def clave_pdf(version, seleccion, titulo, layout):
+    """Hash de contenido de una solicitud de impresión"""
+    fecha = datetime.now().strftime("%d/%m/%Y")  # el encabezado lleva la fecha del día
+    partes = [version, titulo, layout, fecha, ",".join(map(str, seleccion))]
+    return hashlib.sha256("\x1f".join(partes).encode("utf-8")).hexdigest()
+
+
+def generar_pdf_cacheado(version, df, titulo, layout="detallado"):
+    """
+    Devuelve el PDF de los reclamos de df, generándolo solo si no está en caché
+
+    Args:
+        version: versión del snapshot del que salen los reclamos
+        df: reclamos a imprimir (su índice identifica la selección)
+        titulo: encabezado de cada página
+        layout: ver utils.pdf_engine.LAYOUTS_PDF
+    """
+    cache = obtener_cache_pdf()
+    clave = clave_pdf(version, df.index, titulo, layout)
+    pdf = cache.obtener(clave)
+    if pdf is None:
+        pdf = generar_pdf(filas_pdf(df), titulo, layout)
+        cache.guardar(clave, pdf)
+    return pdf
+
+
+def trabajo_pdf(version, df, titulo, nombre_archivo, layout="detallado", al_avanzar=None):
+    """Trabajo en segundo plano (ver utils.jobs): un PDF que queda para descargar en el panel"""
+    return {
+        "archivo": generar_pdf_cacheado(version, df, titulo, layout),
+        "nombre": nombre_archivo,
+        "mime": "application/pdf",
+    }
@@ -0,0 +1,240 @@
+"""
+Motor único de PDFs de reclamos (órdenes de trabajo para técnicos)
+Recibe tuplas de filas, ajusta el texto al ancho de la hoja y reserva el
+alto de cada reclamo antes de dibujarlo. Cada página se comprime y se escribe
+en el destino apenas se completa: la memoria de trabajo es la de una página
+más unos pocos bytes por página para el índice del final. De reportlab solo se usan
+las métricas de las fuentes estándar (se importa recién al generar el primer PDF)
+"""
+from array import array
+import io
+import zlib
+from datetime import datetime
+
+CAMPOS_PDF = [
+    "Nº Cliente", "Nombre", "Fecha y hora", "Dirección", "Teléfono", "Sector",
+    "N° de Precinto", "Tipo de reclamo", "Detalles", "Técnico"
+]
+LAYOUTS_PDF = ("detallado", "compacto")
+
+_MARGEN = 40
+_MARGEN_INFERIOR = 50
+_FUENTES = {"Helvetica": (b"F1", 3), "Helvetica-Bold": (b"F2", 4)}  # alias y número de objeto
+
+
+def filas_pdf(df):
+    """Convierte un DataFrame de reclamos en tuplas con el orden de CAMPOS_PDF"""
+    return df.reindex(columns=CAMPOS_PDF).fillna("").astype(str).itertuples(index=False, name=None)
+
+
+def _ajustar(texto, fuente, tamanio, ancho):
+    """Parte un texto en líneas que entran en el ancho (sin cortar si ya entra)"""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.lib.utils import simpleSplit
+
+    if stringWidth(texto, fuente, tamanio) <= ancho:
+        return [texto]
+    return simpleSplit(texto, fuente, tamanio, ancho)
+
+
+def _bloque_detallado(fila, ancho):
+    """Líneas (fuente, tamaño, texto) de un reclamo en formato detallado"""
+    cliente, nombre, fecha, direccion, telefono, sector, precinto, tipo, detalles, tecnico = fila
+    lineas = [("Helvetica-Bold", 16, t) for t in _ajustar(f"#{cliente} - {nombre}", "Helvetica-Bold", 16, ancho)]
+    texto = [
+        f"Fecha: {fecha}",
+        f"Dirección: {direccion} - Tel: {telefono}",
+        f"Sector: {sector} - Precinto: {precinto or 'N/A'}",
+        f"Tipo: {tipo}",
+        f"Detalles: {detalles}",
+    ]
+    if tecnico:
+        texto.append(f"Técnico: {tecnico}")
+    for parrafo in texto:
+        lineas.extend(("Helvetica", 12, t) for t in _ajustar(parrafo, "Helvetica", 12, ancho))
+    return lineas
+
+
+def _bloque_compacto(fila, ancho):
+    """Líneas (fuente, tamaño, texto) de un reclamo en formato compacto"""
+    cliente, nombre, fecha, _, _, _, _, tipo, _, tecnico = fila
+    lineas = [("Helvetica-Bold", 10, t) for t in _ajustar(f"{cliente} - {nombre}", "Helvetica-Bold", 10, ancho)]
+    for parrafo in (f"Fecha: {fecha}", f"Tipo: {tipo}", f"Técnico: {tecnico}"):
+        lineas.extend(("Helvetica", 8, t) for t in _ajustar(parrafo, "Helvetica", 8, ancho))
+    return lineas
+
+
+def _numero(valor):
+    return (b"%.2f" % valor).rstrip(b"0").rstrip(b".")
+
+
+def _cadena(texto):
+    """Texto como string literal de PDF, en WinAnsi como las métricas de reportlab"""
+    datos = texto.encode("cp1252", errors="replace")
+    return b"(" + datos.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+class _DocumentoPDF:
+    """
+    Escritor PDF mínimo (texto en Helvetica y líneas) que vuelca cada página al terminarla
+
+    Del documento solo se recuerda la posición de cada objeto, para la tabla
+    xref del final; las páginas son los objetos 6, 8, 10... (cada una precedida
+    por su contenido)
+    """
+
+    def __init__(self, destino, ancho, alto):
+        self._destino = destino
+        self._caja = b"[0 0 %s %s]" % (_numero(ancho), _numero(alto))
+        self._posiciones = array("q", bytes(8 * 5))  # 1 catálogo, 2 árbol de páginas, 3 y 4 fuentes
+        self._contenido = []
+        self._escritos = 0
+        self._emitir(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for fuente, (_, numero) in _FUENTES.items():
+            self._objeto(numero, b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>"
+                         % fuente.encode())
+
+    def _emitir(self, datos):
+        self._destino.write(datos)
+        self._escritos += len(datos)
+
+    def _objeto(self, numero, cuerpo):
+        self._posiciones[numero] = self._escritos
+        self._emitir(b"%d 0 obj\n%s\nendobj\n" % (numero, cuerpo))
+
+    def fuente(self, nombre, tamanio):
+        self._contenido.append(b"/%s %s Tf" % (_FUENTES[nombre][0], _numero(tamanio)))
+
+    def texto(self, x, y, texto):
+        self._contenido.append(b"BT %s %s Td %s Tj ET" % (_numero(x), _numero(y), _cadena(texto)))
+
+    def linea(self, x1, y1, x2, y2):
+        self._contenido.append(b"%s %s m %s %s l S" % tuple(_numero(v) for v in (x1, y1, x2, y2)))
+
+    def terminar_pagina(self):
+        """Comprime la página actual y la escribe en el destino"""
+        flujo = zlib.compress(b"\n".join(self._contenido))
+        self._contenido = []
+        contenido, pagina = len(self._posiciones), len(self._posiciones) + 1
+        self._posiciones.extend((0, 0))
+        self._objeto(contenido, b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream"
+                     % (len(flujo), flujo))
+        self._objeto(pagina, b"<< /Type /Page /Parent 2 0 R /MediaBox %s /Contents %d 0 R "
+                             b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> >>" % (self._caja, contenido))
+
+    def cerrar(self):
+        """Termina la última página y escribe el árbol de páginas, el catálogo y la tabla xref"""
+        if self._contenido or len(self._posiciones) == 5:
+            self.terminar_pagina()
+        total = len(self._posiciones)
+        paginas = range(6, total, 2)
+        hijas = b" ".join(b"%d 0 R" % pagina for pagina in paginas)
+        self._objeto(2, b"<< /Type /Pages /Count %d /Kids [%s] >>" % (len(paginas), hijas))
+        self._objeto(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        inicio_xref = self._escritos
+        self._emitir(b"xref\n0 %d\n0000000000 65535 f \n" % total)
+        for posicion in self._posiciones[1:]:
+            self._emitir(b"%010d 00000 n \n" % posicion)
+        self._emitir(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (total, inicio_xref))
+
+
+def _alto(lineas):
+    return sum(tamanio + 2 for _, tamanio, _ in lineas)
+
+
+def _dibujar(c, x, y, lineas):
+    actual = None
+    for fuente, tamanio, texto in lineas:
+        y -= tamanio + 2
+        if (fuente, tamanio) != actual:
+            c.fuente(fuente, tamanio)
+            actual = (fuente, tamanio)
+        c.texto(x, y, texto)
+    return y
+
+
+def escribir_pdf(filas, destino, titulo, layout="detallado"):
+    """
+    Escribe el PDF de los reclamos en un archivo (o buffer) ya abierto
+
+    Cada página se escribe en el destino al completarse
+
+    Args:
+        filas: iterable de tuplas con el orden de CAMPOS_PDF (ver filas_pdf)
+        destino: archivo binario de salida
+        titulo: encabezado de cada página
+        layout: "detallado" (una columna) o "compacto" (dos columnas)
+
+    Returns:
+        int: cantidad de reclamos escritos
+    """
+    from reportlab.lib.pagesizes import A4
+
+    if layout not in LAYOUTS_PDF:
+        raise ValueError(f"Layout desconocido: {layout}")
+
+    ancho_hoja, alto_hoja = A4
+    c = _DocumentoPDF(destino, ancho_hoja, alto_hoja)
+    fecha = datetime.now().strftime("%d/%m/%Y")
+    encabezados = (f"{titulo} - {fecha}", f"{titulo} (cont.) - {fecha}")
+
+    def nueva_pagina(primera):
+        if not primera:
+            c.terminar_pagina()
+        y = alto_hoja - _MARGEN
+        c.fuente("Helvetica-Bold", 16 if layout == "detallado" else 14)
+        c.texto(_MARGEN, y, encabezados[0 if primera else 1])
+        return y - 24
+
+    y = nueva_pagina(primera=True)
+    total = 0
+
+    if layout == "detallado":
+        ancho = ancho_hoja - 2 * _MARGEN
+        for fila in filas:
+            lineas = _bloque_detallado(fila, ancho)
+            if y - _alto(lineas) < _MARGEN_INFERIOR and total:
+                y = nueva_pagina(primera=False)
+            y = _dibujar(c, _MARGEN, y, lineas) - 8
+            c.linea(_MARGEN, y, ancho_hoja - _MARGEN, y)
+            y -= 10
+            total += 1
+    else:
+        ancho = ancho_hoja / 2 - _MARGEN - 10
+        columnas = (_MARGEN, ancho_hoja / 2 + 10)
+        par = []
+        for fila in filas:
+            par.append(_bloque_compacto(fila, ancho))
+            total += 1
+            if len(par) == 2:
+                y = _dibujar_par(c, columnas, y, par, nueva_pagina)
+                par = []
+        if par:
+            _dibujar_par(c, columnas, y, par, nueva_pagina)
+
+    c.cerrar()
+    return total
+
+
+def _dibujar_par(c, columnas, y, par, nueva_pagina):
+    """Dibuja hasta dos reclamos lado a lado y devuelve la nueva altura"""
+    alto = max(_alto(lineas) for lineas in par)
+    if y - alto < _MARGEN_INFERIOR:
+        y = nueva_pagina(primera=False)
+    for x, lineas in zip(columnas, par):
+        _dibujar(c, x, y, lineas)
+    return y - alto - 10
+
+
+def generar_pdf(filas, titulo, layout="detallado"):
+    """Genera el PDF en un buffer y devuelve sus bytes (listo para st.download_button)"""
+    buffer = io.BytesIO()
+    escribir_pdf(filas, buffer, titulo, layout)
+    return buffer.getvalue()
+
+
+def generar_pdf_grupo(trabajo):
+    """Versión para procesos de trabajo: (nombre, filas, título, layout) -> (nombre, bytes)"""
+    nombre, filas, titulo, layout = trabajo
+    return nombre, generar_pdf(filas, titulo, layout)
+
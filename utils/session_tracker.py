@@ -0,0 +1,166 @@
+"""
+Seguimiento de actividad por sesión y expulsión de sesiones inactivas
+Pasado SESSION_TIMEOUT sin actividad, la próxima ejecución de la sesión (app
+completa o fragmento, ver exigir_sesion) la cierra y libera su estado. El
+estado de cada sesión solo se toca desde su propio hilo de script. Los reruns
+que lanza la app sola (ver rerun_automatico) no cuentan como actividad
+"""
+import sys
+import threading
+import time
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from config.settings import SESSION_TIMEOUT
+
+INTERVALO_BARRIDO_SEG = 60
+
+_actividad = {}  # session_id -> {"usuario", "ultima"}
+_lock = threading.Lock()
+_aviso_sesiones = False
+
+
+def _session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+
+def registrar_actividad(usuario=None):
+    """Marca la sesión actual como activa, salvo en una ejecución lanzada por rerun_automatico"""
+    if st.session_state.get("_rerun_automatico"):
+        return
+    ahora = time.time()
+    st.session_state["_ultima_actividad"] = ahora
+    session_id = _session_id()
+    if session_id:
+        with _lock:
+            registro = _actividad.setdefault(session_id, {"usuario": ""})
+            registro["ultima"] = ahora
+            if usuario:
+                registro["usuario"] = usuario
+
+
+def rerun_automatico():
+    """st.rerun() que no es una interacción del usuario (sondeos, refrescos)"""
+    st.session_state["_rerun_automatico"] = True
+    st.rerun()
+
+
+def terminar_ejecucion():
+    """Al final de cada ejecución completa: el próximo rerun vuelve a contar como actividad"""
+    st.session_state.pop("_rerun_automatico", None)
+
+
+def sesion_vencida():
+    """True si la sesión actual superó SESSION_TIMEOUT sin actividad"""
+    ultima = st.session_state.get("_ultima_actividad")
+    return ultima is not None and time.time() - ultima > SESSION_TIMEOUT
+
+
+def cerrar_sesion_inactiva():
+    """Vacía el estado de la sesión actual (vuelve al login)"""
+    st.session_state.clear()
+    st.session_state["sesion_expirada"] = True
+    session_id = _session_id()
+    if session_id:
+        with _lock:
+            _actividad.pop(session_id, None)
+
+
+def _sesiones_del_servidor():
+    """
+    SessionInfo de todas las sesiones del runtime (None si no se pueden listar)
+
+    Streamlit no tiene API pública para esto: se usa el gestor de sesiones
+    privado del Runtime, probado con la versión fijada en requirements.txt.
+    Si cambia, el panel de sesiones queda vacío y el barrido no depura nada
+    """
+    try:
+        from streamlit.runtime import Runtime
+
+        if not Runtime.exists():
+            return None
+        return list(Runtime.instance()._session_mgr.list_sessions())
+    except Exception as e:
+        global _aviso_sesiones
+        if not _aviso_sesiones:
+            _aviso_sesiones = True
+            print(f"[sesiones] No se pudo listar las sesiones del servidor: {e}", flush=True)
+        return None
+
+
+def estimar_memoria(estado):
+    """Bytes aproximados referenciados por un session_state"""
+    total = 0
+    for valor in estado.filtered_state.values():
+        if isinstance(valor, pd.DataFrame):
+            total += int(valor.memory_usage(index=True).sum())
+        elif isinstance(valor, pd.Series):
+            total += int(valor.memory_usage(index=True))
+        else:
+            total += sys.getsizeof(valor)
+    return total
+
+
+def barrer_sesiones_inactivas():
+    """
+    Olvida el registro de las sesiones que el servidor ya cerró
+
+    Las vencidas que siguen abiertas no se tocan desde este hilo: se cierran
+    en su próxima ejecución
+
+    Returns:
+        int: sesiones abiertas que superaron SESSION_TIMEOUT
+    """
+    limite = time.time() - SESSION_TIMEOUT
+    sesiones = _sesiones_del_servidor()
+
+    with _lock:
+        if sesiones is not None:
+            vigentes = {info.session.id for info in sesiones}
+            for session_id in [s for s in _actividad if s not in vigentes]:
+                del _actividad[session_id]
+        vencidas = sum(1 for r in _actividad.values() if r.get("ultima", time.time()) < limite)
+
+    if vencidas:
+        print(f"[sesiones] {vencidas} sesión(es) inactiva(s) a cerrar en su próxima ejecución", flush=True)
+    return vencidas
+
+
+def _barrido_periodico():
+    while True:
+        time.sleep(INTERVALO_BARRIDO_SEG)
+        try:
+            barrer_sesiones_inactivas()
+        except Exception as e:
+            print(f"[sesiones] Error en el barrido: {e}", flush=True)
+
+
+@st.cache_resource
+def iniciar_barrido():
+    """Lanza (una vez por proceso) el hilo que depura el registro de sesiones"""
+    hilo = threading.Thread(target=_barrido_periodico, name="barrido-sesiones", daemon=True)
+    hilo.start()
+    return hilo
+
+
+def resumen_sesiones():
+    """Una fila por sesión del servidor: usuario, conexión, inactividad y memoria"""
+    ahora = time.time()
+    filas = []
+    for info in _sesiones_del_servidor() or []:
+        session_id = info.session.id
+        with _lock:
+            registro = dict(_actividad.get(session_id, {}))
+        try:
+            memoria = estimar_memoria(info.session.session_state)
+        except Exception:
+            memoria = 0
+        filas.append({
+            "Sesión": session_id[:8],
+            "Usuario": registro.get("usuario", ""),
+            "Conectada": info.is_active(),
+            "Inactiva (min)": round((ahora - registro.get("ultima", ahora)) / 60, 1),
+            "Memoria (KB)": round(memoria / 1024, 1),
+        })
+    return pd.DataFrame(filas)
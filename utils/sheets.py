@@ -0,0 +1,117 @@
+"""
+Conexión con Google Sheets
+Las librerías de Google se importan recién en la primera conexión del proceso.
+Cada sucursal tiene su planilla (SUCURSALES); se abren en paralelo y la
+principal guarda además la hoja de usuarios
+"""
+from concurrent.futures import ThreadPoolExecutor
+import streamlit as st
+from utils.startup_timing import medir
+from config.settings import (
+    SHEET_ID, SUCURSALES, SUCURSAL_PRINCIPAL, WORKSHEET_RECLAMOS, WORKSHEET_CLIENTES, WORKSHEET_USUARIOS
+)
+
+
+@st.cache_resource
+def _cliente_gspread():
+    """Autoriza la cuenta de servicio una sola vez por proceso"""
+    from google.oauth2 import service_account
+    import gspread
+
+    with medir("autenticación"):
+        # Cargar credenciales de forma segura
+        if 'gcp_service_account' not in st.secrets:
+            raise ValueError("No se encontraron credenciales en st.secrets")
+
+        info = dict(st.secrets["gcp_service_account"])
+        info["private_key"] = info["private_key"].replace("\\n", "\n")
+
+        credentials = service_account.Credentials.from_service_account_info(
+            info,
+            scopes=["https://www.googleapis.com/auth/spreadsheets",
+                    "https://www.googleapis.com/auth/drive"]
+        )
+
+        return gspread.authorize(credentials)
+
+
+@st.cache_resource
+def conectar_planilla(sheet_id=SHEET_ID):
+    """
+    Abre una planilla una sola vez y resuelve todas sus hojas
+
+    Returns:
+        tuple: (hojas, metadatos) donde hojas es {título: Worksheet} y
+        metadatos es {título: {"id", "filas", "columnas"}}
+    """
+    client = _cliente_gspread()
+
+    with medir("apertura de planilla"):
+        spreadsheet = client.open_by_key(sheet_id)
+
+    # Una sola consulta de metadatos para todas las hojas
+    with medir("metadatos de hojas"):
+        hojas = {ws.title: ws for ws in spreadsheet.worksheets()}
+
+    metadatos = {
+        titulo: {"id": ws.id, "filas": ws.row_count, "columnas": ws.col_count}
+        for titulo, ws in hojas.items()
+    }
+    return hojas, metadatos
+
+
+@st.cache_resource
+def conectar_sucursales():
+    """
+    Abre en paralelo la planilla de cada sucursal
+
+    Returns:
+        dict: {sucursal: hojas} con las hojas de cada planilla por título
+    """
+    with ThreadPoolExecutor(max_workers=len(SUCURSALES)) as pool:
+        planillas = dict(zip(SUCURSALES, pool.map(conectar_planilla, SUCURSALES.values())))
+    return {sucursal: hojas for sucursal, (hojas, _) in planillas.items()}
+
+
+def hojas_sucursal(sucursal):
+    """Hojas de reclamos y clientes de una sucursal"""
+    hojas = conectar_sucursales()[sucursal]
+    return hojas[WORKSHEET_RECLAMOS], hojas[WORKSHEET_CLIENTES]
+
+
+@st.cache_resource
+def init_google_sheets():
+    """Inicializa la conexión con Google Sheets con manejo de errores mejorado"""
+    try:
+        sucursales = conectar_sucursales()
+
+        # Validar existencia de las hojas en cada planilla
+        faltantes = [
+            f"{titulo} ({sucursal})" if len(sucursales) > 1 else titulo
+            for sucursal, hojas in sucursales.items()
+            for titulo in (WORKSHEET_RECLAMOS, WORKSHEET_CLIENTES)
+            if titulo not in hojas
+        ]
+        if WORKSHEET_USUARIOS not in sucursales[SUCURSAL_PRINCIPAL]:
+            faltantes.append(WORKSHEET_USUARIOS)
+        if faltantes:
+            raise ValueError(f"Hoja no encontrada: {', '.join(faltantes)}")
+
+        principal = sucursales[SUCURSAL_PRINCIPAL]
+        return principal[WORKSHEET_RECLAMOS], principal[WORKSHEET_CLIENTES], principal[WORKSHEET_USUARIOS]
+
+    except Exception as e:
+        st.error(f"🔴 Error crítico al conectar con Google Sheets: {str(e)}")
+        st.stop()
+        return None, None, None
+
+
+def metadatos_hojas():
+    """Ids y tamaño de grilla de cada hoja (leídos una vez al conectar)"""
+    if len(SUCURSALES) == 1:
+        return conectar_planilla(SUCURSALES[SUCURSAL_PRINCIPAL])[1]
+    return {
+        f"{sucursal} · {titulo}": meta
+        for sucursal, sheet_id in SUCURSALES.items()
+        for titulo, meta in conectar_planilla(sheet_id)[1].items()
+    }
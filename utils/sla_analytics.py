@@ -0,0 +1,104 @@
+"""
+Analítica de tiempos de resolución (SLA) calculada en forma vectorizada
+Usa las columnas 'Fecha de asignación' y 'Fecha de resolución' de Reclamos
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.data_manager import parsear_fechas
+from utils.claims_stats import equipo_de
+from config.settings import SLA_HORAS_OBJETIVO
+
+PERCENTILES_SLA = (0.5, 0.9, 0.95)
+CORTES_ANTIGUEDAD_DIAS = [0, 1, 2, 3, 7, 14, 30, np.inf]
+
+
+def preparar_tiempos(df_reclamos, fechas):
+    """Arma un DataFrame con marcas de tiempo y duraciones (en horas) por reclamo"""
+    alta = fechas if fechas is not None else parsear_fechas(df_reclamos["Fecha y hora"])
+    asignacion = parsear_fechas(df_reclamos.get("Fecha de asignación", pd.Series(index=df_reclamos.index, dtype=object)))
+    resolucion = parsear_fechas(df_reclamos.get("Fecha de resolución", pd.Series(index=df_reclamos.index, dtype=object)))
+
+    return pd.DataFrame({
+        "Tipo de reclamo": df_reclamos["Tipo de reclamo"].fillna(""),
+        "Sector": df_reclamos["Sector"].fillna(""),
+        "Técnico": df_reclamos["Técnico"].fillna("").astype(str),
+        "Estado": df_reclamos["Estado"].fillna(""),
+        "alta": alta,
+        "asignacion": asignacion,
+        "resolucion": resolucion,
+        "horas_asignacion": (asignacion - alta).dt.total_seconds() / 3600,
+        "horas_resolucion": (resolucion - alta).dt.total_seconds() / 3600,
+    })
+
+
+def percentiles_resolucion(tiempos, por, percentiles=PERCENTILES_SLA):
+    """Percentiles de horas hasta la resolución agrupados por una dimensión"""
+    resueltos = tiempos.dropna(subset=["horas_resolucion"])
+    resueltos = resueltos[resueltos["horas_resolucion"] >= 0]
+    if resueltos.empty:
+        return pd.DataFrame()
+
+    if por == "Técnico":
+        equipos = {t: list(equipo_de(t)) for t in resueltos["Técnico"].unique()}
+        resueltos = resueltos.assign(Técnico=resueltos["Técnico"].map(equipos)).explode("Técnico")
+        resueltos = resueltos.dropna(subset=["Técnico"])
+
+    agrupado = resueltos.groupby(por)["horas_resolucion"]
+    tabla = agrupado.quantile(list(percentiles)).unstack()
+    tabla.columns = [f"p{int(q * 100)}" for q in percentiles]
+    tabla.insert(0, "reclamos", agrupado.size())
+    tabla["% en objetivo"] = (
+        resueltos["horas_resolucion"].le(SLA_HORAS_OBJETIVO).groupby(resueltos[por]).mean() * 100
+    )
+    return tabla.round(1).sort_values("reclamos", ascending=False)
+
+
+def promedio_movil_resolucion(tiempos, ventana=7):
+    """Promedio diario de horas de resolución y su media móvil por fecha de cierre"""
+    resueltos = tiempos.dropna(subset=["resolucion", "horas_resolucion"])
+    if resueltos.empty:
+        return pd.DataFrame()
+
+    diario = resueltos.groupby(resueltos["resolucion"].dt.normalize())["horas_resolucion"].mean()
+    diario = diario.asfreq("D")
+    return pd.DataFrame({
+        "promedio diario": diario,
+        f"media móvil {ventana} días": diario.rolling(ventana, min_periods=1).mean(),
+    })
+
+
+def antiguedad_backlog(tiempos, ahora):
+    """Distribución de antigüedad (en días) de los reclamos Pendiente / En curso"""
+    activos = tiempos[tiempos["Estado"].isin(["Pendiente", "En curso"])].dropna(subset=["alta"])
+    if activos.empty:
+        return pd.DataFrame()
+
+    dias = (pd.Timestamp(ahora) - activos["alta"]).dt.total_seconds() / 86400
+    etiquetas = [
+        f"{int(a)}-{int(b)} días" if np.isfinite(b) else f"+{int(a)} días"
+        for a, b in zip(CORTES_ANTIGUEDAD_DIAS[:-1], CORTES_ANTIGUEDAD_DIAS[1:])
+    ]
+    rangos = pd.cut(dias.clip(lower=0), CORTES_ANTIGUEDAD_DIAS, labels=etiquetas, right=False)
+    return pd.crosstab(rangos, activos["Estado"]).reindex(etiquetas, fill_value=0)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def resumen_sla(_snapshot, version, ahora):
+    """
+    Calcula todas las vistas de SLA de un snapshot (cacheado por versión)
+
+    Args:
+        _snapshot: Snapshot actual (no se hashea)
+        version: versión del snapshot, clave de la caché
+        ahora: instante de referencia para la antigüedad (redondeado por el llamador)
+    """
+    tiempos = preparar_tiempos(_snapshot.df_reclamos, _snapshot.fechas_reclamos)
+    return {
+        "por_tipo": percentiles_resolucion(tiempos, "Tipo de reclamo"),
+        "por_sector": percentiles_resolucion(tiempos, "Sector"),
+        "por_tecnico": percentiles_resolucion(tiempos, "Técnico"),
+        "tendencia": promedio_movil_resolucion(tiempos),
+        "backlog": antiguedad_backlog(tiempos, ahora),
+        "horas_asignacion_p50": tiempos["horas_asignacion"].median(),
+    }
@@ -0,0 +1,259 @@
+"""
+Snapshot en memoria de las hojas de cálculo
+Se comparte entre sesiones y se parchea tras cada escritura puntual.
+Une las planillas de todas las sucursales (columna "Sucursal"); cada
+escritura va a la planilla dueña de la fila
+"""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import pandas as pd
+import streamlit as st
+from utils.api_manager import api_manager
+from utils.claims_stats import ClaimStats
+from utils.claims_cube import ClaimsCube
+from utils.data_manager import (
+    batch_update_sheet, calcular_version, letra_columna, parsear_fechas,
+    leer_hoja, safe_normalize
+)
+from utils.sheets import hojas_sucursal, init_google_sheets
+from utils.startup_timing import medir
+from config.settings import COLUMNAS_RECLAMOS, COLUMNAS_CLIENTES, SUCURSALES, SUCURSAL_PRINCIPAL
+
+CLAVES_RECLAMO = ["Fecha y hora", "Nº Cliente"]  # primeras columnas de la hoja
+CLAVES_CLIENTE = ["Nº Cliente"]
+
+
+class Snapshot:
+    """Datos cargados de Google Sheets más sus agregados derivados"""
+
+    def __init__(self, df_reclamos, df_clientes, tramos_reclamos=None, tramos_clientes=None):
+        self.df_reclamos = df_reclamos
+        self.df_clientes = df_clientes
+        # [(sucursal, primera fila, fin)]: qué filas vienen de la planilla de cada sucursal
+        self.tramos_reclamos = tramos_reclamos or [(SUCURSAL_PRINCIPAL, 0, len(df_reclamos))]
+        self.tramos_clientes = tramos_clientes or [(SUCURSAL_PRINCIPAL, 0, len(df_clientes))]
+        self.fechas_reclamos = parsear_fechas(df_reclamos["Fecha y hora"]) if not df_reclamos.empty else None
+        self.stats = ClaimStats.desde_df(df_reclamos, self.fechas_reclamos)
+        self.cubo = ClaimsCube.desde_df(df_reclamos, self.fechas_reclamos)
+        self._version_base = calcular_version(df_reclamos, df_clientes)
+        self._parches = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        """Identifica el contenido actual (carga + parches aplicados)"""
+        return f"{self._version_base}.{self._parches}"
+
+    def _fila_agregados(self, df, idx):
+        return {
+            "Estado": df.at[idx, "Estado"],
+            "Técnico": df.at[idx, "Técnico"],
+            "Tipo de reclamo": df.at[idx, "Tipo de reclamo"],
+            "Sector": df.at[idx, "Sector"],
+            "fecha": self.fechas_reclamos.at[idx] if self.fechas_reclamos is not None else None,
+        }
+
+    def patch_reclamos(self, cambios):
+        """
+        Aplica cambios ya escritos en la hoja sin recargarla
+
+        Args:
+            cambios: dict {índice de fila: {columna: valor}}
+        """
+        with self._lock:
+            # Copia y reemplazo: las sesiones que leen el DataFrame o los conteos anteriores no ven estados a medias
+            df = self.df_reclamos.copy()
+            stats = self.stats.copia()
+            for idx, valores in cambios.items():
+                anterior = self._fila_agregados(df, idx)
+                for col, valor in valores.items():
+                    df.at[idx, col] = valor
+                nuevo = self._fila_agregados(df, idx)
+                stats.actualizar(anterior, nuevo)
+                self.cubo.actualizar(anterior, nuevo)
+            self.df_reclamos = df
+            self.stats = stats
+            self._parches += 1
+
+    def patch_clientes(self, cambios):
+        """Aplica cambios ya escritos en la hoja de clientes"""
+        with self._lock:
+            df = self.df_clientes.copy()
+            for idx, valores in cambios.items():
+                for col, valor in valores.items():
+                    df.at[idx, col] = valor
+            self.df_clientes = df
+            self._parches += 1
+
+
+def _cargar_sucursal(sucursal):
+    """
+    Lee las hojas de reclamos y clientes de la planilla de una sucursal
+
+    Corre en un hilo del pool (sin contexto de Streamlit): los errores se
+    lanzan y se informan en el hilo del script
+    """
+    sheet_reclamos, sheet_clientes = hojas_sucursal(sucursal)
+    try:
+        return leer_hoja(sheet_reclamos, COLUMNAS_RECLAMOS), leer_hoja(sheet_clientes, COLUMNAS_CLIENTES)
+    except Exception as e:
+        raise RuntimeError(f"{sucursal}: {e}" if len(SUCURSALES) > 1 else str(e)) from e
+
+
+def _federar(por_sucursal):
+    """Une los DataFrames de cada sucursal agregando la columna 'Sucursal' y sus tramos de filas"""
+    partes, tramos, inicio = [], [], 0
+    for sucursal, df in por_sucursal.items():
+        partes.append(df.assign(Sucursal=sucursal))
+        tramos.append((sucursal, inicio, inicio + len(df)))
+        inicio += len(df)
+    return pd.concat(partes, ignore_index=True), tramos
+
+
+def filas_de_cliente(df, sucursal, nro_cliente):
+    """Máscara de las filas de un cliente: el Nº Cliente solo es único dentro de su sucursal"""
+    return (df["Nº Cliente"] == nro_cliente) & (df["Sucursal"] == sucursal)
+
+
+@st.cache_resource(ttl=30, show_spinner="Cargando datos...")
+def cargar_datos():
+    """Carga el snapshot de Google Sheets (compartido entre sesiones)"""
+    try:
+        init_google_sheets()
+
+        # Cargar datos de las hojas (todas las sucursales en paralelo)
+        with medir("primera carga de datos", solo_primera=True):
+            with ThreadPoolExecutor(max_workers=len(SUCURSALES)) as pool:
+                cargados = dict(zip(SUCURSALES, pool.map(_cargar_sucursal, SUCURSALES)))
+
+        df_reclamos, tramos_reclamos = _federar({s: r for s, (r, _) in cargados.items()})
+        df_clientes, tramos_clientes = _federar({s: c for s, (_, c) in cargados.items()})
+        
+        if df_reclamos.empty or df_clientes.empty:
+            st.warning("⚠️ Algunas hojas están vacías")
+        
+        # Normalizar columnas clave
+        for col in ["Nº Cliente", "N° de Precinto"]:
+            df_clientes = safe_normalize(df_clientes, col)
+            df_reclamos = safe_normalize(df_reclamos, col)
+            
+        return Snapshot(df_reclamos, df_clientes, tramos_reclamos, tramos_clientes)
+        
+    except Exception as e:
+        # Sin snapshot parcial: faltarían filas (ej. clientes que se volverían a dar de alta).
+        # Nada queda en caché, la próxima ejecución reintenta
+        st.error(f"❌ Error al cargar datos: {str(e)}")
+        st.stop()
+        raise
+
+
+def _ubicar(tramos, idx):
+    """(sucursal, fila dentro de su hoja) de una fila del snapshot"""
+    for sucursal, inicio, fin in tramos:
+        if inicio <= idx < fin:
+            return sucursal, idx - inicio
+    raise KeyError(f"Fila {idx} fuera del snapshot")
+
+
+def _filas_sin_cambios(sheet, df, filas, claves, columnas):
+    """
+    Confirma que las filas de la hoja sigan siendo las del snapshot
+
+    Las escrituras van por posición: si la hoja se reordenó o se borraron
+    filas (ej. al archivar), la misma posición es otro registro
+
+    Args:
+        filas: {índice en df: fila de la hoja (base 1)}
+        claves: columnas iniciales que identifican el registro
+
+    Returns:
+        tuple: (coinciden, error)
+    """
+    ultima = letra_columna(columnas, claves[-1])
+    leidas, error = api_manager.safe_sheet_operation(
+        sheet.batch_get, [f"A{fila}:{ultima}{fila}" for fila in filas.values()]
+    )
+    if error:
+        return False, error
+    for idx, rango in zip(filas, leidas):
+        valores = (list(rango[0]) if rango else []) + [""] * len(claves)
+        esperados = [str(df.at[idx, c]).strip() for c in claves]
+        if [str(v).strip() for v in valores[:len(claves)]] != esperados:
+            return False, None
+    return True, None
+
+
+def _escribir_por_sucursal(df, cambios, columnas, tramos, hoja, claves):
+    """
+    Un batch_update por planilla de sucursal con los cambios {fila: {columna: valor}}
+
+    Antes de escribir se relee la clave de cada fila; si no coincide con el
+    snapshot, no se escribe esa sucursal y se descarta el snapshot
+
+    Returns:
+        tuple: (cambios aplicados, errores)
+    """
+    por_sucursal = {}
+    for idx, valores in cambios.items():
+        sucursal, fila = _ubicar(tramos, idx)
+        parte, filas, rangos = por_sucursal.setdefault(sucursal, ({}, {}, []))
+        parte[idx] = valores
+        filas[idx] = fila + 2  # +2: encabezado y base 1
+        rangos += [
+            {"range": f"{letra_columna(columnas, col)}{fila + 2}", "values": [[valor]]}
+            for col, valor in valores.items()
+        ]
+
+    aplicados, errores = {}, []
+    for sucursal, (parte, filas, rangos) in por_sucursal.items():
+        sheet = hojas_sucursal(sucursal)[hoja]
+        coinciden, error = _filas_sin_cambios(sheet, df, filas, claves, columnas)
+        if coinciden:
+            success, error = batch_update_sheet(sheet, rangos)
+        else:
+            success = False
+            if error is None:
+                error = "La hoja cambió desde la última carga. Se recargaron los datos: volvé a intentar."
+                cargar_datos.clear()
+        if success:
+            aplicados.update(parte)
+        else:
+            errores.append(f"{sucursal}: {error}" if len(SUCURSALES) > 1 else error)
+    return aplicados, errores
+
+
+def actualizar_reclamos(snapshot, cambios):
+    """
+    Escribe cambios de reclamos (un batch_update por sucursal) y parchea el snapshot
+
+    Returns:
+        tuple: (éxito, error)
+    """
+    aplicados, errores = _escribir_por_sucursal(
+        snapshot.df_reclamos, cambios, COLUMNAS_RECLAMOS, snapshot.tramos_reclamos, 0, CLAVES_RECLAMO
+    )
+    if aplicados:
+        snapshot.patch_reclamos(aplicados)
+    return not errores, "; ".join(errores) if errores else None
+
+
+def actualizar_clientes(snapshot, cambios):
+    """Escribe cambios de clientes en la planilla de su sucursal y parchea el snapshot"""
+    aplicados, errores = _escribir_por_sucursal(
+        snapshot.df_clientes, cambios, COLUMNAS_CLIENTES, snapshot.tramos_clientes, 1, CLAVES_CLIENTE
+    )
+    if aplicados:
+        snapshot.patch_clientes(aplicados)
+    return not errores, "; ".join(errores) if errores else None
+
+
+def agregar_reclamo(sucursal, fila):
+    """Agrega un reclamo al final de la hoja de reclamos de la sucursal"""
+    sheet_reclamos, _ = hojas_sucursal(sucursal)
+    return api_manager.safe_sheet_operation(sheet_reclamos.append_row, fila)
+
+
+def agregar_cliente(sucursal, fila):
+    """Agrega un cliente al final de la hoja de clientes de la sucursal"""
+    _, sheet_clientes = hojas_sucursal(sucursal)
+    return api_manager.safe_sheet_operation(sheet_clientes.append_row, fila)
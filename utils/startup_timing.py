@@ -0,0 +1,41 @@
+"""
+Registro de tiempos de arranque del proceso
+Cada etapa se imprime en el log (visible en cada deploy) y queda disponible
+para la vista de diagnóstico
+"""
+from contextlib import contextmanager
+import threading
+import time
+
+_tiempos = {}
+_lock = threading.Lock()
+
+
+def registrar(etapa, segundos, solo_primera=False):
+    """Guarda la duración de una etapa y la escribe en el log"""
+    with _lock:
+        if solo_primera and etapa in _tiempos:
+            return
+        _tiempos[etapa] = segundos
+    print(f"[arranque] {etapa}: {segundos * 1000:.0f} ms", flush=True)
+
+
+@contextmanager
+def medir(etapa, solo_primera=False):
+    """Mide la duración de un bloque: with medir("autenticación"): ..."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar(etapa, time.perf_counter() - inicio, solo_primera)
+
+
+def marcar_primera_pantalla(inicio_script):
+    """Registra (una sola vez por proceso) el tiempo del primer script hasta el dashboard"""
+    registrar("primera pantalla", time.perf_counter() - inicio_script, solo_primera=True)
+
+
+def reporte_arranque():
+    """Devuelve las etapas medidas en el orden en que se registraron"""
+    with _lock:
+        return dict(_tiempos)
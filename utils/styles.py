@@ -1,8 +1,19 @@
 """
 Estilos CSS centralizados para la aplicación con soporte de modo claro/oscuro
 """
+from functools import lru_cache
+import re
 
+
+def _minificar(css):
+    """Quita espacios y saltos de línea sobrantes (menos bytes por rerun)"""
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", css).strip()
+
+
+@lru_cache(maxsize=2)
 def get_main_styles(dark_mode=False):
+    """Hoja de estilos del tema (se arma una vez por tema y proceso)"""
     theme_vars = """
         --primary-color: #0d6efd;
         --primary-hover: #0b5ed7;
@@ -25,7 +36,7 @@ def get_main_styles(dark_mode=False):
         --bg-color: #1c1f23;
     """
     
-    return f"""
+    return _minificar(f"""
     <style>
     :root {{
         {theme_vars}
@@ -233,8 +244,55 @@ def get_main_styles(dark_mode=False):
         color: #155724;
         border: 1px solid #c3e6cb;
     }}
+
+    .grilla-metricas {{
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+        gap: 15px;
+        margin-bottom: 20px;
+    }}
+
+    .metric-container h3 {{ margin: 0; }}
+    .metric-container h1 {{ margin: 10px 0 0 0; font-size: 2.5rem; }}
+
+    .grilla-tipos {{
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 8px;
+        margin: -10px 0 10px 0;
+    }}
+
+    .tarjeta-tipo {{
+        text-align: center;
+        padding: 5px 4px;
+        border-radius: 8px;
+        background-color: var(--light-bg);
+        box-shadow: 0 1px 2px rgba(0,0,0,0.05);
+    }}
+
+    .tarjeta-tipo h5 {{ margin: 0; font-size: 0.70rem; color: #6c757d; }}
+    .tarjeta-tipo h4 {{ margin: 2px 0 0 0; color: #0d6efd; font-size: 1.2rem; }}
+    .tarjeta-tipo.alta h4 {{ color: #dc3545; font-size: 1.4rem; }}
+
+    .tarjeta-usuario {{
+        padding: 1rem;
+        border-radius: 10px;
+        margin: 0 0 1rem 0;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        display: flex;
+        align-items: center;
+        gap: 12px;
+    }}
+
+    .tarjeta-usuario span {{ font-size: 1.8rem; }}
+    .tarjeta-usuario h3 {{ margin: 0 !important; font-weight: 600; font-size: 1.1rem; color: inherit !important; }}
+    .tarjeta-usuario p {{ margin: 0; opacity: 0.9; font-size: 0.85rem; }}
+
+    @media (max-width: 768px) {{
+        .grilla-tipos {{ grid-template-columns: repeat(2, 1fr); }}
+    }}
     </style>
-    """
+    """)
 
 def get_loading_spinner():
     return """
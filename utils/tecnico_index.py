@@ -0,0 +1,67 @@
+"""
+Índice técnico → reclamos (relación muchos a muchos)
+Expande el campo 'Técnico' una vez por snapshot para búsquedas exactas
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+class TecnicoIndex:
+    """Posiciones de fila de los reclamos asignados a cada técnico"""
+
+    def __init__(self, df_reclamos):
+        self.total = len(df_reclamos)
+        self._estados = df_reclamos["Estado"].fillna("").to_numpy() if self.total else np.array([], dtype=object)
+
+        # Una fila por (reclamo, técnico): "JUAN, MAXI" -> JUAN / MAXI
+        tecnicos = df_reclamos["Técnico"].fillna("").astype(str).str.split(",")
+        explotado = tecnicos.explode().str.strip()
+        posiciones = np.arange(self.total).repeat(tecnicos.str.len().to_numpy()) if self.total else np.array([], dtype=int)
+        pares = pd.DataFrame({"tecnico": explotado.to_numpy(), "pos": posiciones})
+        pares = pares[pares["tecnico"] != ""]
+        pares["clave"] = pares["tecnico"].str.casefold()
+
+        self._posiciones = {
+            clave: grupo.to_numpy()
+            for clave, grupo in pares.groupby("clave")["pos"]
+        }
+        # Nombre a mostrar: la primera grafía encontrada, capitalizada
+        self._nombres = {
+            clave: nombre.capitalize()
+            for clave, nombre in pares.groupby("clave")["tecnico"].first().items()
+        }
+
+    def tecnicos(self, estado=None):
+        """Nombres de técnicos con reclamos (opcionalmente solo en un estado)"""
+        if estado is None:
+            claves = self._posiciones
+        else:
+            claves = [c for c, pos in self._posiciones.items() if (self._estados[pos] == estado).any()]
+        return sorted(self._nombres[c] for c in claves)
+
+    def mascara(self, tecnicos, estado=None):
+        """Máscara de reclamos asignados a cualquiera de los técnicos (coincidencia exacta)"""
+        resultado = np.zeros(self.total, dtype=bool)
+        for tecnico in tecnicos:
+            posiciones = self._posiciones.get(str(tecnico).strip().casefold())
+            if posiciones is not None:
+                resultado[posiciones] = True
+        if estado is not None:
+            resultado &= self._estados == estado
+        return resultado
+
+    def carga(self, estado=None):
+        """Cantidad de reclamos por técnico (opcionalmente filtrado por estado)"""
+        conteos = {}
+        for clave, posiciones in self._posiciones.items():
+            cantidad = len(posiciones) if estado is None else int((self._estados[posiciones] == estado).sum())
+            if cantidad:
+                conteos[self._nombres[clave]] = cantidad
+        return pd.Series(conteos, dtype=int).sort_values(ascending=False)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def obtener_indice_tecnicos(_df_reclamos, version):
+    """Devuelve el índice de técnicos de un snapshot (cacheado por versión)"""
+    return TecnicoIndex(_df_reclamos)
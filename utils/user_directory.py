@@ -0,0 +1,125 @@
+"""
+Directorio de usuarios para el login
+La hoja de usuarios se lee y normaliza una vez cada DIRECTORIO_USUARIOS_TTL
+segundos; cada intento de login es una búsqueda en un diccionario
+"""
+from collections import OrderedDict
+import hashlib
+import threading
+import time
+import streamlit as st
+from utils.data_manager import leer_hoja
+from config.settings import COLUMNAS_USUARIOS, PERMISOS_POR_ROL, DIRECTORIO_USUARIOS_TTL
+
+VALORES_ACTIVO = {"SI", "SÍ", "TRUE", "1", "VERDADERO"}
+
+# Ante un usuario desconocido se relee la hoja, como mucho con esta frecuencia
+RELECTURA_MINIMA_SEG = 60
+
+SESIONES_VERIFICADAS_MAX = 256
+REVALIDAR_SESION_SEG = 300
+
+
+def normalizar_usuario(username):
+    return str(username).strip().lower()
+
+
+class DirectorioUsuarios:
+    """username normalizado → registro del usuario"""
+
+    def __init__(self, df_usuarios):
+        self.cargado = time.monotonic()
+        self.usuarios = {}
+        for posicion, fila in enumerate(df_usuarios.fillna("").astype(str).to_dict("records")):
+            username = normalizar_usuario(fila["username"])
+            if not username:
+                continue
+            rol = fila["rol"].strip().lower()
+            self.usuarios[username] = {
+                "username": username,
+                "password": fila["password"].strip(),
+                "nombre": fila["nombre"],
+                "rol": rol,
+                "activo": fila["activo"].strip().upper() in VALORES_ACTIVO,
+                "permisos": PERMISOS_POR_ROL.get(rol, {}).get("permisos", []),
+                "fila": posicion + 2,  # fila de la hoja (encabezado y base 1)
+            }
+
+    def buscar(self, username):
+        return self.usuarios.get(normalizar_usuario(username))
+
+
+@st.cache_resource(ttl=DIRECTORIO_USUARIOS_TTL, show_spinner=False)
+def obtener_directorio(_sheet_usuarios):
+    """
+    Directorio compartido entre sesiones (se relee al vencer el TTL)
+
+    Un error de lectura se propaga y no queda en caché: un directorio vacío
+    rechazaría todos los logins y cerraría las sesiones hasta el próximo TTL
+    """
+    return DirectorioUsuarios(leer_hoja(_sheet_usuarios, COLUMNAS_USUARIOS))
+
+
+def invalidar_directorio():
+    """Descarta el directorio: llamar después de modificar la hoja de usuarios"""
+    obtener_directorio.clear()
+
+
+def buscar_usuario(sheet_usuarios, username):
+    """
+    Devuelve el registro del usuario o None
+
+    Un usuario desconocido provoca una relectura (a lo sumo una por minuto) para
+    que las altas recientes no esperen al vencimiento del TTL
+    """
+    directorio = obtener_directorio(sheet_usuarios)
+    usuario = directorio.buscar(username)
+    if usuario is None and time.monotonic() - directorio.cargado > RELECTURA_MINIMA_SEG:
+        invalidar_directorio()
+        usuario = obtener_directorio(sheet_usuarios).buscar(username)
+    return usuario
+
+
+def huella_password(almacenado):
+    """Identifica el valor guardado de la contraseña sin exponerlo en la sesión"""
+    return hashlib.sha256(str(almacenado).encode("utf-8")).hexdigest()[:16]
+
+
+class CacheSesiones:
+    """
+    LRU de sesiones ya verificadas: (usuario, token) → momento de la verificación
+
+    Mientras la entrada esté vigente un rerun no vuelve a consultar el directorio;
+    al vencer se revalida con una búsqueda (nunca con el hash lento)
+    """
+
+    def __init__(self, max_entradas=SESIONES_VERIFICADAS_MAX, vigencia=REVALIDAR_SESION_SEG):
+        self.max_entradas = max_entradas
+        self.vigencia = vigencia
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+
+    def registrar(self, username, token):
+        with self._lock:
+            self._entradas[(username, token)] = time.monotonic()
+            self._entradas.move_to_end((username, token))
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+
+    def vigente(self, username, token):
+        with self._lock:
+            verificada = self._entradas.get((username, token))
+            if verificada is None or time.monotonic() - verificada > self.vigencia:
+                return False
+            self._entradas.move_to_end((username, token))
+            return True
+
+    def quitar(self, username, token):
+        with self._lock:
+            self._entradas.pop((username, token), None)
+
+
+@st.cache_resource
+def obtener_cache_sesiones():
+    """Instancia única por proceso"""
+    return CacheSesiones()
@@ -0,0 +1,68 @@
+"""
+Precalentamiento de cachés al iniciar el servidor
+Conecta, carga el snapshot y construye índices y vistas derivadas antes de
+que llegue la primera sesión
+"""
+from datetime import datetime
+import importlib
+import threading
+import time
+import pytz
+from utils.startup_timing import medir
+
+ESPERA_MAXIMA_RUNTIME = 60  # segundos
+
+
+def precalentar():
+    """Llena las cachés de conexión, snapshot e índices derivados"""
+    from utils.sheets import conectar_sucursales
+    from utils.snapshot import cargar_datos
+    from utils.tecnico_index import obtener_indice_tecnicos
+    from utils.sla_analytics import resumen_sla
+    from utils.user_directory import obtener_directorio
+    from utils.claim_search import obtener_indice_reclamos
+    from utils.duplicate_clients import obtener_detector_duplicados
+    from components.navigation import SECCIONES
+    from config.settings import SUCURSAL_PRINCIPAL, WORKSHEET_USUARIOS
+
+    with medir("precalentamiento total"):
+        hojas = conectar_sucursales()[SUCURSAL_PRINCIPAL]
+        obtener_directorio(hojas[WORKSHEET_USUARIOS])
+        snapshot = cargar_datos()
+
+        # Módulos de sección: evita el costo de importación en el primer clic
+        for _, modulo in SECCIONES.values():
+            importlib.import_module(modulo)
+
+        from sections.reclamos_cargados import preparar_reclamos_cargados
+        preparar_reclamos_cargados(snapshot.df_reclamos, snapshot.df_clientes, snapshot.version)
+        obtener_indice_tecnicos(snapshot.df_reclamos, snapshot.version)
+        obtener_indice_reclamos().sincronizar(snapshot.df_reclamos, snapshot.version)
+        obtener_detector_duplicados(snapshot.df_clientes, snapshot.version)
+        snapshot.cubo.a_dataframe()
+
+        ahora = datetime.now(pytz.timezone("America/Argentina/Buenos_Aires")).replace(
+            tzinfo=None, minute=0, second=0, microsecond=0
+        )
+        resumen_sla(snapshot, snapshot.version, ahora)
+
+
+def _precalentar_cuando_inicie_runtime():
+    from streamlit.runtime import Runtime
+
+    # Las cachés de datos viven en el runtime: esperar a que el servidor lo cree
+    limite = time.monotonic() + ESPERA_MAXIMA_RUNTIME
+    while not Runtime.exists() and time.monotonic() < limite:
+        time.sleep(0.2)
+
+    try:
+        precalentar()
+    except Exception as e:
+        print(f"[arranque] Error en el precalentamiento: {e}", flush=True)
+
+
+def iniciar_precalentamiento():
+    """Lanza el precalentamiento en un hilo de fondo, independiente de las sesiones"""
+    hilo = threading.Thread(target=_precalentar_cuando_inicie_runtime, name="precalentamiento", daemon=True)
+    hilo.start()
+    return hilo